@@ -0,0 +1 @@
+# bench: 로컬 가짜 LLM 서버로 /api/interview/create, /api/interview/submit 처리량/지연 시간 측정
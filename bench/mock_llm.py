@@ -0,0 +1,261 @@
+# bench/mock_llm.py
+# OpenAI 호환 가짜 LLM 서버 (벤치마크 / 로컬 개발용)
+# - POST /v1/chat/completions 만 흉내 냅니다. (stream=true 도 지원)
+# - 응답 지연은 분포로 지정합니다.
+#     fixed:0.8            항상 0.8초
+#     uniform:0.2,1.5      0.2 ~ 1.5초
+#     normal:1.0,0.3       평균 1.0초, 표준편차 0.3초 (0 아래는 0)
+#     lognormal:0.0,0.5    exp(N(0.0, 0.5)) 초 (꼬리가 긴 실제 API 와 비슷)
+# - 응답 내용은 프롬프트를 보고 이 프로젝트의 형식(질문 생성 / 질문별 평가 / 총평 / 전체 평가 / 답변 분석)에
+#   맞춰 만들어 줍니다. --responses 로 "match" 문자열별 고정 응답을 덮어쓸 수 있습니다.
+#
+# 사용법:
+#   python -m bench.mock_llm --port 8900 --latency lognormal:0.0,0.4
+#   OPENAI_BASE_URL=http://127.0.0.1:8900/v1 python app_interview_basic2.py
+import argparse
+import json
+import random
+import re
+import threading
+import time
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+
+from interview.prompt_budget import count_tokens
+from interview.scoring import CRITERIA, WEIGHT_MAP
+
+
+# -------------------------
+# 지연 시간 분포
+# -------------------------
+def parse_latency(spec):
+    kind, _, args = spec.partition(":")
+    values = [float(v) for v in args.split(",") if v] if args else []
+    if kind == "fixed":
+        return lambda: values[0] if values else 0.0
+    if kind == "uniform":
+        return lambda: random.uniform(values[0], values[1])
+    if kind == "normal":
+        return lambda: max(0.0, random.gauss(values[0], values[1]))
+    if kind == "lognormal":
+        return lambda: random.lognormvariate(values[0], values[1])
+    raise ValueError(f"알 수 없는 지연 분포: {spec}")
+
+
+# -------------------------
+# 고정 응답 만들기
+# -------------------------
+_QUESTION_COUNT = re.compile(r"질문 (\d+)개")
+_QNA_LINE = re.compile(r"^Q\d+:", re.M)
+
+
+def _weights():
+    return {c: random.choice(list(WEIGHT_MAP)) for c in CRITERIA}
+
+
+def _weight_codes():
+    return [random.randrange(len(WEIGHT_MAP)) for _ in CRITERIA]
+
+
+def _scores():
+    return {c: random.randint(50, 95) for c in CRITERIA}
+
+
+def canned_content(prompt, overrides=()):
+    for rule in overrides:
+        if rule["match"] in prompt:
+            return rule["content"]
+
+    if "questionWeights" in prompt:
+        count = len(_QNA_LINE.findall(prompt)) or 1
+        return json.dumps({
+            "questionWeights": {str(i + 1): _weights() for i in range(count)},
+            "answerScores": {str(i + 1): _scores() for i in range(count)},
+            "analysisText": "전반적으로 직무 이해도가 높고 답변이 논리적입니다. 구체적인 수치가 조금 부족합니다. 태도는 좋습니다.",
+            "questions": [
+                {"id": i + 1, "goodPoints": ["경험을 구체적으로 설명함"], "improvementPoints": ["성과 수치 보완 필요"]}
+                for i in range(count)
+            ],
+        }, ensure_ascii=False)
+    # compact 평가 응답 (interview/evaluation.py, EVAL_WIRE=compact)
+    if '"q": [' in prompt:
+        count = len(_QNA_LINE.findall(prompt)) or 1
+        return json.dumps({
+            "q": [{"w": _weight_codes(), "s": list(_scores().values()),
+                   "g": ["경험을 구체적으로 설명함"], "i": ["성과 수치 보완 필요"]} for _ in range(count)],
+            "a": "전반적으로 직무 이해도가 높고 답변이 논리적입니다. 구체적인 수치가 조금 부족합니다. 태도는 좋습니다.",
+        }, ensure_ascii=False)
+    if '"w": [' in prompt:
+        return json.dumps({
+            "w": _weight_codes(), "s": list(_scores().values()), "g": ["핵심을 먼저 말함"], "i": ["예시가 더 필요함"],
+        }, ensure_ascii=False)
+    if '"weights"' in prompt:
+        return json.dumps({
+            "weights": _weights(), "scores": _scores(),
+            "goodPoints": ["핵심을 먼저 말함"], "improvementPoints": ["예시가 더 필요함"],
+        }, ensure_ascii=False)
+    if "totalScore" in prompt:
+        count = len(_QNA_LINE.findall(prompt)) or 1
+        return json.dumps({
+            "totalScore": random.randint(50, 95), "grade": "양호",
+            "radarScores": [random.randint(50, 95) for _ in range(5)],
+            "analysisText": "무난한 면접이었습니다.",
+            "questions": [{"id": i + 1, "goodPoints": ["좋음"], "improvementPoints": ["보완"]} for i in range(count)],
+        }, ensure_ascii=False)
+    if "job_fit" in prompt:
+        return json.dumps({
+            "scores": {"job_fit": 80, "logic": 75, "attitude": 90, "specificity": 70, "keywords": 65},
+            "strengths": ["논리적임"], "weaknesses": ["구체성 부족"],
+        }, ensure_ascii=False)
+    if "analysisText" in prompt:
+        return json.dumps({"analysisText": "강점은 문제 해결 경험, 약점은 수치 근거 부족입니다. 태도는 좋습니다."},
+                          ensure_ascii=False)
+
+    match = _QUESTION_COUNT.search(prompt)
+    count = int(match.group(1)) if match else 5
+    topics = ["자기소개", "지원 동기", "가장 어려웠던 프로젝트", "협업 갈등 해결", "기술 선택 이유",
+              "장애 대응 경험", "성능 개선 사례", "앞으로의 목표"]
+    return json.dumps({
+        "questions": [f"{random.choice(topics)}에 대해 말씀해 주세요. ({i + 1})" for i in range(count)]
+    }, ensure_ascii=False)
+
+
+# -------------------------
+# HTTP 서버
+# -------------------------
+class MockLLMHandler(BaseHTTPRequestHandler):
+    protocol_version = "HTTP/1.1"
+    server_version = "MockLLM/1.0"
+    # 헤더와 본문을 따로 쓰므로 Nagle 을 끄지 않으면 keep-alive 연결에서 요청마다 ~40ms 씩 밀립니다.
+    disable_nagle_algorithm = True
+
+    def log_message(self, format, *args):
+        pass
+
+    def _json(self, status, body):
+        payload = json.dumps(body, ensure_ascii=False).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(payload)))
+        self.end_headers()
+        self.wfile.write(payload)
+
+    def do_POST(self):
+        length = int(self.headers.get("Content-Length") or 0)
+        try:
+            body = json.loads(self.rfile.read(length) or b"{}")
+        except ValueError:
+            return self._json(400, {"error": {"message": "invalid json"}})
+
+        if not self.path.rstrip("/").endswith("/chat/completions"):
+            return self._json(404, {"error": {"message": "not found"}})
+
+        config = self.server.config
+        config["stats"]["requests"] += 1
+        time.sleep(config["latency"]())
+
+        if random.random() < config["error_rate"]:
+            config["stats"]["errors"] += 1
+            return self._json(500, {"error": {"message": "mock upstream error", "type": "server_error"}})
+
+        prompt = "\n".join(m.get("content") or "" for m in body.get("messages", []) if isinstance(m.get("content"), str))
+        content = canned_content(prompt, config["responses"])
+        model = body.get("model", "mock")
+        usage = {"prompt_tokens": count_tokens(prompt), "completion_tokens": count_tokens(content)}
+        usage["total_tokens"] = usage["prompt_tokens"] + usage["completion_tokens"]
+
+        if body.get("stream"):
+            include_usage = bool((body.get("stream_options") or {}).get("include_usage"))
+            return self._stream(model, content, config["chunk_size"], config["chunk_delay"],
+                                usage if include_usage else None)
+
+        self._json(200, {
+            "id": f"chatcmpl-mock-{config['stats']['requests']}",
+            "object": "chat.completion",
+            "created": int(time.time()),
+            "model": model,
+            "choices": [{"index": 0, "message": {"role": "assistant", "content": content}, "finish_reason": "stop"}],
+            "usage": usage,
+        })
+
+    def _stream(self, model, content, chunk_size, chunk_delay, usage=None):
+        self.send_response(200)
+        self.send_header("Content-Type", "text/event-stream")
+        self.send_header("Connection", "close")
+        self.end_headers()
+        self.close_connection = True
+
+        def send(delta, finish_reason=None, choices=True, extra=None):
+            chunk = {
+                "id": "chatcmpl-mock", "object": "chat.completion.chunk", "created": int(time.time()),
+                "model": model,
+                "choices": [{"index": 0, "delta": delta, "finish_reason": finish_reason}] if choices else [],
+                **(extra or {}),
+            }
+            self.wfile.write(f"data: {json.dumps(chunk, ensure_ascii=False)}\n\n".encode("utf-8"))
+            self.wfile.flush()
+
+        send({"role": "assistant", "content": ""})
+        for i in range(0, len(content), chunk_size):
+            send({"content": content[i:i + chunk_size]})
+            if chunk_delay:
+                time.sleep(chunk_delay)
+        send({}, "stop")
+        if usage is not None:
+            # stream_options.include_usage: choices 가 빈 마지막 조각에 usage
+            send(None, choices=False, extra={"usage": usage})
+        self.wfile.write(b"data: [DONE]\n\n")
+        self.wfile.flush()
+
+
+class MockLLMServer(ThreadingHTTPServer):
+    daemon_threads = True
+    # 기본 backlog(5)면 동시 연결이 많을 때 SYN 이 버려져서 가짜 서버 쪽이 병목이 됩니다.
+    request_queue_size = 1024
+
+
+def start_mock_server(host="127.0.0.1", port=0, latency="fixed:0", error_rate=0.0,
+                      chunk_size=8, chunk_delay=0.0, responses=()):
+    """백그라운드 스레드에서 서버를 띄우고 (server, base_url) 을 돌려줍니다."""
+    server = MockLLMServer((host, port), MockLLMHandler)
+    server.config = {
+        "latency": parse_latency(latency),
+        "error_rate": error_rate,
+        "chunk_size": chunk_size,
+        "chunk_delay": chunk_delay,
+        "responses": list(responses),
+        "stats": {"requests": 0, "errors": 0},
+    }
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://{host}:{server.server_address[1]}/v1"
+
+
+def load_responses(path):
+    # [{"match": "프롬프트에 들어있는 문자열", "content": "그대로 돌려줄 응답"}, ...]
+    with open(path, encoding="utf-8") as f:
+        return json.load(f)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="OpenAI 호환 가짜 LLM 서버")
+    parser.add_argument("--host", default="127.0.0.1")
+    parser.add_argument("--port", type=int, default=8900)
+    parser.add_argument("--latency", default="lognormal:-0.5,0.4", help="fixed:S | uniform:A,B | normal:M,SD | lognormal:MU,SIGMA")
+    parser.add_argument("--error-rate", type=float, default=0.0, help="500 을 돌려줄 비율 (0~1)")
+    parser.add_argument("--chunk-size", type=int, default=8, help="스트리밍 조각 하나의 글자 수")
+    parser.add_argument("--chunk-delay", type=float, default=0.01, help="스트리밍 조각 사이 대기(초)")
+    parser.add_argument("--responses", help="고정 응답 JSON 파일")
+    args = parser.parse_args(argv)
+
+    server, base_url = start_mock_server(
+        args.host, args.port, args.latency, args.error_rate, args.chunk_size, args.chunk_delay,
+        load_responses(args.responses) if args.responses else ()
+    )
+    print(f"[mock] {base_url} (latency={args.latency}, error_rate={args.error_rate})")
+    try:
+        threading.Event().wait()
+    except KeyboardInterrupt:
+        server.shutdown()
+
+
+if __name__ == "__main__":
+    main()
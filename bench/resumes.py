@@ -0,0 +1,122 @@
+# bench/resumes.py
+# 벤치마크용 가짜 이력서/자기소개서 (txt / pdf / docx, 크기별)
+# - small  : 1쪽 정도 (~1.5천 자)
+# - medium : 3~4쪽 (~6천 자)
+# - large  : 15쪽 이상 (~2만 5천 자, 프롬프트 예산/병렬 PDF 추출 경로를 타게 함)
+# PDF 는 외부 라이브러리 없이 기본 폰트(Helvetica)로 직접 만들기 때문에 본문이 영문입니다.
+import io
+import random
+
+SIZES = {"small": 1500, "medium": 6000, "large": 25000}
+FORMATS = ("txt", "pdf", "docx")
+
+_KO_SENTENCES = [
+    "대용량 트래픽을 처리하는 주문 서비스의 백엔드를 설계하고 운영했습니다.",
+    "Redis 캐시를 도입해 평균 응답 시간을 40% 줄였습니다.",
+    "Kafka 기반 이벤트 파이프라인으로 정산 배치를 실시간 처리로 바꿨습니다.",
+    "팀원들과 코드 리뷰 문화를 만들고 테스트 커버리지를 70%까지 올렸습니다.",
+    "장애 대응 당번을 맡아 원인 분석 보고서를 작성하고 재발 방지 대책을 세웠습니다.",
+    "사용자 인터뷰를 바탕으로 화면 흐름을 다시 설계해 이탈률을 낮췄습니다.",
+    "Docker 와 Kubernetes 로 배포 과정을 자동화해 배포 시간을 절반으로 줄였습니다.",
+    "데이터 분석 결과를 근거로 기능 우선순위를 정하고 이해관계자를 설득했습니다.",
+    "신입 개발자 온보딩 문서를 만들고 멘토 역할을 했습니다.",
+    "JPA N+1 문제를 찾아 쿼리 수를 줄이고 DB 부하를 낮췄습니다.",
+]
+_EN_SENTENCES = [
+    "Designed and operated the backend of a high traffic ordering service.",
+    "Introduced a Redis cache and cut average response time by 40 percent.",
+    "Moved settlement batches to a real time Kafka event pipeline.",
+    "Built a code review culture and raised test coverage to 70 percent.",
+    "Led incident response, wrote root cause reports and prevention plans.",
+    "Automated deployments with Docker and Kubernetes, halving release time.",
+    "Mentored new engineers and wrote the onboarding guide.",
+    "Fixed JPA N+1 queries and reduced database load.",
+]
+_SECTIONS = ["자기소개", "경력", "프로젝트", "기술 스택", "지원 동기"]
+
+
+def resume_text(size="small", seed=None, english=False):
+    rng = random.Random(seed)
+    target = SIZES[size]
+    sentences = _EN_SENTENCES if english else _KO_SENTENCES
+    sections = ["Summary", "Experience", "Projects", "Skills", "Motivation"] if english else _SECTIONS
+
+    parts = []
+    length = 0
+    while length < target:
+        title = rng.choice(sections)
+        paragraph = " ".join(rng.choice(sentences) for _ in range(rng.randint(3, 6)))
+        block = f"{title}\n{paragraph}"
+        parts.append(block)
+        length += len(block) + 2
+    # 캐시에 걸리지 않도록 파일마다 한 줄을 다르게 둡니다.
+    parts.append(f"ID {rng.getrandbits(48):012x}")
+    return "\n\n".join(parts)
+
+
+# -------------------------
+# 파일 형식별 생성
+# -------------------------
+def _pdf_escape(text):
+    return text.replace("\\", "\\\\").replace("(", "\\(").replace(")", "\\)")
+
+
+def make_pdf(text, lines_per_page=45, width=90):
+    # 줄을 나눠서 쪽마다 최대 lines_per_page 줄씩 넣은 최소한의 PDF
+    lines = []
+    for paragraph in text.split("\n"):
+        while len(paragraph) > width:
+            cut = paragraph.rfind(" ", 0, width)
+            cut = cut if cut > 0 else width
+            lines.append(paragraph[:cut])
+            paragraph = paragraph[cut:].lstrip()
+        lines.append(paragraph)
+    pages = [lines[i:i + lines_per_page] for i in range(0, len(lines), lines_per_page)] or [[""]]
+
+    objects = [None, "<< /Type /Catalog /Pages 2 0 R >>", None,
+               "<< /Type /Font /Subtype /Type1 /BaseFont /Helvetica >>"]
+    kids = []
+    for i, page_lines in enumerate(pages):
+        page_id, content_id = 4 + 2 * i, 5 + 2 * i
+        kids.append(f"{page_id} 0 R")
+        body = "BT /F1 10 Tf 14 TL 50 760 Td " + " ".join(f"({_pdf_escape(line)}) Tj T*" for line in page_lines) + " ET"
+        stream = body.encode("latin-1", "replace")
+        objects.append(f"<< /Type /Page /Parent 2 0 R /MediaBox [0 0 612 792] "
+                       f"/Resources << /Font << /F1 3 0 R >> >> /Contents {content_id} 0 R >>")
+        objects.append((f"<< /Length {len(stream)} >>\nstream\n".encode("latin-1") + stream + b"\nendstream"))
+    objects[2] = f"<< /Type /Pages /Kids [{' '.join(kids)}] /Count {len(pages)} >>"
+
+    out = io.BytesIO()
+    out.write(b"%PDF-1.4\n")
+    offsets = []
+    for number, obj in enumerate(objects[1:], start=1):
+        offsets.append(out.tell())
+        data = obj if isinstance(obj, bytes) else obj.encode("latin-1")
+        out.write(f"{number} 0 obj\n".encode("latin-1") + data + b"\nendobj\n")
+    xref = out.tell()
+    out.write(f"xref\n0 {len(objects)}\n0000000000 65535 f \n".encode("latin-1"))
+    for offset in offsets:
+        out.write(f"{offset:010d} 00000 n \n".encode("latin-1"))
+    out.write(f"trailer\n<< /Size {len(objects)} /Root 1 0 R >>\nstartxref\n{xref}\n%%EOF\n".encode("latin-1"))
+    return out.getvalue()
+
+
+def make_docx(text):
+    import docx
+
+    document = docx.Document()
+    for paragraph in text.split("\n"):
+        document.add_paragraph(paragraph)
+    out = io.BytesIO()
+    document.save(out)
+    return out.getvalue()
+
+
+def make_resume(fmt="txt", size="small", seed=None):
+    """(파일 이름, 바이트) 를 돌려줍니다."""
+    if fmt == "pdf":
+        return f"resume_{size}.pdf", make_pdf(resume_text(size, seed, english=True))
+    text = resume_text(size, seed)
+    if fmt == "docx":
+        return f"resume_{size}.docx", make_docx(text)
+    return f"resume_{size}.txt", text.encode("utf-8")
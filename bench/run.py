@@ -0,0 +1,290 @@
+# bench/run.py
+# /api/interview/create -> (answer) -> submit 시나리오 부하 측정
+# - 가짜 LLM 서버(bench/mock_llm.py)를 띄우고, 앱을 같은 프로세스에서 OPENAI_BASE_URL 만 바꿔 실행합니다.
+#   (--target 을 주면 이미 떠 있는 서버에 보냅니다. 그 서버의 OPENAI_BASE_URL 은 직접 맞춰 주세요.)
+# - 동시 사용자 수(--concurrency 1,4,16)를 바꿔 가며 단계별 p50 / p95 / p99 와 초당 처리량을 출력합니다.
+# - --json 으로 결과를 저장하고, 다음 실행에서 --baseline 으로 비교하면
+#   p95 가 --max-regression 비율 이상 나빠진 단계가 있을 때 종료 코드 1 로 끝납니다. (배포 전 CI 용)
+#
+# 사용법:
+#   python -m bench.run --app app_interview_basic2 --concurrency 1,4,16 --duration 20 \
+#       --latency lognormal:-0.5,0.4 --formats txt,pdf,docx --sizes small,large --json bench_result.json
+import argparse
+import importlib
+import json
+import logging
+import math
+import os
+import random
+import sys
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+
+import httpx
+
+from bench.mock_llm import start_mock_server
+from bench.resumes import FORMATS, SIZES, make_resume
+
+
+# -------------------------
+# 결과 집계
+# -------------------------
+def percentile(sorted_values, p):
+    if not sorted_values:
+        return None
+    # nearest-rank
+    index = min(len(sorted_values) - 1, max(0, math.ceil(p / 100 * len(sorted_values)) - 1))
+    return sorted_values[index]
+
+
+class Recorder:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self.samples = {}   # stage -> [초]
+        self.errors = {}    # stage -> 횟수
+
+    def record(self, stage, seconds, ok=True):
+        with self._lock:
+            if ok:
+                self.samples.setdefault(stage, []).append(seconds)
+            else:
+                self.errors[stage] = self.errors.get(stage, 0) + 1
+
+    def summary(self, elapsed):
+        rows = []
+        for stage in sorted(set(self.samples) | set(self.errors)):
+            values = sorted(self.samples.get(stage, []))
+            rows.append({
+                "stage": stage,
+                "count": len(values),
+                "errors": self.errors.get(stage, 0),
+                "rps": round(len(values) / elapsed, 2) if elapsed else 0.0,
+                "p50": _ms(percentile(values, 50)),
+                "p95": _ms(percentile(values, 95)),
+                "p99": _ms(percentile(values, 99)),
+            })
+        return rows
+
+
+def _ms(seconds):
+    return None if seconds is None else round(seconds * 1000, 1)
+
+
+# -------------------------
+# 시나리오 (가상 사용자 1명)
+# -------------------------
+class Scenario:
+    def __init__(self, base_url, resumes, stream=False, answers=False, questions_only=False):
+        self.base_url = base_url.rstrip("/")
+        self.resumes = resumes
+        self.stream = stream
+        self.answers = answers
+        self.questions_only = questions_only
+
+    def _timed(self, recorder, stage, fn):
+        started = time.perf_counter()
+        try:
+            result = fn()
+        except Exception:
+            recorder.record(stage, time.perf_counter() - started, ok=False)
+            return None
+        recorder.record(stage, time.perf_counter() - started)
+        return result
+
+    def _create(self, http, recorder):
+        fmt, size, filename, data = random.choice(self.resumes)
+        form = {"job_title": random.choice(["백엔드 개발자", "프론트엔드 개발자", "데이터 분석가", "PM"]),
+                "experience_level": random.choice(["신입", "경력"])}
+        files = {"resume_file": (filename, data)}
+
+        if not self.stream:
+            resp = http.post(f"{self.base_url}/api/interview/create", data=form, files=files)
+            resp.raise_for_status()
+            return resp.json()
+
+        # 스트리밍: 첫 질문까지 걸린 시간도 따로 기록합니다.
+        started = time.perf_counter()
+        first = None
+        done = None
+        with http.stream("POST", f"{self.base_url}/api/interview/create", data=form, files=files,
+                         headers={"Accept": "text/event-stream"}) as resp:
+            resp.raise_for_status()
+            event = None
+            for line in resp.iter_lines():
+                if line.startswith("event:"):
+                    event = line[6:].strip()
+                elif line.startswith("data:"):
+                    if event == "question" and first is None:
+                        first = time.perf_counter() - started
+                    elif event == "done":
+                        done = json.loads(line[5:])
+                    elif event == "error":
+                        raise RuntimeError(line[5:])
+        if first is not None:
+            recorder.record("create.first_question", first)
+        if done is None:
+            raise RuntimeError("done 이벤트 없음")
+        return done
+
+    def run_once(self, http, recorder):
+        started = time.perf_counter()
+        created = self._timed(recorder, "create", lambda: self._create(http, recorder))
+        if created is None or self.questions_only:
+            return
+
+        interview_id = created["interviewId"]
+        answers = [f"{q[:20]} 에 대한 답변입니다. 경험 {random.randint(1, 10**6)} 을 예로 들면 ..."
+                   for q in created["questions"]]
+
+        if self.answers:
+            for index, answer in enumerate(answers):
+                self._timed(recorder, "answer", lambda: http.post(
+                    f"{self.base_url}/api/interview/answer",
+                    json={"interviewId": interview_id, "index": index, "answer": answer}
+                ).raise_for_status())
+
+        def submit():
+            resp = http.post(f"{self.base_url}/api/interview/submit",
+                             json={"interviewId": interview_id, "answers": answers})
+            resp.raise_for_status()
+            return resp.json()
+
+        if self._timed(recorder, "submit", submit) is not None:
+            recorder.record("scenario", time.perf_counter() - started)
+
+
+def run_level(scenario, concurrency, duration, timeout):
+    recorder = Recorder()
+    deadline = time.perf_counter() + duration
+
+    def worker():
+        with httpx.Client(timeout=timeout) as http:
+            while time.perf_counter() < deadline:
+                scenario.run_once(http, recorder)
+
+    started = time.perf_counter()
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        for future in [pool.submit(worker) for _ in range(concurrency)]:
+            future.result()
+    return recorder.summary(time.perf_counter() - started)
+
+
+# -------------------------
+# 앱을 같은 프로세스에서 띄우기
+# -------------------------
+def start_app(module_name, llm_base_url, workdir):
+    os.environ["OPENAI_BASE_URL"] = llm_base_url
+    os.environ.setdefault("OPENAI_API_KEY", "bench")
+    os.environ.setdefault("SESSION_DB", os.path.join(workdir, "sessions.db"))
+    os.environ.setdefault("QUESTION_BANK_PATH", os.path.join(workdir, "question_bank.json"))
+    # 모든 가상 사용자가 127.0.0.1 하나로 보이므로 클라이언트별 제한은 끕니다. (전체 / 동시 처리 제한은 그대로)
+    for lane in ("SUBMIT", "ANSWER", "CREATE"):
+        os.environ.setdefault(f"ADMISSION_CLIENT_RPM_{lane}", "0")
+
+    from werkzeug.serving import make_server
+
+    module = importlib.import_module(module_name)
+    server = make_server("127.0.0.1", 0, module.app, threaded=True)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    return server, f"http://127.0.0.1:{server.server_port}"
+
+
+# -------------------------
+# 출력 / 기준 비교
+# -------------------------
+def print_table(results, out=sys.stdout):
+    print(f"{'conc':>4} {'stage':<22} {'count':>6} {'err':>4} {'rps':>8} {'p50':>9} {'p95':>9} {'p99':>9}  (ms)",
+          file=out)
+    for level in results:
+        for row in level["stages"]:
+            print(f"{level['concurrency']:>4} {row['stage']:<22} {row['count']:>6} {row['errors']:>4} "
+                  f"{row['rps']:>8} {row['p50'] or '-':>9} {row['p95'] or '-':>9} {row['p99'] or '-':>9}", file=out)
+
+
+def compare(results, baseline, max_regression):
+    # 같은 (동시 사용자 수, 단계) 의 p95 가 기준보다 max_regression 넘게 느려졌는지
+    old = {(level["concurrency"], row["stage"]): row
+           for level in baseline["results"] for row in level["stages"]}
+    regressions = []
+    for level in results:
+        for row in level["stages"]:
+            before = old.get((level["concurrency"], row["stage"]))
+            if not before or not before["p95"] or row["p95"] is None:
+                continue
+            if row["p95"] > before["p95"] * (1 + max_regression):
+                regressions.append(f"conc={level['concurrency']} {row['stage']}: p95 {before['p95']} -> {row['p95']} ms")
+    return regressions
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="면접 API 부하 측정")
+    parser.add_argument("--app", default="app_interview_basic2", help="같은 프로세스에서 띄울 앱 모듈")
+    parser.add_argument("--target", help="이미 떠 있는 서버 주소 (주면 --app 무시)")
+    parser.add_argument("--concurrency", default="1,4,16", help="쉼표로 구분한 동시 사용자 수")
+    parser.add_argument("--duration", type=float, default=15, help="동시 사용자 수마다 측정 시간(초)")
+    parser.add_argument("--formats", default=",".join(FORMATS))
+    parser.add_argument("--sizes", default="small,medium")
+    parser.add_argument("--resumes", type=int, default=8, help="형식/크기 조합마다 만들 이력서 수")
+    parser.add_argument("--stream", action="store_true", help="질문 생성을 SSE 로 받고 첫 질문 시간도 측정")
+    parser.add_argument("--answers", action="store_true", help="답변마다 /api/interview/answer 호출 (basic2)")
+    parser.add_argument("--questions-only", action="store_true", help="create 만 측정")
+    parser.add_argument("--timeout", type=float, default=120)
+    parser.add_argument("--latency", default="lognormal:-0.5,0.4", help="가짜 LLM 지연 분포")
+    parser.add_argument("--error-rate", type=float, default=0.0)
+    parser.add_argument("--chunk-delay", type=float, default=0.01)
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--baseline", help="비교할 이전 결과 JSON")
+    parser.add_argument("--max-regression", type=float, default=0.2, help="허용하는 p95 악화 비율 (기본 20%%)")
+    args = parser.parse_args(argv)
+
+    logging.getLogger("werkzeug").setLevel(logging.ERROR)
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    formats = [f for f in args.formats.split(",") if f]
+    sizes = [s for s in args.sizes.split(",") if s]
+    for size in sizes:
+        if size not in SIZES:
+            parser.error(f"알 수 없는 크기: {size}")
+
+    resumes = [(fmt, size, *make_resume(fmt, size, seed=i * 1000 + n))
+               for i, (fmt, size) in enumerate((f, s) for f in formats for s in sizes)
+               for n in range(args.resumes)]
+
+    if args.target:
+        base_url = args.target
+        mock = None
+    else:
+        mock, llm_url = start_mock_server(latency=args.latency, error_rate=args.error_rate,
+                                          chunk_delay=args.chunk_delay)
+        workdir = tempfile.mkdtemp(prefix="interview-bench-")
+        _, base_url = start_app(args.app, llm_url, workdir)
+        print(f"[bench] app={args.app} {base_url}  mock LLM={llm_url} latency={args.latency}", file=sys.stderr)
+
+    scenario = Scenario(base_url, resumes, args.stream, args.answers, args.questions_only)
+    results = []
+    for concurrency in [int(c) for c in args.concurrency.split(",") if c]:
+        print(f"[bench] concurrency={concurrency} ({args.duration:.0f}s)", file=sys.stderr)
+        results.append({"concurrency": concurrency, "stages": run_level(scenario, concurrency, args.duration, args.timeout)})
+
+    print_table(results)
+    report = {
+        "config": {k: v for k, v in vars(args).items() if k not in ("json", "baseline")},
+        "llmRequests": mock.config["stats"] if mock else None,
+        "results": results,
+    }
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(report, f, ensure_ascii=False, indent=2)
+
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as f:
+            regressions = compare(results, json.load(f), args.max_regression)
+        for line in regressions:
+            print(f"[bench] 성능 저하: {line}", file=sys.stderr)
+        if regressions:
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,131 @@
+# bench/startup.py
+# 콜드 스타트 측정 (앱 import 시간 / 첫 요청 / 두 번째 요청)
+# - 앱마다 새 파이썬 프로세스를 --repeat 번 띄워서 잽니다. (모듈 캐시 없이 컨테이너가 처음 뜰 때와 같은 상태)
+#     process  : 인터프리터 시작 ~ 앱 import 끝 (부모 프로세스 기준)
+#     import   : 앱 모듈 import (Flask 앱 생성 포함)
+#     first    : 첫 요청 (PDF 이력서 업로드 + 질문 생성, 처음 쓰는 라이브러리 / LLM 클라이언트 준비 포함)
+#     second   : 같은 요청을 한 번 더 (준비가 끝난 뒤의 평소 시간)
+# - LLM 은 가짜 서버(bench/mock_llm.py, 지연 0)라서 first - second 가 거의 준비 비용입니다.
+# - import 직후 이미 올라와 있는 무거운 모듈(openai / PyPDF2 / docx / numpy)도 같이 출력합니다.
+#
+# 사용법:
+#   python -m bench.startup --apps app_interview_basic,app_interview_basic2,env.app --repeat 5 [--json startup.json]
+import argparse
+import importlib
+import io
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+
+from bench.resumes import make_resume
+
+HEAVY_MODULES = ("openai", "httpx", "PyPDF2", "docx", "numpy")
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+# -------------------------
+# 자식 프로세스 (앱 하나를 한 번 띄움)
+# -------------------------
+def _first_request(app):
+    # 질문 생성 API 가 있으면 PDF 이력서와 함께, 없으면(env/app.py) 예전 질문 생성 API
+    client = app.test_client()
+    rules = {rule.rule for rule in app.url_map.iter_rules()}
+    if "/api/interview/create" in rules:
+        filename, data = make_resume("pdf", "small", seed=1)
+
+        def call():
+            return client.post("/api/interview/create", data={
+                "job_title": "백엔드 개발자", "experience_level": "신입", "question_source": "llm",
+                "resume_file": (io.BytesIO(data), filename),
+            }, content_type="multipart/form-data")
+    else:
+        def call():
+            return client.post("/generate_questions", json={"job_position": "백엔드 개발자"})
+    return call
+
+
+def child(target):
+    started = time.perf_counter()
+    module_name, _, attr = target.partition(":")
+    app = getattr(importlib.import_module(module_name), attr or "app")
+    imported = time.perf_counter()
+    loaded = [name for name in HEAVY_MODULES if name in sys.modules]
+
+    call = _first_request(app)
+    timings = {}
+    for name in ("first", "second"):
+        began = time.perf_counter()
+        resp = call()
+        timings[name] = (time.perf_counter() - began) * 1000
+        if resp.status_code != 200:
+            raise SystemExit(f"{target}: {name} 요청 실패 {resp.status_code} {resp.get_data(as_text=True)[:200]}")
+
+    print(json.dumps({"import": (imported - started) * 1000, **timings, "loaded": loaded}))
+
+
+# -------------------------
+# 부모 프로세스
+# -------------------------
+def measure(target, llm_url, workdir, repeat):
+    # 세션 DB 는 실행마다 새로 만들고 single-flight 는 프로세스 안에서만 합칩니다.
+    # (앞선 실행 / 다른 앱이 남긴 결과 행을 받아 LLM 호출 없이 끝나면 시간이 잘못 나옴)
+    env = {**os.environ, "OPENAI_BASE_URL": llm_url, "OPENAI_API_KEY": os.getenv("OPENAI_API_KEY", "bench"),
+           "SINGLEFLIGHT_DB": "off",
+           "QUESTION_BANK_PATH": os.path.join(workdir, "question_bank.json"),
+           "LOG_LEVEL": "WARNING"}
+    runs = []
+    for _ in range(repeat):
+        env["SESSION_DB"] = os.path.join(tempfile.mkdtemp(dir=workdir), "sessions.db")
+        began = time.perf_counter()
+        out = subprocess.run([sys.executable, "-m", "bench.startup", "--child", target], cwd=ROOT, env=env,
+                             capture_output=True, text=True)
+        total = (time.perf_counter() - began) * 1000
+        if out.returncode != 0:
+            raise SystemExit(out.stderr.strip() or out.stdout.strip())
+        result = json.loads(out.stdout.strip().splitlines()[-1])
+        # 요청 두 번을 뺀 나머지 = 인터프리터 시작 + import
+        result["process"] = total - result["first"] - result["second"]
+        runs.append(result)
+
+    row = {"app": target, "loaded": runs[-1]["loaded"]}
+    for key in ("process", "import", "first", "second"):
+        row[key] = round(statistics.median(run[key] for run in runs), 1)
+    return row
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="앱 콜드 스타트 측정")
+    parser.add_argument("--apps", default="app_interview_basic,app_interview_basic2,env.app",
+                        help="쉼표로 구분한 앱 모듈 (module 또는 module:attr)")
+    parser.add_argument("--repeat", type=int, default=5, help="앱마다 프로세스를 띄우는 횟수 (중앙값 출력)")
+    parser.add_argument("--json", help="결과를 저장할 JSON 파일")
+    parser.add_argument("--child", help=argparse.SUPPRESS)
+    args = parser.parse_args(argv)
+
+    if args.child:
+        child(args.child)
+        return
+
+    # 자식 프로세스의 import 시간에 섞이지 않도록 가짜 LLM 서버는 부모에서만 import 합니다.
+    from bench.mock_llm import start_mock_server
+
+    mock, llm_url = start_mock_server(latency="fixed:0", chunk_delay=0)
+    workdir = tempfile.mkdtemp(prefix="interview-startup-")
+    rows = [measure(target, llm_url, workdir, args.repeat) for target in args.apps.split(",") if target]
+
+    print(f"{'app':<24} {'process':>9} {'import':>9} {'first':>9} {'second':>9}  (ms, 중앙값)  import 직후 로드됨")
+    for row in rows:
+        print(f"{row['app']:<24} {row['process']:>9} {row['import']:>9} {row['first']:>9} {row['second']:>9}  "
+              f"{','.join(row['loaded']) or '-'}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump({"repeat": args.repeat, "results": rows}, f, ensure_ascii=False, indent=2)
+    mock.shutdown()
+
+
+if __name__ == "__main__":
+    main()
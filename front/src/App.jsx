@@ -12,6 +12,7 @@ function App() {
       <Route path="/" element={<InterviewSetup />} />
       <Route path="/interview/:interviewId" element={<Interview />} />
       <Route path="/result" element={<Result />} />
+      <Route path="/result/:interviewId" element={<Result />} />
     </Routes>
   );
 }
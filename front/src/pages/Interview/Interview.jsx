@@ -1,6 +1,6 @@
 import React, { useState } from 'react';
 import { Link, useLocation, useNavigate, useParams } from 'react-router-dom';
-import { submitInterview } from '../../services/InterviewService';
+import { evaluateAnswer, submitInterview } from '../../services/InterviewService';
 import './Interview.css';
 
 const Interview = () => {
@@ -45,6 +45,11 @@ const Interview = () => {
 
   const handleNext = async () => {
     if (currentIndex < questions.length - 1) {
+      const answer = (answers[currentIndex] || "").trim();
+      if (answer) {
+        // 기다리지 않고 백그라운드에서 평가 시작
+        evaluateAnswer(interviewId, currentIndex, answer);
+      }
       setCurrentIndex(currentIndex + 1);
     } else {
       if (window.confirm("모든 답변을 제출하시겠습니까?")) {
@@ -52,14 +57,12 @@ const Interview = () => {
         setIsSubmitting(true); 
 
         try {
-          const qnaList = questions.map((q, index) => ({
-            question: q.title,
-            answer: answers[index] || "" 
-          }));
+          const answerList = questions.map((q, index) => answers[index] || "");
 
-          const resultData = await submitInterview(interviewId, qnaList);
+          const resultData = await submitInterview(interviewId, answerList);
 
-          navigate('/result', { 
+          // 주소에 interviewId 를 넣어 두면 새로 고침 / 공유해도 저장된 결과를 다시 불러옵니다.
+          navigate(`/result/${interviewId}`, { 
             state: { resultData: resultData } 
           });
           
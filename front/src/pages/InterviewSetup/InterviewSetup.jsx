@@ -6,6 +6,7 @@ import { startInterview } from '../../services/InterviewService.js';
 function InterviewSetup() {
     const navigate = useNavigate();
     const [isLoading, setIsLoading] = useState(false);
+    const [streamedQuestions, setStreamedQuestions] = useState([]);
     
     const [resumeFile, setResumeFile] = useState(null);
 
@@ -18,6 +19,7 @@ function InterviewSetup() {
     const handleSubmit = async (event) => {
         event.preventDefault();
         setIsLoading(true);
+        setStreamedQuestions([]);
     
         const formData = new FormData(event.target);
         if (resumeFile) {
@@ -28,7 +30,9 @@ function InterviewSetup() {
         const experienceLevel = formData.get('experience_level');
 
         try {
-            const result = await startInterview(formData); 
+            const result = await startInterview(formData, (question) => {
+                setStreamedQuestions((prev) => [...prev, question]);
+            });
             console.log('API 응답 성공:', result);
 
             const generatedQuestions = result.questions.map((qText, index) => ({
@@ -77,6 +81,9 @@ function InterviewSetup() {
                     <div className="loading-container" style={{ textAlign: 'center', padding: '100px' }}>
                         <h1>면접 준비 중...</h1>
                         <p>AI 면접관이 질문을 생성하고 있습니다. 잠시만 기다려주세요.</p>
+                        {streamedQuestions.length > 0 && (
+                            <p>질문 {streamedQuestions.length}개 준비 완료</p>
+                        )}
                     </div>
                 ) : (
                     <div className="form-container">
@@ -1,5 +1,5 @@
 import React, { useState, useEffect, useRef } from 'react';
-import { Link, useLocation, useNavigate } from 'react-router-dom';
+import { Link, useLocation, useNavigate, useParams } from 'react-router-dom';
 import {
   Chart as ChartJS,
   RadialLinearScale,
@@ -10,6 +10,7 @@ import {
   Legend,
 } from 'chart.js';
 import { Radar } from 'react-chartjs-2';
+import { getInterviewResult } from '../../services/InterviewService';
 import './Result.css';
 
 ChartJS.register(
@@ -24,6 +25,7 @@ ChartJS.register(
 const Result = () => {
   const location = useLocation();
   const navigate = useNavigate();
+  const { interviewId } = useParams();
   const [resultData, setResultData] = useState(null);
   const [expandedItems, setExpandedItems] = useState({});
   const [scrollState, setScrollState] = useState({
@@ -36,11 +38,32 @@ const Result = () => {
   useEffect(() => {
     if (location.state && location.state.resultData) {
         setResultData(location.state.resultData);
-    } else {
+        return;
+    }
+
+    const goHome = () => {
         alert("결과 데이터가 없습니다. 면접을 먼저 진행해주세요.");
         navigate('/');
+    };
+    if (!interviewId) {
+        goHome();
+        return;
     }
-  }, [location, navigate]);
+
+    // 새로 고침 / 공유 링크: 서버에 저장된 성적표를 불러옵니다.
+    let cancelled = false;
+    getInterviewResult(interviewId)
+        .then((data) => {
+            if (cancelled) return;
+            if (data) setResultData(data);
+            else goHome();
+        })
+        .catch((error) => {
+            console.error(error);
+            if (!cancelled) goHome();
+        });
+    return () => { cancelled = true; };
+  }, [location, navigate, interviewId]);
 
   useEffect(() => {
     const handleScroll = () => {
@@ -1,8 +1,35 @@
-export const startInterview = async (formData) => {
+const readEventStream = async (response, onEvent) => {
+    const reader = response.body.getReader();
+    const decoder = new TextDecoder();
+    let buffer = '';
+
+    while (true) {
+        const { value, done } = await reader.read();
+        if (done) break;
+        buffer += decoder.decode(value, { stream: true });
+
+        let boundary;
+        while ((boundary = buffer.indexOf('\n\n')) !== -1) {
+            const block = buffer.slice(0, boundary);
+            buffer = buffer.slice(boundary + 2);
+
+            let event = 'message';
+            let data = '';
+            for (const line of block.split('\n')) {
+                if (line.startsWith('event:')) event = line.slice(6).trim();
+                else if (line.startsWith('data:')) data += line.slice(5).trim();
+            }
+            if (data) onEvent(event, JSON.parse(data));
+        }
+    }
+};
+
+export const startInterview = async (formData, onQuestion) => {
     const API_URL = '/api/interview/create'; 
 
     const response = await fetch(API_URL, {
         method: 'POST',
+        headers: onQuestion ? { Accept: 'text/event-stream' } : undefined,
         body: formData 
     });
     
@@ -11,21 +38,98 @@ export const startInterview = async (formData) => {
         throw new Error(errorData.message || `서버 응답 오류: ${response.status}`);
     }
 
+    if (!onQuestion) {
+        return response.json();
+    }
+
+    // 스트리밍 모드: 질문이 도착할 때마다 onQuestion 호출, 마지막 done 이벤트 결과를 반환
+    let result = null;
+    let streamError = null;
+    await readEventStream(response, (event, data) => {
+        if (event === 'question') onQuestion(data.question, data.index);
+        else if (event === 'done') result = data;
+        else if (event === 'error') streamError = data.error;
+    });
+
+    if (!result) {
+        throw new Error(streamError || '질문 생성 스트림이 중간에 끊어졌습니다.');
+    }
+    return result;
+};
+
+// 다음 질문으로 넘어갈 때 방금 답변을 서버에서 미리 평가하도록 보냅니다. (질문은 서버 세션의 index 번째 질문)
+// 결과는 기다리지 않고, 실패해도 최종 제출 때 다시 평가되므로 무시합니다.
+export const evaluateAnswer = async (interviewId, index, answer) => {
+    const API_URL = '/api/interview/answer';
+
+    try {
+        await fetch(API_URL, {
+            method: 'POST',
+            headers: { 'Content-Type': 'application/json' },
+            body: JSON.stringify({ interviewId, index, answer })
+        });
+    } catch (error) {
+        console.warn('답변 미리 평가 요청 실패:', error);
+    }
+};
+
+const sleep = (ms) => new Promise((resolve) => setTimeout(resolve, ms));
+
+// 202 Accepted 로 받은 평가 작업이 끝날 때까지 상태를 확인합니다.
+const waitForJob = async (jobUrl, { interval = 1000, timeout = 180000 } = {}) => {
+    const startedAt = Date.now();
+
+    while (Date.now() - startedAt < timeout) {
+        const response = await fetch(jobUrl);
+        if (!response.ok) {
+            throw new Error('제출 실패');
+        }
+
+        const job = await response.json();
+        if (job.status === 'done') return job.result;
+        if (job.status === 'error') throw new Error(job.error || '제출 실패');
+
+        await sleep(interval);
+    }
+    throw new Error('평가 시간이 초과되었습니다.');
+};
+
+// 제출 때 저장된 성적표를 다시 불러옵니다. (평가를 다시 하지 않음, 없으면 null)
+// 브라우저가 ETag 로 다시 확인하므로 바뀌지 않았으면 본문 없이 304 로 끝납니다.
+export const getInterviewResult = async (interviewId) => {
+    const response = await fetch(`/api/interview/${encodeURIComponent(interviewId)}/result`);
+
+    if (response.status === 404) {
+        return null;
+    }
+    if (!response.ok) {
+        throw new Error(`서버 응답 오류: ${response.status}`);
+    }
     return response.json();
 };
 
-export const submitInterview = async (interviewId, qnaList) => {
+// 질문은 서버 세션에 저장되어 있으므로 interviewId 와 답변 목록만 보냅니다.
+export const submitInterview = async (interviewId, answers) => {
     const API_URL = '/api/interview/submit';
 
     const response = await fetch(API_URL, {
         method: 'POST',
-        headers: { 'Content-Type': 'application/json' },
-        body: JSON.stringify({ interviewId, qnaList })
+        headers: {
+            'Content-Type': 'application/json',
+            // 서버가 지원하면 바로 작업 ID 를 받고(202), 결과는 따로 확인합니다.
+            Prefer: 'respond-async'
+        },
+        body: JSON.stringify({ interviewId, answers })
     });
 
     if (!response.ok) {
         throw new Error('제출 실패');
     }
 
+    if (response.status === 202) {
+        const { jobId } = await response.json();
+        return waitForJob(response.headers.get('Location') || `/api/interview/jobs/${jobId}`);
+    }
+
     return response.json();
-};
\ No newline at end of file
+};
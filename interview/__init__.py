@@ -0,0 +1,3 @@
+# interview 패키지
+# 여러 앱 파일(app_interview_basic.py, app_interview_basic2.py, env/app.py)이
+# 함께 쓰는 공용 코드를 모아둔 곳입니다.
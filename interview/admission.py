@@ -0,0 +1,309 @@
+# interview/admission.py
+# LLM 호출의 입장 제어 (admission control)
+# - create 요청이 몰려서 LLM 사용량(쿼터)을 다 쓰면, 면접을 끝내고 제출하는 지원자가 429 를 받게 됩니다.
+# - 레인(lane): 호출을 submit / answer / create 로 나누고, 이 순서로 우선합니다.
+#     1) 클라이언트별 토큰 버킷 (레인마다 분당 요청 수 / 버스트) - HTTP 요청마다 한 번, 핸들러에 들어가기 전에
+#        클라이언트는 접속 IP 로 구분합니다. 리버스 프록시 뒤라면 ADMISSION_TRUSTED_PROXIES 로 프록시 수를 알려주면
+#        X-Forwarded-For 에서 그만큼 오른쪽(프록시가 붙인 값)만 믿고 읽습니다. 클라이언트가 보낸 헤더는 믿지 않습니다.
+#        다 쓰면 기다리지 않고 바로 429 + Retry-After (다음 토큰이 생기는 시간)
+#     2) 전체 토큰 버킷 (모든 클라이언트 합계 분당 호출 수, 업스트림 쿼터 보호) - LLM 호출마다
+#     3) 동시 호출 수 (ADMISSION_MAX_CONCURRENT). create 는 ADMISSION_RESERVED 자리를 남겨 두고 씁니다. - LLM 호출마다
+#   2), 3) 은 라우터(interview/router.py)가 LLM 을 부르기 직전에 얻고, 응답을 받으면(스트림은 끝나면) 돌려줍니다.
+#   그래서 비동기 제출(202) 작업, 질문별 병렬 평가, 답변별 미리 평가처럼 요청 밖에서 부르는 호출도 같이 막힙니다.
+#   막히면 레인별 대기열에서 정해진 시간만큼 기다립니다. 자리가 나면 우선순위가 높은 레인부터 들어갑니다.
+#   대기열이 가득 찼거나 기다리다 시간이 지나면 Rejected -> 핸들러가 503 + Retry-After.
+import math
+import os
+import threading
+import time
+from collections import OrderedDict
+from itertools import count
+
+from flask import jsonify, request
+
+from interview.telemetry import Counter, registry
+
+ADMISSION = registry.register(Counter(
+    "interview_admission_total", "Admission decisions by lane (admitted / queued / client_limited / rejected)",
+    ("lane", "outcome")))
+
+# Flask 뷰 이름 -> 레인 (클라이언트별 버킷)
+ENDPOINT_LANES = {
+    "submit_interview": "submit",
+    "evaluate_answer": "answer",
+    "analyze_answer": "answer",
+    "generate_question": "create",
+    "generate_questions": "create",
+}
+
+# 라우터 엔드포인트 이름 -> 레인 (전체 버킷 / 동시 호출 수)
+CALL_LANES = {
+    "submit": "submit",
+    "answer": "answer",
+    "analyze_answer": "answer",
+    "create": "create",
+    "generate_questions": "create",
+}
+
+# 레인별 기본값: 우선순위(작을수록 먼저), 클라이언트 분당 요청 수 / 버스트, 대기열 길이, 최대 대기(초)
+DEFAULT_LANES = {
+    # (회사 / 학교처럼 여러 지원자가 같은 IP 로 보일 수 있어 클라이언트 한도는 넉넉하게 둡니다.)
+    "submit": {"priority": 0, "client_rpm": 20, "client_burst": 10, "queue": 100, "max_wait": 20},
+    "answer": {"priority": 1, "client_rpm": 120, "client_burst": 30, "queue": 100, "max_wait": 5},
+    "create": {"priority": 2, "client_rpm": 20, "client_burst": 10, "queue": 30, "max_wait": 5},
+}
+
+
+def lane_policy(lane):
+    policy = DEFAULT_LANES[lane]
+    key = lane.upper()
+    return {
+        "priority": policy["priority"],
+        "client_rpm": float(os.getenv(f"ADMISSION_CLIENT_RPM_{key}", str(policy["client_rpm"]))),
+        "client_burst": float(os.getenv(f"ADMISSION_CLIENT_BURST_{key}", str(policy["client_burst"]))),
+        "queue": int(os.getenv(f"ADMISSION_QUEUE_{key}", str(policy["queue"]))),
+        "max_wait": float(os.getenv(f"ADMISSION_MAX_WAIT_{key}", str(policy["max_wait"]))),
+    }
+
+
+class Rejected(Exception):
+    MESSAGES = {
+        "client_limited": "요청이 너무 많습니다. 잠시 후 다시 시도하세요.",
+        "queue_full": "지금 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도하세요.",
+        "timeout": "지금 요청이 많아 처리할 수 없습니다. 잠시 후 다시 시도하세요.",
+    }
+
+    def __init__(self, reason, retry_after):
+        super().__init__(self.MESSAGES[reason])
+        self.reason = reason            # client_limited / queue_full / timeout
+        self.retry_after = retry_after
+
+
+# -------------------------
+# 토큰 버킷
+# -------------------------
+class TokenBucket:
+    """초당 rate 개씩 차고 최대 burst 개까지 쌓이는 버킷. rate <= 0 이면 제한 없음. (잠금은 호출하는 쪽에서)"""
+
+    def __init__(self, rate, burst, clock=time.monotonic):
+        self.rate = rate
+        self.burst = max(burst, 1.0)
+        self.tokens = self.burst
+        self._clock = clock
+        self.updated = clock()
+
+    def _refill(self):
+        now = self._clock()
+        self.tokens = min(self.burst, self.tokens + (now - self.updated) * self.rate)
+        self.updated = now
+
+    def wait_time(self):
+        # 토큰 하나가 생길 때까지 남은 시간(초), 지금 있으면 0
+        if self.rate <= 0:
+            return 0.0
+        self._refill()
+        return 0.0 if self.tokens >= 1 else (1 - self.tokens) / self.rate
+
+    def take(self):
+        # 토큰이 있으면 하나 쓰고 0, 없으면 쓰지 않고 기다려야 하는 시간
+        wait = self.wait_time()
+        if wait == 0 and self.rate > 0:
+            self.tokens -= 1
+        return wait
+
+    def full(self):
+        self._refill()
+        return self.tokens >= self.burst
+
+
+# -------------------------
+# 입장 제어
+# -------------------------
+class _Waiter:
+    __slots__ = ("lane", "order")
+
+    def __init__(self, lane, order):
+        self.lane = lane
+        self.order = order
+
+
+class AdmissionController:
+    def __init__(self, max_concurrent=32, reserved=4, global_rpm=600, global_burst=60,
+                 max_clients=10000, lanes=None, clock=time.monotonic):
+        self.max_concurrent = max_concurrent
+        self.reserved = min(reserved, max(max_concurrent - 1, 0))
+        self.lanes = lanes or {lane: lane_policy(lane) for lane in DEFAULT_LANES}
+        self.max_clients = max_clients
+        self._clock = clock
+        self._global = TokenBucket(global_rpm / 60, global_burst, clock)
+        self._clients = OrderedDict()   # (client, lane) -> TokenBucket, 오래 안 쓴 것부터 정리
+        self._waiting = []              # 우선순위 / 도착 순서로 정렬된 _Waiter
+        self._waiting_count = {lane: 0 for lane in self.lanes}
+        self._running = {lane: 0 for lane in self.lanes}
+        self._order = count()
+        self._cond = threading.Condition()
+
+    def _limit(self, lane):
+        # create 처럼 우선순위가 제일 낮은 레인은 reserved 자리를 남겨 둡니다. (submit 이 늘 들어올 수 있게)
+        lowest = max(policy["priority"] for policy in self.lanes.values())
+        if self.lanes[lane]["priority"] == lowest and lowest > 0:
+            return self.max_concurrent - self.reserved
+        return self.max_concurrent
+
+    def _client_bucket(self, client, lane):
+        key = (client, lane)
+        bucket = self._clients.get(key)
+        if bucket is None:
+            policy = self.lanes[lane]
+            bucket = self._clients[key] = TokenBucket(policy["client_rpm"] / 60, policy["client_burst"], self._clock)
+            while len(self._clients) > self.max_clients:
+                self._clients.popitem(last=False)
+        else:
+            self._clients.move_to_end(key)
+        return bucket
+
+    def _can_enter(self, waiter):
+        # 앞에 더 급한(또는 먼저 온) 대기자가 없고, 자리가 있고, 전체 토큰이 있을 때
+        return (self._waiting[0] is waiter
+                and sum(self._running.values()) < self._limit(waiter.lane)
+                and self._global.wait_time() == 0)
+
+    def check_client(self, lane, client):
+        """클라이언트 버킷에서 토큰 하나를 씁니다. 다 썼으면 Rejected("client_limited")."""
+        with self._cond:
+            wait = self._client_bucket(client, lane).take()
+        if wait > 0:
+            ADMISSION.inc(lane=lane, outcome="client_limited")
+            raise Rejected("client_limited", wait)
+
+    def lane_for(self, endpoint):
+        return CALL_LANES.get(endpoint)
+
+    def acquire(self, lane):
+        """LLM 호출 하나의 자리를 얻으면 기다린 시간(초)을 돌려주고, 못 얻으면 Rejected."""
+        policy = self.lanes[lane]
+        started = self._clock()
+        with self._cond:
+            if self._waiting_count[lane] >= policy["queue"]:
+                ADMISSION.inc(lane=lane, outcome="rejected")
+                raise Rejected("queue_full", self._retry_hint(lane))
+
+            waiter = _Waiter(lane, (policy["priority"], next(self._order)))
+            self._waiting.append(waiter)
+            self._waiting.sort(key=lambda w: w.order)
+            self._waiting_count[lane] += 1
+            deadline = started + policy["max_wait"]
+            try:
+                while not self._can_enter(waiter):
+                    remaining = deadline - self._clock()
+                    if remaining <= 0:
+                        ADMISSION.inc(lane=lane, outcome="rejected")
+                        raise Rejected("timeout", self._retry_hint(lane))
+                    # 자리는 release() 가 깨워 주지만, 토큰은 시간이 지나야 생기므로 그만큼만 잡니다.
+                    refill = self._global.wait_time()
+                    self._cond.wait(min(remaining, refill) if refill > 0 else remaining)
+                self._global.take()
+                self._running[lane] += 1
+            finally:
+                self._waiting.remove(waiter)
+                self._waiting_count[lane] -= 1
+                # 맨 앞이 빠졌으니 다음 대기자가 들어갈 수 있는지 다시 보게 합니다.
+                self._cond.notify_all()
+
+        waited = self._clock() - started
+        ADMISSION.inc(lane=lane, outcome="queued" if waited > 0.001 else "admitted")
+        return waited
+
+    def release(self, lane):
+        with self._cond:
+            self._running[lane] -= 1
+            self._cond.notify_all()
+
+    def _retry_hint(self, lane):
+        # 정확한 값은 알 수 없으므로, 대기열이 한 번 빠지는 시간 정도를 알려줍니다.
+        return max(1.0, self._global.wait_time(), self.lanes[lane]["max_wait"] / 2)
+
+    def stats(self):
+        with self._cond:
+            # 가득 찬 클라이언트 버킷은 기본값과 같으므로 통계 볼 때 정리합니다.
+            for key in [key for key, bucket in self._clients.items() if bucket.full()]:
+                del self._clients[key]
+            return {
+                "maxConcurrent": self.max_concurrent,
+                "reserved": self.reserved,
+                "running": dict(self._running),
+                "waiting": dict(self._waiting_count),
+                "globalTokens": round(self._global.tokens, 2) if self._global.rate > 0 else None,
+                "clients": len(self._clients),
+                "lanes": self.lanes,
+            }
+
+
+def client_id(trusted_proxies=0, header=None):
+    """
+    요청한 클라이언트를 구분하는 값. 클라이언트가 마음대로 바꿀 수 있는 값은 쓰지 않습니다.
+    - header: 앞단(인증 게이트웨이 등)이 덮어써 주는 헤더만 설정합니다. (예: 인증된 사용자 ID)
+    - trusted_proxies: 앞에 있는 리버스 프록시 수. X-Forwarded-For 의 오른쪽에서 그 번째 값이 실제 접속 IP 입니다.
+      (더 왼쪽 값은 클라이언트가 보낸 그대로일 수 있어 쓰지 않음)
+    """
+    if header:
+        value = (request.headers.get(header) or "").strip()[:128]
+        if value:
+            return value
+    if trusted_proxies > 0:
+        forwarded = [part.strip() for part in request.headers.get("X-Forwarded-For", "").split(",") if part.strip()]
+        if len(forwarded) >= trusted_proxies:
+            return forwarded[-trusted_proxies]
+    return request.remote_addr or "-"
+
+
+def rejected_response(error):
+    status = 429 if error.reason == "client_limited" else 503
+    resp = jsonify({"error": str(error)})
+    resp.headers["Retry-After"] = str(math.ceil(error.retry_after))
+    return resp, status
+
+
+def install_admission(app, controller):
+    """
+    ENDPOINT_LANES 에 있는 라우트는 before_request 에서 클라이언트 버킷을 확인합니다.
+    (전체 버킷 / 동시 호출 수는 라우터가 LLM 호출마다 확인, ModelRouter.admission)
+
+    ADMISSION_TRUSTED_PROXIES  앞에 있는 리버스 프록시 수 (기본 0: 접속 IP 를 그대로 사용)
+    ADMISSION_CLIENT_HEADER    앞단이 덮어써 주는 클라이언트 구분 헤더 (기본 없음, 클라이언트가 보낸 헤더는 믿지 않음)
+    """
+    trusted_proxies = int(os.getenv("ADMISSION_TRUSTED_PROXIES", "0"))
+    header = os.getenv("ADMISSION_CLIENT_HEADER", "").strip() or None
+
+    @app.before_request
+    def _admit():
+        lane = ENDPOINT_LANES.get(request.endpoint)
+        if lane is None or request.method != "POST":
+            return None
+        try:
+            controller.check_client(lane, client_id(trusted_proxies, header))
+        except Rejected as e:
+            return rejected_response(e)
+        return None
+
+    return app
+
+
+def build_admission_controller():
+    """
+    ADMISSION_MAX_CONCURRENT        LLM 동시 호출 수 (기본 32)
+    ADMISSION_RESERVED              create 가 쓰지 못하게 남겨 두는 자리 (기본 4, submit / answer 용)
+    ADMISSION_GLOBAL_RPM            전체 분당 LLM 호출 수 (기본 600, 0 이면 제한 없음)
+    ADMISSION_GLOBAL_BURST          전체 버스트 (기본 60)
+    ADMISSION_CLIENT_RPM_<LANE>     클라이언트별 분당 요청 수, 예: ADMISSION_CLIENT_RPM_CREATE=6 (0 이면 제한 없음)
+    ADMISSION_CLIENT_BURST_<LANE>   클라이언트별 버스트
+    ADMISSION_QUEUE_<LANE>          레인별 대기열 길이
+    ADMISSION_MAX_WAIT_<LANE>       레인별 최대 대기 시간(초)
+    (LANE: SUBMIT / ANSWER / CREATE)
+    """
+    return AdmissionController(
+        max_concurrent=int(os.getenv("ADMISSION_MAX_CONCURRENT", "32")),
+        reserved=int(os.getenv("ADMISSION_RESERVED", "4")),
+        global_rpm=float(os.getenv("ADMISSION_GLOBAL_RPM", "600")),
+        global_burst=float(os.getenv("ADMISSION_GLOBAL_BURST", "60"))
+    )
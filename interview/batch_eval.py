@@ -0,0 +1,140 @@
+# interview/batch_eval.py
+# 녹화/저장된 면접 Q/A 를 밤새 한꺼번에 평가하는 배치 스크립트입니다.
+# /api/interview/submit 과 같은 프롬프트, 같은 점수 계산(run_evaluation)을 씁니다.
+#
+# 입력 JSONL (한 줄에 면접 1건):
+#   {"id": "ses-...", "qnaList": [{"question": "...", "answer": "..."}, ...]}
+# 출력 JSONL (끝나는 대로 한 줄씩 바로 기록):
+#   {"line": 1, "id": "ses-...", "result": {...}}   또는   {"line": 1, "id": ..., "error": "..."}
+#
+# 출력 파일이 곧 체크포인트입니다. 중간에 끊겨도 같은 명령을 다시 실행하면
+# 이미 기록된 줄은 건너뛰고 나머지만 평가합니다.
+# (--retry-errors 로 실패한 줄을 다시 돌리면 같은 line 의 마지막 기록이 최신 결과입니다.)
+#
+# 사용법:
+#   python -m interview.batch_eval transcripts.jsonl -o results.jsonl --concurrency 8
+import argparse
+import json
+import os
+import sys
+from concurrent.futures import FIRST_COMPLETED, ThreadPoolExecutor, wait
+
+from dotenv import load_dotenv
+
+# interview.* 모듈은 import 할 때 환경 변수를 읽으므로 .env 를 먼저 불러옵니다.
+load_dotenv()
+
+from interview.evaluation import run_evaluation  # noqa: E402
+from interview.llm_client import get_client  # noqa: E402
+
+
+# -------------------------
+# 체크포인트 (이미 끝난 줄 번호)
+# -------------------------
+def load_checkpoint(output_path, retry_errors=False):
+    done = set()
+    if not os.path.exists(output_path):
+        return done
+
+    with open(output_path, "rb+") as f:
+        valid_end = 0
+        for raw in f:
+            try:
+                record = json.loads(raw)
+            except ValueError:
+                # 기록 도중 끊긴 마지막 줄
+                break
+            valid_end += len(raw)
+            if retry_errors and "error" in record:
+                continue
+            done.add(record["line"])
+        # 깨진 꼬리는 잘라내서 이어 쓸 때 파일이 망가지지 않게 합니다.
+        f.truncate(valid_end)
+
+    return done
+
+
+def read_transcripts(input_path, done):
+    with open(input_path, encoding="utf-8") as f:
+        for line_no, line in enumerate(f, start=1):
+            if line_no in done or not line.strip():
+                continue
+            yield line_no, line
+
+
+# -------------------------
+# 면접 1건 평가
+# -------------------------
+def evaluate_line(client, model, eval_mode, line_no, line):
+    record = {"line": line_no}
+    try:
+        transcript = json.loads(line)
+        record["id"] = transcript.get("id") or transcript.get("interviewId")
+        qna_list = transcript.get("qnaList")
+        if not qna_list:
+            raise ValueError("qnaList 데이터 없음")
+        record["result"] = run_evaluation(client, model, qna_list, eval_mode)
+    except Exception as e:
+        record["error"] = str(e)
+    return record
+
+
+# -------------------------
+# 실행
+# -------------------------
+def run(client, input_path, output_path, model="gpt-4o-mini", eval_mode="single",
+        concurrency=4, retry_errors=False, log=sys.stderr):
+    done = load_checkpoint(output_path, retry_errors)
+    if done:
+        print(f"[batch] 이미 처리된 {len(done)}건은 건너뜁니다.", file=log)
+
+    processed = failed = 0
+    with open(output_path, "a", encoding="utf-8") as out, \
+            ThreadPoolExecutor(max_workers=concurrency) as pool:
+
+        pending = set()
+
+        def drain():
+            # 하나 이상 끝날 때까지 기다렸다가, 끝난 것들을 바로 파일에 씁니다.
+            nonlocal pending, processed, failed
+            finished, pending = wait(pending, return_when=FIRST_COMPLETED)
+            for future in finished:
+                record = future.result()
+                out.write(json.dumps(record, ensure_ascii=False) + "\n")
+                out.flush()
+                processed += 1
+                failed += "error" in record
+
+        for line_no, line in read_transcripts(input_path, done):
+            # 동시에 떠 있는 작업 수를 제한해서, 입력 파일을 통째로 메모리에 올리지 않습니다.
+            if len(pending) >= concurrency * 2:
+                drain()
+            pending.add(pool.submit(evaluate_line, client, model, eval_mode, line_no, line))
+
+        while pending:
+            drain()
+
+    print(f"[batch] 완료: {processed}건 (실패 {failed}건)", file=log)
+    return processed, failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="면접 Q/A JSONL 을 배치로 평가합니다.")
+    parser.add_argument("input", help="qnaList 가 들어있는 JSONL 파일")
+    parser.add_argument("-o", "--output", required=True, help="결과 JSONL 파일 (체크포인트 겸용)")
+    parser.add_argument("--concurrency", type=int, default=4, help="동시에 보낼 평가 호출 수")
+    parser.add_argument("--model", default="gpt-4o-mini")
+    parser.add_argument("--eval-mode", default="single", choices=["single", "per_question"])
+    parser.add_argument("--retry-errors", action="store_true", help="이전 실행에서 실패한 줄도 다시 평가")
+    args = parser.parse_args(argv)
+
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise EnvironmentError("OPENAI_API_KEY 누락됨 (.env 확인)")
+
+    run(get_client(api_key), args.input, args.output, args.model,
+        args.eval_mode, args.concurrency, args.retry_errors)
+
+
+if __name__ == "__main__":
+    main()
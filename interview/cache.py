@@ -0,0 +1,216 @@
+# interview/cache.py
+# LLM 응답 캐시 (메모리 LRU + TTL, 선택적으로 SQLite 디스크 계층)
+# 같은 직무/경력/자기소개서 조합이 다시 들어오면 LLM 호출 없이 바로 돌려줍니다.
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+from collections import OrderedDict
+
+
+# -------------------------
+# 메모리 캐시 (LRU + TTL)
+# -------------------------
+class MemoryCache:
+    def __init__(self, max_entries=256, ttl=600, max_entry_bytes=64 * 1024):
+        self.max_entries = max_entries
+        self.ttl = ttl
+        self.max_entry_bytes = max_entry_bytes
+        self._items = OrderedDict()   # key -> (만료 시각, 값)
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        with self._lock:
+            item = self._items.get(key)
+            if item is None:
+                return None
+            expires_at, value = item
+            if expires_at < time.time():
+                del self._items[key]
+                return None
+            self._items.move_to_end(key)
+            return value
+
+    def set(self, key, value, size, expires_at=None):
+        # expires_at: 다른 계층에서 가져온 값이면 그쪽의 만료 시각 (메모리 TTL 보다 길게 두지 않음)
+        if size > self.max_entry_bytes:
+            return False
+        deadline = time.time() + self.ttl
+        if expires_at is not None:
+            deadline = min(deadline, expires_at)
+        with self._lock:
+            self._items[key] = (deadline, value)
+            self._items.move_to_end(key)
+            while len(self._items) > self.max_entries:
+                self._items.popitem(last=False)
+        return True
+
+    def __len__(self):
+        return len(self._items)
+
+
+# -------------------------
+# 디스크 캐시 (SQLite)
+# -------------------------
+class SQLiteCache:
+    def __init__(self, path, ttl=86400, max_entry_bytes=64 * 1024, max_entries=10000):
+        self.path = path
+        self.ttl = ttl
+        self.max_entry_bytes = max_entry_bytes
+        self.max_entries = max_entries
+        self._local = threading.local()
+        with self._conn() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS cache ("
+                " key TEXT PRIMARY KEY, value TEXT NOT NULL,"
+                " expires_at REAL NOT NULL, used_at REAL NOT NULL)"
+            )
+
+    def _conn(self):
+        # sqlite 연결은 스레드끼리 공유하지 않습니다.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def get(self, key):
+        entry = self.get_entry(key)
+        return entry[0] if entry is not None else None
+
+    def get_entry(self, key):
+        """(값, 만료 시각) 또는 None"""
+        now = time.time()
+        conn = self._conn()
+        row = conn.execute(
+            "SELECT value, expires_at FROM cache WHERE key = ?", (key,)
+        ).fetchone()
+        if row is None:
+            return None
+        if row[1] < now:
+            with conn:
+                conn.execute("DELETE FROM cache WHERE key = ?", (key,))
+            return None
+        with conn:
+            conn.execute("UPDATE cache SET used_at = ? WHERE key = ?", (now, key))
+        return json.loads(row[0]), row[1]
+
+    def set(self, key, value, size):
+        if size > self.max_entry_bytes:
+            return False
+        now = time.time()
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO cache (key, value, expires_at, used_at) VALUES (?, ?, ?, ?)",
+                (key, json.dumps(value, ensure_ascii=False), now + self.ttl, now)
+            )
+            # 오래 안 쓴 항목부터 정리
+            conn.execute("DELETE FROM cache WHERE expires_at < ?", (now,))
+            conn.execute(
+                "DELETE FROM cache WHERE key IN ("
+                " SELECT key FROM cache ORDER BY used_at DESC LIMIT -1 OFFSET ?)",
+                (self.max_entries,)
+            )
+        return True
+
+
+# -------------------------
+# 메모리 + 디스크 계층 캐시
+# -------------------------
+class ResponseCache:
+    """
+    get(key) / set(key, value) 만 쓰면 되는 캐시입니다.
+    값은 JSON 으로 직렬화할 수 있는 dict 여야 합니다.
+    """
+
+    def __init__(self, memory, disk=None):
+        self.memory = memory
+        self.disk = disk
+        self.hits = 0
+        self.misses = 0
+        self.disk_hits = 0
+        self.skipped = 0      # 크기 제한 때문에 저장하지 않은 횟수
+        self._lock = threading.Lock()
+
+    def get(self, key):
+        value = self.memory.get(key)
+        if value is None and self.disk is not None:
+            entry = self.disk.get_entry(key)
+            if entry is not None:
+                # 디스크에서 찾은 값은 메모리로 올려둡니다. (디스크에 남은 유효 시간까지만)
+                value, expires_at = entry
+                self.memory.set(key, value, _size_of(value), expires_at)
+                with self._lock:
+                    self.disk_hits += 1
+
+        with self._lock:
+            if value is None:
+                self.misses += 1
+            else:
+                self.hits += 1
+        return value
+
+    def set(self, key, value):
+        size = _size_of(value)
+        stored = self.memory.set(key, value, size)
+        if self.disk is not None:
+            stored = self.disk.set(key, value, size) or stored
+        if not stored:
+            with self._lock:
+                self.skipped += 1
+        return stored
+
+    def stats(self):
+        total = self.hits + self.misses
+        return {
+            "hits": self.hits,
+            "misses": self.misses,
+            "diskHits": self.disk_hits,
+            "skipped": self.skipped,
+            "hitRatio": round(self.hits / total, 4) if total else 0.0,
+            "entries": len(self.memory),
+        }
+
+
+def _size_of(value):
+    return len(json.dumps(value, ensure_ascii=False).encode("utf-8"))
+
+
+# -------------------------
+# 질문 생성 캐시
+# -------------------------
+def _normalize(text):
+    return " ".join(text.split()).casefold()
+
+
+def question_cache_key(job, experience, intro):
+    # 자기소개서는 길어서 그대로 쓰지 않고 SHA-256 다이제스트만 키에 넣습니다.
+    digest = hashlib.sha256(_normalize(intro).encode("utf-8")).hexdigest()
+    return f"questions:{_normalize(job)}:{_normalize(experience)}:{digest}"
+
+
+def build_question_cache():
+    """
+    환경 변수로 설정합니다.
+    QUESTION_CACHE_SIZE      메모리 캐시 최대 항목 수 (0 이면 캐시 끔, 기본 256)
+    QUESTION_CACHE_TTL       유효 시간(초, 기본 600)
+    QUESTION_CACHE_MAX_BYTES 항목 하나의 최대 크기 (기본 64KB)
+    QUESTION_CACHE_DB        SQLite 파일 경로 (지정하면 디스크 계층 사용)
+    """
+    size = int(os.getenv("QUESTION_CACHE_SIZE", "256"))
+    if size <= 0:
+        return None
+
+    ttl = int(os.getenv("QUESTION_CACHE_TTL", "600"))
+    max_bytes = int(os.getenv("QUESTION_CACHE_MAX_BYTES", str(64 * 1024)))
+    memory = MemoryCache(max_entries=size, ttl=ttl, max_entry_bytes=max_bytes)
+
+    disk = None
+    db_path = os.getenv("QUESTION_CACHE_DB")
+    if db_path:
+        disk = SQLiteCache(db_path, ttl=ttl, max_entry_bytes=max_bytes)
+
+    return ResponseCache(memory, disk)
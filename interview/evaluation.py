@@ -0,0 +1,537 @@
+# interview/evaluation.py
+# 면접 답변 평가
+# - evaluate_all_at_once : 모든 Q/A 를 프롬프트 하나로 평가 (기존 방식)
+# - evaluate_per_question: 질문마다 작은 평가 호출을 동시에 보내고 결과를
+#   calculate_final_scores 가 쓰는 questionWeights / answerScores 형태로 합칩니다.
+#   총평(analysisText)은 별도의 작은 호출 하나로 만듭니다.
+# - run_evaluation       : 평가 + 점수 계산까지 해서 최종 성적표를 만듭니다.
+#   single 모드에서 비슷한 답변 캐시(interview/similarity.py)에 걸린 질문이 있으면,
+#   남은 질문이 하나뿐이면 질문별로, 여럿이면 남은 질문만 한 번에 평가해서 캐시 결과와 합칩니다.
+#   /api/interview/submit 과 배치 평가(interview/batch_eval.py)가 같이 씁니다.
+# - 응답 형식(EVAL_WIRE, 기본 full)
+#     full    : 예전 형식. 기준 이름을 키로 쓰고, 한 번에 평가할 때는 질문 / 답변도 다시 적어 받음
+#     compact : 짧은 키(w / s / g / i / q / a), 기준 순서(CRITERIA)대로의 배열, 숫자 가중치 코드(0=low ~ 3=high).
+#               질문 / 답변은 받지 않고 서버가 요청 내용으로 채워서 full 과 같은 형식으로 펼칩니다.
+#   compact 로 줄인 completion 토큰은 추정치입니다. 받은 compact 응답과 같은 내용을 full 형식으로 직렬화했을 때의
+#   토큰 수와 비교한 값이라 실제 사용량(resp.usage)과는 다릅니다. 지표와 track_completion_savings() 로 남깁니다.
+import contextvars
+import json
+import os
+import threading
+from concurrent.futures import Future, ThreadPoolExecutor
+from contextlib import contextmanager
+
+from interview.admission import Rejected
+from interview.llm_json import Optional, StructuredOutputError, parse_llm_json
+from interview.prompt_budget import count_tokens
+from interview.scoring import CRITERIA, WEIGHT_MAP, calculate_final_scores, grade
+from interview.telemetry import Counter, bind_context, current_endpoint, registry, stage
+
+# 동시에 보낼 최대 평가 호출 수
+EVAL_MAX_WORKERS = int(os.getenv("EVAL_MAX_WORKERS", "8"))
+# 질문 하나가 형식 오류로 실패했을 때 다시 시도할 횟수
+EVAL_RETRIES = int(os.getenv("EVAL_RETRIES", "1"))
+# 평가 응답 형식: "full" (기본) / "compact"
+EVAL_WIRE = os.getenv("EVAL_WIRE", "full")
+
+# 가중치 코드 -> 이름 (WEIGHT_MAP 값이 작은 것부터 0, 1, 2, 3)
+WEIGHT_CODES = sorted(WEIGHT_MAP, key=WEIGHT_MAP.get)
+
+OUTPUT_TOKENS = registry.register(Counter(
+    "interview_eval_output_tokens_estimate_total",
+    "Estimated evaluation output tokens: compact wire output vs the full schema it replaces",
+    ("endpoint", "wire")))
+
+
+# -------------------------
+# 응답 스키마 (interview/llm_json.py)
+# -------------------------
+_WEIGHTS = {c: tuple(WEIGHT_MAP) for c in CRITERIA}
+_SCORES = {c: float for c in CRITERIA}
+_POINTS = {"goodPoints": Optional([str], []), "improvementPoints": Optional([str], [])}
+
+QUESTION_RESULT_SCHEMA = {"weights": _WEIGHTS, "scores": _SCORES, **_POINTS}
+SUMMARY_SCHEMA = {"analysisText": Optional(str, "")}
+EVALUATION_SCHEMA = {
+    "questionWeights": {"*": _WEIGHTS},
+    "answerScores": {"*": _SCORES},
+    "analysisText": Optional(str, ""),
+    "questions": Optional([_POINTS], []),
+}
+
+# compact: w / s 는 CRITERIA 순서의 배열 (w 는 WEIGHT_CODES 의 번호)
+COMPACT_QUESTION_SCHEMA = {"w": [int], "s": [float], "g": Optional([str], []), "i": Optional([str], [])}
+COMPACT_EVALUATION_SCHEMA = {"q": [COMPACT_QUESTION_SCHEMA], "a": Optional(str, "")}
+
+
+# -------------------------
+# compact 응답 펼치기
+# -------------------------
+def _by_criteria(values, path):
+    if len(values) != len(CRITERIA):
+        raise StructuredOutputError(f"{path}: 값 {len(CRITERIA)}개가 필요합니다. ({len(values)}개)")
+    return dict(zip(CRITERIA, values))
+
+
+def expand_question_result(data, path="$"):
+    """{"w": [...], "s": [...], "g": [...], "i": [...]} -> QUESTION_RESULT_SCHEMA 형식"""
+    weights = {}
+    for criterion, code in _by_criteria(data["w"], f"{path}.w").items():
+        if not 0 <= code < len(WEIGHT_CODES):
+            raise StructuredOutputError(f"{path}.w: 가중치 코드는 0~{len(WEIGHT_CODES) - 1} 입니다. ({code})")
+        weights[criterion] = WEIGHT_CODES[code]
+    return {
+        "weights": weights,
+        "scores": _by_criteria(data["s"], f"{path}.s"),
+        "goodPoints": data["g"],
+        "improvementPoints": data["i"],
+    }
+
+
+def expand_evaluation(data, qna_list):
+    """{"q": [...], "a": "..."} -> EVALUATION_SCHEMA 형식 (title / answer 는 요청의 qna_list 로 채움)"""
+    question_weights = {}
+    answer_scores = {}
+    questions = []
+    for i, item in enumerate(qna_list):
+        entry = {"id": i + 1, "title": item["question"], "answer": item["answer"]}
+        if i < len(data["q"]):
+            result = expand_question_result(data["q"][i], f"$.q[{i}]")
+            question_weights[str(i + 1)] = result["weights"]
+            answer_scores[str(i + 1)] = result["scores"]
+            entry["goodPoints"] = result["goodPoints"]
+            entry["improvementPoints"] = result["improvementPoints"]
+        else:
+            # 모델이 질문 수보다 적게 돌려준 경우 (잘린 응답 등)
+            entry.update({"goodPoints": [], "improvementPoints": [], "error": "평가 결과가 없습니다."})
+        questions.append(entry)
+
+    if not question_weights:
+        raise StructuredOutputError("$.q: 평가 결과가 없습니다.")
+
+    return {
+        "questionWeights": question_weights,
+        "answerScores": answer_scores,
+        "analysisText": data["a"],
+        "questions": questions,
+    }
+
+
+# -------------------------
+# 줄인 completion 토큰 (추정치)
+# -------------------------
+_savings = contextvars.ContextVar("completion_savings", default=None)
+_savings_lock = threading.Lock()
+
+
+@contextmanager
+def track_completion_savings():
+    """
+    블록 안의 compact 평가 호출이 줄인 completion 토큰 추정치를 모읍니다. (질문별 병렬 호출 포함)
+    {"originalTokens": full 형식이었을 때, "finalTokens": compact, "savedTokens": 차이}
+    """
+    stats = {"originalTokens": 0, "finalTokens": 0, "savedTokens": 0}
+    token = _savings.set(stats)
+    try:
+        yield stats
+    finally:
+        _savings.reset(token)
+
+
+def _record_savings(compact, full):
+    # 두 형식을 같은 방식으로 직렬화해서 셉니다. (모델이 실제로 쓴 공백 / 줄바꿈과는 조금 다름)
+    final = count_tokens(json.dumps(compact, ensure_ascii=False))
+    original = count_tokens(json.dumps(full, ensure_ascii=False))
+    endpoint = current_endpoint()
+    OUTPUT_TOKENS.inc(final, endpoint=endpoint, wire="compact")
+    OUTPUT_TOKENS.inc(original, endpoint=endpoint, wire="full")
+    stats = _savings.get()
+    if stats is not None:
+        with _savings_lock:
+            stats["originalTokens"] += original
+            stats["finalTokens"] += final
+            stats["savedTokens"] += original - final
+
+
+# -------------------------
+# 프롬프트
+# -------------------------
+# compact 출력 형식 설명 (기준 순서 / 가중치 코드)
+_COMPACT_LEGEND = (
+    f"w(중요도 코드)와 s(점수)는 [{', '.join(CRITERIA)}] 순서의 배열입니다.\n"
+    f"중요도 코드: {', '.join(f'{code}={name}' for code, name in reversed(list(enumerate(WEIGHT_CODES))))}\n"
+    "g: 잘한 점, i: 아쉬운 점"
+)
+
+
+def build_question_prompt(question, answer, wire=None):
+    if (wire or EVAL_WIRE) == "compact":
+        output = f"""반드시 JSON만 출력하세요. (키는 아래처럼 짧게)
+{_COMPACT_LEGEND}
+{{"w": [3, 1, 3, 0, 3], "s": [85, 90, 88, 72, 93], "g": ["잘한 점1", "잘한 점2"], "i": ["아쉬운 점1", "아쉬운 점2"]}}"""
+    else:
+        output = """반드시 JSON만 출력하세요:
+{
+  "weights": {"직무": "high", "논리": "med", "구체성": "high", "키워드": "low", "태도": "high"},
+  "scores": {"직무": 85, "논리": 90, "구체성": 88, "키워드": 72, "태도": 93},
+  "goodPoints": ["잘한 점1", "잘한 점2"],
+  "improvementPoints": ["아쉬운 점1", "아쉬운 점2"]
+}"""
+
+    return f"""
+당신은 AI 면접 평가 전문가입니다.
+아래 면접 질문 하나와 답변을 평가하세요.
+
+질문: {question}
+답변: {answer}
+
+해야 할 작업:
+1) 이 질문의 중요도를 5개 기준으로 평가 (high / med-high / med / low)
+2) 답변을 기준별로 0~100점 평가
+3) Good / Improvement 포인트 생성
+
+{output}
+"""
+
+
+def build_summary_prompt(qna_list):
+    full_text = ""
+    for i, item in enumerate(qna_list):
+        full_text += f"Q{i+1}: {item['question']}\nA: {item['answer']}\n\n"
+
+    return f"""
+당신은 AI 면접 평가 전문가입니다.
+아래 면접 Q/A 전체를 읽고 지원자의 강점과 약점을 3문장으로 총평하세요.
+
+[면접 데이터]
+{full_text}
+
+반드시 JSON만 출력하세요:
+{{"analysisText": "(전체 총평)"}}
+"""
+
+
+# -------------------------
+# 단일 호출
+# -------------------------
+def _ask_json(client, model, prompt, schema, name):
+    resp = client.chat.completions.create(
+        model=model,
+        messages=[{"role": "user", "content": prompt}],
+        response_format={"type": "json_object"}
+    )
+    # 형식 오류(trailing comma, 잘림, 문자열 숫자 등)는 다시 호출하지 않고 고쳐서 씁니다.
+    return parse_llm_json(resp.choices[0].message.content, schema, name)
+
+
+def _ask_compact(client, model, prompt, schema, name, expand):
+    # compact 로 받아서 full 형식으로 펼치고, 줄인 토큰 수를 기록합니다.
+    data = _ask_json(client, model, prompt, schema, name)
+    result = expand(data)
+    _record_savings(data, result)
+    return result
+
+
+def cached_result(question, answer):
+    # 같은 질문에 거의 같은 답변을 이미 평가했으면 그 결과 (interview/similarity.py)
+    # numpy 를 쓰는 모듈이라 처음 평가할 때 import 합니다. (앱 시작 시간에 넣지 않음)
+    from interview.similarity import answer_cache
+
+    if answer_cache is None:
+        return None
+    return answer_cache.get("evaluation", question, answer)
+
+
+def remember_result(question, answer, result):
+    from interview.similarity import answer_cache
+
+    if answer_cache is not None:
+        answer_cache.put("evaluation", question, answer, result)
+
+
+def evaluate_question(client, model, question, answer, use_cache=True, wire=None):
+    if use_cache:
+        cached = cached_result(question, answer)
+        if cached is not None:
+            return cached
+
+    wire = wire or EVAL_WIRE
+    last_error = None
+    for _ in range(EVAL_RETRIES + 1):
+        try:
+            prompt = build_question_prompt(question, answer, wire)
+            if wire == "compact":
+                result = _ask_compact(client, model, prompt, COMPACT_QUESTION_SCHEMA,
+                                      "evaluation.question", expand_question_result)
+            else:
+                result = _ask_json(client, model, prompt, QUESTION_RESULT_SCHEMA, "evaluation.question")
+            remember_result(question, answer, result)
+            return result
+        except StructuredOutputError as e:
+            # 형식 오류만 다시 물어봅니다. (네트워크 / 429 / 5xx 재시도는 클라이언트가 이미 함)
+            last_error = e
+    raise last_error
+
+
+def summarize(client, model, qna_list):
+    return _ask_json(client, model, build_summary_prompt(qna_list),
+                     SUMMARY_SCHEMA, "evaluation.summary")["analysisText"]
+
+
+# -------------------------
+# 질문별 결과 합치기
+# -------------------------
+def merge_question_results(qna_list, futures):
+    """
+    질문별 평가 결과(future)를 한 번에 평가할 때의 AI 응답과 같은 형식으로 합칩니다.
+    (analysisText 는 총평 호출 결과로 호출하는 쪽에서 채웁니다.)
+    {
+      "questionWeights": {"1": {...}, ...},
+      "answerScores": {"1": {...}, ...},
+      "analysisText": "...",
+      "questions": [{"id": 1, "title": ..., "answer": ..., "goodPoints": [...], "improvementPoints": [...]}]
+    }
+    형식 오류로 끝내 실패한 질문은 점수 계산에서 빠지고, questions 에 error 로 표시됩니다.
+    (입장 제어로 거절된 질문이 있으면 Rejected 를 그대로 올립니다.)
+    비슷한 답변의 결과를 재사용한 질문은 questions 에 cache 로 표시됩니다.
+    """
+    question_weights = {}
+    answer_scores = {}
+    questions = []
+
+    for i, (item, future) in enumerate(zip(qna_list, futures)):
+        q_num = str(i + 1)
+        entry = {"id": i + 1, "title": item["question"], "answer": item["answer"]}
+        try:
+            result = future.result()
+        except Rejected:
+            # 입장 제어로 LLM 을 부르지 못한 질문은 일부만 채점하지 않고 요청 전체를 503 으로 돌립니다.
+            raise
+        except Exception as e:
+            entry.update({"goodPoints": [], "improvementPoints": [], "error": str(e)})
+            questions.append(entry)
+            continue
+
+        question_weights[q_num] = {c: result["weights"][c] for c in CRITERIA}
+        answer_scores[q_num] = {c: result["scores"][c] for c in CRITERIA}
+        entry["goodPoints"] = result.get("goodPoints", [])
+        entry["improvementPoints"] = result.get("improvementPoints", [])
+        if "cache" in result:
+            entry["cache"] = result["cache"]
+        questions.append(entry)
+
+    if not question_weights:
+        raise ValueError("모든 질문 평가에 실패했습니다.")
+
+    return {
+        "questionWeights": question_weights,
+        "answerScores": answer_scores,
+        "questions": questions,
+    }
+
+
+def summary_text(summary_future):
+    try:
+        return summary_future.result()
+    except Exception:
+        # 총평이 실패해도 점수는 보여줄 수 있게 합니다.
+        return ""
+
+
+# -------------------------
+# 질문별 병렬 평가
+# -------------------------
+def _done(result):
+    future = Future()
+    future.set_result(result)
+    return future
+
+
+def evaluate_per_question(client, model, qna_list, max_workers=None, cached=None, wire=None):
+    max_workers = max_workers or EVAL_MAX_WORKERS
+    workers = max(1, min(max_workers, len(qna_list) + 1))
+    if cached is None:
+        cached = [cached_result(item["question"], item["answer"]) for item in qna_list]
+
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        summary_future = pool.submit(bind_context(summarize), client, model, qna_list)
+        futures = [
+            _done(hit) if hit is not None else
+            pool.submit(bind_context(evaluate_question), client, model, item["question"], item["answer"], False, wire)
+            for item, hit in zip(qna_list, cached)
+        ]
+        ai_result = merge_question_results(qna_list, futures)
+        ai_result["analysisText"] = summary_text(summary_future)
+
+    return ai_result
+
+
+# -------------------------
+# 전체 Q/A 한 번에 평가 (기존 방식)
+# -------------------------
+def build_evaluation_prompt(qna_list, wire=None):
+    # Q/A 텍스트 작성
+    full_text = ""
+    for i, item in enumerate(qna_list):
+        full_text += f"Q{i+1}: {item['question']}\nA: {item['answer']}\n\n"
+
+    if (wire or EVAL_WIRE) == "compact":
+        # 질문 / 답변은 다시 적지 않게 하고, 서버가 expand_evaluation 으로 채웁니다.
+        return f"""
+당신은 AI 면접 평가 전문가입니다.
+아래 면접 Q/A 리스트를 기반으로 질문 중요도, 가중치, 점수, 분석을 수행하세요.
+
+[면접 데이터]
+{full_text}
+
+해야 할 작업:
+1) 각 질문의 중요도를 5개 기준으로 평가 (high / med-high / med / low)
+2) 각 질문 답변을 기준별로 0~100점 평가
+3) 각 질문별 Good / Improvement 포인트 생성
+4) 전체 총평 작성
+
+반드시 JSON만 출력하세요. 질문 내용과 답변은 다시 적지 마세요.
+q: Q1 부터 순서대로 질문마다 한 항목, a: 전체 총평
+{_COMPACT_LEGEND}
+{{"q": [{{"w": [3, 1, 3, 0, 3], "s": [85, 90, 88, 72, 93], "g": ["잘한 점1"], "i": ["아쉬운 점1"]}}], "a": "(전체 총평)"}}
+"""
+
+    # ★ AI 평가 프롬프트
+    return f"""
+당신은 AI 면접 평가 전문가입니다.
+아래 면접 Q/A 리스트를 기반으로 질문 중요도, 가중치, 점수, 분석을 수행하세요.
+
+[면접 데이터]
+{full_text}
+
+해야 할 작업:
+1) 각 질문의 중요도를 5개 기준으로 평가 (high / med-high / med / low)
+2) 각 질문 답변을 기준별로 0~100점 평가
+3) 각 질문별 Good / Improvement 포인트 생성
+4) 전체 총평 작성
+
+반드시 JSON만 출력하세요:
+
+{{
+  "questionWeights": {{
+      "1": {{"직무": "high", "논리": "med", "구체성": "high", "키워드": "low", "태도": "high"}},
+      ...
+  }},
+  "answerScores": {{
+      "1": {{"직무": 85, "논리": 90, "구체성": 88, "키워드": 72, "태도": 93}},
+      ...
+  }},
+  
+  "analysisText": "(전체 총평)",
+  "questions": [
+    {{
+      "id": 1,
+       "title": "(질문 내용)",
+       "answer": "(지원자 답변)",
+       "goodPoints": ["잘한 점1", "잘한 점2"],
+       "improvementPoints": ["아쉬운 점1", "아쉬운 점2"]
+    }}
+  ]
+}}
+"""
+
+
+def evaluate_all_at_once(client, model, qna_list, wire=None):
+    wire = wire or EVAL_WIRE
+    prompt = build_evaluation_prompt(qna_list, wire)
+    if wire == "compact":
+        ai_result = _ask_compact(client, model, prompt, COMPACT_EVALUATION_SCHEMA, "evaluation.single",
+                                 lambda data: expand_evaluation(data, qna_list))
+    else:
+        ai_result = _ask_json(client, model, prompt, EVALUATION_SCHEMA, "evaluation.single")
+
+    # 질문별 결과를 유사 답변 캐시에 남겨서, 다음에 비슷한 답변이 오면 다시 쓰게 합니다.
+    for item, result in zip(qna_list, split_evaluation(ai_result, len(qna_list))):
+        if result is not None:
+            remember_result(item["question"], item["answer"], result)
+    return ai_result
+
+
+def split_evaluation(ai_result, count):
+    """한 번에 평가한 결과를 질문별 결과(evaluate_question 형식) 리스트로 나눕니다. 빠진 질문은 None."""
+    questions = ai_result.get("questions", [])
+    results = []
+    for i in range(count):
+        q_num = str(i + 1)
+        if q_num not in ai_result["questionWeights"] or q_num not in ai_result["answerScores"]:
+            results.append(None)
+            continue
+        points = questions[i] if i < len(questions) else {}
+        results.append({
+            "weights": ai_result["questionWeights"][q_num],
+            "scores": ai_result["answerScores"][q_num],
+            "goodPoints": points.get("goodPoints", []),
+            "improvementPoints": points.get("improvementPoints", []),
+        })
+    return results
+
+
+def evaluate_misses_at_once(client, model, qna_list, cached, wire=None):
+    """
+    캐시에 없는 질문만 모아서 한 번에 평가하고, 캐시 결과와 합칩니다. (반환 형식은 evaluate_per_question 과 같음)
+    총평은 캐시한 질문까지 포함한 전체 Q/A 로 따로 부릅니다.
+    """
+    misses = [i for i, hit in enumerate(cached) if hit is None]
+    with ThreadPoolExecutor(max_workers=1) as pool:
+        summary_future = pool.submit(bind_context(summarize), client, model, qna_list)
+        partial = evaluate_all_at_once(client, model, [qna_list[i] for i in misses], wire)
+        fresh = dict(zip(misses, split_evaluation(partial, len(misses))))
+
+        futures = []
+        for i, hit in enumerate(cached):
+            result = hit if hit is not None else fresh[i]
+            if result is None:
+                future = Future()
+                future.set_exception(ValueError("한 번에 평가한 결과에 이 질문이 없습니다."))
+                futures.append(future)
+            else:
+                futures.append(_done(result))
+        ai_result = merge_question_results(qna_list, futures)
+        ai_result["analysisText"] = summary_text(summary_future)
+
+    return ai_result
+
+
+# -------------------------
+# 평가 + 점수 계산 (최종 성적표)
+# -------------------------
+def run_evaluation(client, model, qna_list, eval_mode="single", wire=None):
+    if eval_mode == "per_question":
+        ai_result = evaluate_per_question(client, model, qna_list, wire=wire)
+    else:
+        cached = [cached_result(item["question"], item["answer"]) for item in qna_list]
+        misses = sum(hit is None for hit in cached)
+        if misses == len(cached):
+            ai_result = evaluate_all_at_once(client, model, qna_list, wire)
+        elif misses <= 1:
+            # 비슷한 답변을 거의 다 재사용할 수 있으면 남은 질문만 질문별로 평가합니다.
+            ai_result = evaluate_per_question(client, model, qna_list, cached=cached, wire=wire)
+        else:
+            # 남은 질문이 여럿이면 질문마다 부르지 않고 한 번에 평가합니다. (총평 포함 호출 2번)
+            ai_result = evaluate_misses_at_once(client, model, qna_list, cached, wire)
+    return build_report(ai_result)
+
+
+def build_report(ai_result):
+    # 프롬프트에서 radarScores/totalScore/grade 는 받지 않고 계산 코드로 구합니다.
+    with stage("scoring"):
+        radar = calculate_final_scores(
+            ai_result["questionWeights"],
+            ai_result["answerScores"]
+        )
+
+        total_score = round(sum(radar.values()) / len(radar))
+        grade_result = grade(total_score)
+
+    return {
+        "totalScore": total_score,
+        "grade": grade_result,
+        "radarScores": radar,
+        "analysisText": ai_result.get("analysisText", ""),
+        "questions": ai_result.get("questions", [])
+    }
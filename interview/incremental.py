@@ -0,0 +1,123 @@
+# interview/incremental.py
+# 면접 진행 중 답변별 평가
+# 지원자가 다음 질문으로 넘어갈 때마다 방금 답변을 백그라운드에서 미리 평가해 두고,
+# 최종 제출 때는 저장된 질문별 결과를 모아서 점수 계산과 총평만 합니다.
+#
+# 세션 저장소(store)를 넘기면 끝난 결과를 SQLite 에도 기록하므로,
+# 답변 평가와 최종 제출을 서로 다른 워커 프로세스가 받아도 결과를 다시 씁니다.
+import os
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+
+from interview.admission import Rejected
+from interview.evaluation import evaluate_question, merge_question_results, summarize, summary_text
+from interview.telemetry import bind_context
+
+
+def _rejected(future):
+    return future.done() and isinstance(future.exception(), Rejected)
+
+
+class IncrementalEvaluator:
+    def __init__(self, client, model, store=None, workers=4, ttl=3600):
+        self.client = client
+        self.model = model
+        self.store = store
+        self.ttl = ttl                    # 제출되지 않은 면접 결과를 보관하는 시간(초)
+        self._pool = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="answer-eval")
+        self._sessions = {}               # interviewId -> {"updatedAt": .., "answers": {index: entry}}
+        self._lock = threading.Lock()
+
+    # -------------------------
+    # 답변 하나 평가 예약
+    # -------------------------
+    def schedule(self, interview_id, index, question, answer):
+        question, answer = question.strip(), answer.strip()
+        with self._lock:
+            self._prune()
+            session = self._sessions.setdefault(interview_id, {"answers": {}})
+            session["updatedAt"] = time.time()
+
+            entry = session["answers"].get(index)
+            if entry and entry["question"] == question and entry["answer"] == answer:
+                # 같은 답변이면 다시 평가하지 않습니다. (이전/다음 버튼을 왔다 갔다 한 경우)
+                return False
+
+            if self.store is not None:
+                self.store.save_answer(interview_id, index, question, answer)
+            future = self._pool.submit(bind_context(evaluate_question), self.client, self.model, question, answer)
+            session["answers"][index] = {"question": question, "answer": answer, "future": future}
+
+        if self.store is not None:
+            def save(done):
+                if done.exception() is None:
+                    self.store.save_result(interview_id, index, question, answer, done.result())
+            future.add_done_callback(save)
+        return True
+
+    def has_results(self, interview_id):
+        with self._lock:
+            if interview_id in self._sessions:
+                return True
+        if self.store is not None:
+            return any(entry["result"] for entry in self.store.answers(interview_id).values())
+        return False
+
+    # -------------------------
+    # 최종 제출: 저장된 결과 모으기
+    # -------------------------
+    def collect(self, interview_id, qna_list):
+        """
+        qna_list 와 같은 답변은 미리 평가한 결과를 쓰고,
+        없거나 바뀐 답변만 지금 평가합니다. 총평은 동시에 따로 호출합니다.
+        반환 형식은 evaluate_per_question 과 같습니다.
+        """
+        with self._lock:
+            session = self._sessions.pop(interview_id, {"answers": {}})
+        stored = self.store.answers(interview_id) if self.store is not None else {}
+
+        summary_future = self._pool.submit(bind_context(summarize), self.client, self.model, qna_list)
+        futures = []
+        for index, item in enumerate(qna_list):
+            question, answer = item["question"].strip(), item["answer"].strip()
+            entry = session["answers"].get(index)
+            saved = stored.get(index)
+            if entry and entry["question"] == question and entry["answer"] == answer \
+                    and not _rejected(entry["future"]):
+                # 이 프로세스에서 평가 중이거나 끝난 결과 (입장 제어로 거절됐던 답변은 지금 다시 평가)
+                futures.append(entry["future"])
+            elif saved and saved["result"] and saved["question"] == question and saved["answer"] == answer:
+                # 다른 프로세스가 같은 질문 / 답변으로 평가해서 저장소에 남긴 결과
+                done = Future()
+                done.set_result(saved["result"])
+                futures.append(done)
+            else:
+                futures.append(self._pool.submit(
+                    bind_context(evaluate_question), self.client, self.model, item["question"], item["answer"]
+                ))
+
+        ai_result = merge_question_results(qna_list, futures)
+        ai_result["analysisText"] = summary_text(summary_future)
+        return ai_result
+
+    def _prune(self):
+        now = time.time()
+        expired = [
+            interview_id for interview_id, session in self._sessions.items()
+            if now - session.get("updatedAt", now) > self.ttl
+        ]
+        for interview_id in expired:
+            del self._sessions[interview_id]
+
+
+def build_incremental_evaluator(client, model, store=None):
+    """
+    ANSWER_EVAL_WORKERS  답변 평가를 동시에 돌릴 워커 수 (기본 8)
+    ANSWER_EVAL_TTL      제출되지 않은 면접의 미리 평가한 결과 보관 시간(초, 기본 3600)
+    """
+    return IncrementalEvaluator(
+        client, model, store=store,
+        workers=int(os.getenv("ANSWER_EVAL_WORKERS", "8")),
+        ttl=int(os.getenv("ANSWER_EVAL_TTL", "3600"))
+    )
@@ -0,0 +1,211 @@
+# interview/jobs.py
+# 비동기 평가 작업 큐
+# 제출 요청은 작업 ID 만 받고 바로 돌아가고(202), 평가는 정해진 수의
+# 백그라운드 워커가 처리합니다. 클라이언트는 폴링하거나 SSE 로 결과를 받습니다.
+# 저장소(store, interview/sessions.py)를 넘기면 작업 상태 / 결과를 SQLite 에도 기록합니다.
+# 작업은 받은 프로세스가 실행하지만, 조회는 어느 워커 프로세스가 받아도 됩니다. (serve --workers N)
+import logging
+import os
+import queue
+import threading
+import time
+import uuid
+from collections import deque
+
+from interview.telemetry import bind_context
+
+logger = logging.getLogger("interview.jobs")
+
+# 다른 프로세스의 작업을 기다릴 때 저장소를 다시 읽는 간격(초)
+STORE_POLL_INTERVAL = 0.5
+
+
+class QueueFull(Exception):
+    pass
+
+
+def _percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, int(round(pct / 100 * (len(ordered) - 1))))
+    return round(ordered[index], 3)
+
+
+class JobQueue:
+    def __init__(self, workers=4, max_queue=100, ttl=3600, store=None):
+        self.workers = workers
+        self.ttl = ttl                     # 끝난 작업을 보관하는 시간(초)
+        self.store = store
+        self._queue = queue.Queue(maxsize=max_queue)
+        self._jobs = {}
+        self._cond = threading.Condition()
+        self._threads = []
+        self._running = 0
+        self._completed = 0
+        self._failed = 0
+        self._rejected = 0
+        self._wait_times = deque(maxlen=500)   # 큐에서 기다린 시간
+        self._run_times = deque(maxlen=500)    # 실제 평가에 걸린 시간
+
+    # -------------------------
+    # 워커
+    # -------------------------
+    def _start(self):
+        # 첫 작업이 들어올 때 워커 스레드를 띄웁니다.
+        if self._threads:
+            return
+        for i in range(self.workers):
+            t = threading.Thread(target=self._work, name=f"job-worker-{i}", daemon=True)
+            t.start()
+            self._threads.append(t)
+
+    def _work(self):
+        while True:
+            job_id, fn, args = self._queue.get()
+            with self._cond:
+                job = self._jobs[job_id]
+                job["status"] = "running"
+                job["startedAt"] = time.time()
+                self._running += 1
+                self._wait_times.append(job["startedAt"] - job["createdAt"])
+                self._cond.notify_all()
+                snapshot = dict(job)
+            self._persist(snapshot)
+
+            try:
+                result, error = fn(*args), None
+            except Exception as e:
+                result, error = None, str(e)
+
+            with self._cond:
+                job["finishedAt"] = time.time()
+                self._running -= 1
+                self._run_times.append(job["finishedAt"] - job["startedAt"])
+                if error is None:
+                    job["status"] = "done"
+                    job["result"] = result
+                    self._completed += 1
+                else:
+                    job["status"] = "error"
+                    job["error"] = error
+                    self._failed += 1
+                self._cond.notify_all()
+                snapshot = dict(job)
+            self._persist(snapshot)
+            self._queue.task_done()
+
+    def _persist(self, job):
+        # 저장에 실패해도 이 프로세스에서는 조회할 수 있으므로 작업은 계속합니다.
+        if self.store is None:
+            return
+        try:
+            self.store.save_job(job)
+        except Exception:
+            logger.exception("작업 상태 저장 실패 job=%s", job["jobId"])
+
+    # -------------------------
+    # 작업 등록 / 조회
+    # -------------------------
+    def submit(self, fn, *args):
+        with self._cond:
+            self._start()
+            self._prune()
+            job_id = uuid.uuid4().hex
+            job = self._jobs[job_id] = {"jobId": job_id, "status": "queued", "createdAt": time.time()}
+            try:
+                # 워커 스레드에서도 같은 요청 ID 로 로그/지표가 남도록 contextvar 를 같이 넘깁니다.
+                self._queue.put_nowait((job_id, bind_context(fn), args))
+            except queue.Full:
+                del self._jobs[job_id]
+                self._rejected += 1
+                raise QueueFull()
+            # 워커는 이 잠금을 얻은 뒤에 running 을 기록하므로 queued 가 항상 먼저 저장됩니다.
+            self._persist(dict(job))
+        return job_id
+
+    def get(self, job_id):
+        with self._cond:
+            job = self._jobs.get(job_id)
+            if job:
+                return dict(job)
+        # 다른 워커 프로세스가 받은 작업
+        return self.store.get_job(job_id) if self.store is not None else None
+
+    def wait(self, job_id, timeout):
+        # 상태가 바뀌거나 timeout 이 지날 때까지 기다렸다가 현재 상태를 돌려줍니다.
+        with self._cond:
+            job = self._jobs.get(job_id)
+        if job is None:
+            return self._wait_stored(job_id, timeout)
+
+        with self._cond:
+            status = job["status"]
+            self._cond.wait_for(
+                lambda: job["status"] != status or job["status"] in ("done", "error"),
+                timeout=timeout
+            )
+            return dict(job)
+
+    def _prune(self):
+        now = time.time()
+        expired = [
+            job_id for job_id, job in self._jobs.items()
+            if job.get("finishedAt") and now - job["finishedAt"] > self.ttl
+        ]
+        for job_id in expired:
+            del self._jobs[job_id]
+        if self.store is not None:
+            try:
+                self.store.prune_jobs(self.ttl)
+            except Exception:
+                logger.exception("오래된 작업 정리 실패")
+
+    def _wait_stored(self, job_id, timeout):
+        # 다른 프로세스의 작업은 알림을 받을 수 없으므로 저장소를 짧게 다시 읽습니다.
+        job = self.get(job_id)
+        deadline = time.monotonic() + timeout
+        while job is not None and job["status"] not in ("done", "error"):
+            remaining = deadline - time.monotonic()
+            if remaining <= 0:
+                break
+            time.sleep(min(STORE_POLL_INTERVAL, remaining))
+            latest = self.get(job_id)
+            if latest is None or latest["status"] != job["status"]:
+                return latest
+            job = latest
+        return job
+
+    def stats(self):
+        with self._cond:
+            return {
+                "queueDepth": self._queue.qsize(),
+                "running": self._running,
+                "completed": self._completed,
+                "failed": self._failed,
+                "rejected": self._rejected,
+                "workers": self.workers,
+                "waitSeconds": {
+                    "p50": _percentile(self._wait_times, 50),
+                    "p95": _percentile(self._wait_times, 95),
+                },
+                "runSeconds": {
+                    "p50": _percentile(self._run_times, 50),
+                    "p95": _percentile(self._run_times, 95),
+                },
+            }
+
+
+def build_job_queue(store=None):
+    """
+    JOB_WORKERS    평가를 동시에 돌릴 워커 수 (기본 4)
+    JOB_MAX_QUEUE  대기열 최대 길이, 넘치면 503 (기본 100)
+    JOB_TTL        끝난 작업 결과 보관 시간(초, 기본 3600)
+    store 를 넘기면 작업 상태를 SQLite 에도 기록합니다. (여러 워커 프로세스에서 조회)
+    """
+    return JobQueue(
+        workers=int(os.getenv("JOB_WORKERS", "4")),
+        max_queue=int(os.getenv("JOB_MAX_QUEUE", "100")),
+        ttl=int(os.getenv("JOB_TTL", "3600")),
+        store=store
+    )
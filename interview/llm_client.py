@@ -0,0 +1,220 @@
+# interview/llm_client.py
+# 모든 핸들러가 같이 쓰는 OpenAI 클라이언트
+# - 연결 풀(keep-alive, 최대 연결 수)을 한 번만 만들어서 공유합니다.
+# - 호출마다 timeout 을 걸고, 429 / 5xx / 네트워크 오류는 지수 백오프 + 지터로 재시도합니다.
+# - 연속으로 실패하면 서킷 브레이커가 열려서, 느린 업스트림 뒤에 워커가 쌓이지 않고 바로 실패합니다.
+#
+# 기존 코드처럼 client.chat.completions.create(...) 로 그대로 쓰면 됩니다.
+# - openai / httpx 는 import 만 해도 수백 ms 가 걸려서, 실제로 클라이언트를 만들 때 import 합니다.
+#   앱에서는 LazyClient 를 넘겨 두면 첫 LLM 호출 때 get_client() 가 불립니다. (콜드 스타트 단축)
+import os
+import random
+import threading
+import time
+
+
+# -------------------------
+# 설정 (환경 변수)
+# -------------------------
+LLM_TIMEOUT = float(os.getenv("LLM_TIMEOUT", "60"))                 # 호출 하나의 전체 timeout(초)
+LLM_CONNECT_TIMEOUT = float(os.getenv("LLM_CONNECT_TIMEOUT", "5"))
+LLM_MAX_CONNECTIONS = int(os.getenv("LLM_MAX_CONNECTIONS", "100"))
+LLM_MAX_KEEPALIVE = int(os.getenv("LLM_MAX_KEEPALIVE", "20"))
+LLM_KEEPALIVE_EXPIRY = float(os.getenv("LLM_KEEPALIVE_EXPIRY", "30"))
+LLM_MAX_RETRIES = int(os.getenv("LLM_MAX_RETRIES", "3"))
+LLM_BACKOFF_BASE = float(os.getenv("LLM_BACKOFF_BASE", "0.5"))       # 첫 재시도 대기(초)
+LLM_BACKOFF_MAX = float(os.getenv("LLM_BACKOFF_MAX", "8"))
+LLM_BREAKER_FAILURES = int(os.getenv("LLM_BREAKER_FAILURES", "5"))  # 연속 실패 몇 번에 열지
+LLM_BREAKER_RESET = float(os.getenv("LLM_BREAKER_RESET", "30"))     # 열린 뒤 다시 시도해볼 때까지(초)
+
+
+class CircuitOpenError(Exception):
+    pass
+
+
+# -------------------------
+# 서킷 브레이커
+# -------------------------
+class CircuitBreaker:
+    """
+    closed    : 정상. 연속 실패가 failure_threshold 에 닿으면 open
+    open      : reset_timeout 동안 호출하지 않고 바로 CircuitOpenError
+    half-open : 시간이 지나면 한 번만 시험 호출. 성공하면 closed, 실패하면 다시 open
+    실패는 재시도를 포함한 호출 하나에 한 번만 셉니다. (ResilientClient.call)
+    """
+
+    def __init__(self, failure_threshold=5, reset_timeout=30):
+        self.failure_threshold = failure_threshold
+        self.reset_timeout = reset_timeout
+        self.state = "closed"
+        self.failures = 0
+        self.opened_at = 0.0
+        self._trial_running = False
+        self._lock = threading.Lock()
+
+    def before_call(self):
+        with self._lock:
+            if self.state == "closed":
+                return
+            if self.state == "open" and time.time() - self.opened_at >= self.reset_timeout:
+                self.state = "half-open"
+            if self.state == "half-open" and not self._trial_running:
+                self._trial_running = True
+                return
+            retry_in = max(0.0, self.reset_timeout - (time.time() - self.opened_at))
+            raise CircuitOpenError(f"LLM 서버 상태가 좋지 않아 호출을 잠시 막았습니다. ({retry_in:.0f}초 후 재시도)")
+
+    def record_success(self):
+        with self._lock:
+            self.state = "closed"
+            self.failures = 0
+            self._trial_running = False
+
+    def record_neutral(self):
+        # 업스트림 상태와 상관없는 실패(400 등): 연속 실패 수도 상태도 그대로 두고, 시험 호출 자리만 돌려줍니다.
+        with self._lock:
+            self._trial_running = False
+
+    def record_failure(self):
+        with self._lock:
+            self.failures += 1
+            self._trial_running = False
+            if self.state == "half-open" or self.failures >= self.failure_threshold:
+                self.state = "open"
+                self.opened_at = time.time()
+
+
+# -------------------------
+# 재시도 대상 판별
+# -------------------------
+def _is_retryable(error):
+    import openai
+
+    if isinstance(error, (openai.APITimeoutError, openai.APIConnectionError, openai.RateLimitError)):
+        return True
+    if isinstance(error, openai.APIStatusError):
+        return error.status_code >= 500
+    return False
+
+
+def _is_timeout(error):
+    import openai
+
+    return isinstance(error, openai.APITimeoutError)
+
+
+def _retry_after(error):
+    # 서버가 Retry-After 를 주면 그 값을 우선합니다.
+    response = getattr(error, "response", None)
+    value = response.headers.get("retry-after") if response is not None else None
+    try:
+        return float(value) if value else None
+    except ValueError:
+        return None
+
+
+def backoff_delay(attempt, base=None, cap=None):
+    # full jitter: 0 ~ min(cap, base * 2^attempt) 사이에서 무작위
+    base = LLM_BACKOFF_BASE if base is None else base
+    cap = LLM_BACKOFF_MAX if cap is None else cap
+    return random.uniform(0, min(cap, base * (2 ** attempt)))
+
+
+# -------------------------
+# 재시도 + 서킷 브레이커를 거치는 클라이언트
+# -------------------------
+class _Completions:
+    def __init__(self, owner):
+        self._owner = owner
+
+    def create(self, **kwargs):
+        return self._owner.call(self._owner.raw.chat.completions.create, **kwargs)
+
+
+class _Chat:
+    def __init__(self, owner):
+        self.completions = _Completions(owner)
+
+
+class ResilientClient:
+    def __init__(self, raw_client, breaker=None, max_retries=None, timeout=None, sleep=time.sleep):
+        self.raw = raw_client
+        self.breaker = breaker or CircuitBreaker(LLM_BREAKER_FAILURES, LLM_BREAKER_RESET)
+        self.max_retries = LLM_MAX_RETRIES if max_retries is None else max_retries
+        self.timeout = LLM_TIMEOUT if timeout is None else timeout
+        self.chat = _Chat(self)
+        self._sleep = sleep
+
+    def call(self, fn, retry_timeouts=True, **kwargs):
+        # retry_timeouts=False: timeout 은 재시도하지 않고 바로 올립니다.
+        # (라우터처럼 시간 예산 안에서 더 빠른 모델로 바꿔 부르는 쪽이 직접 처리할 때)
+        kwargs.setdefault("timeout", self.timeout)
+        attempt = 0
+        # 브레이커는 재시도까지 포함한 호출 하나를 한 번으로 봅니다. (재시도마다 세면 호출 두 번 만에 열림)
+        self.breaker.before_call()
+        while True:
+            try:
+                result = fn(**kwargs)
+            except Exception as e:
+                if not _is_retryable(e):
+                    # 요청 자체가 잘못된 경우(400 등)는 업스트림 장애가 아니므로 성공으로도 실패로도 세지 않습니다.
+                    self.breaker.record_neutral()
+                    raise
+                if attempt >= self.max_retries or (not retry_timeouts and _is_timeout(e)):
+                    self.breaker.record_failure()
+                    raise
+                delay = _retry_after(e)
+                if delay is None:
+                    delay = backoff_delay(attempt)
+                self._sleep(min(delay, LLM_BACKOFF_MAX))
+                attempt += 1
+                continue
+            except BaseException:
+                # 호출이 중간에 끊긴 경우 (시험 호출 자리를 붙잡고 있지 않도록)
+                self.breaker.record_neutral()
+                raise
+
+            self.breaker.record_success()
+            return result
+
+
+# -------------------------
+# 공용 클라이언트 (프로세스당 하나)
+# -------------------------
+_client = None
+_client_lock = threading.Lock()
+
+
+def get_client(api_key=None):
+    global _client
+    with _client_lock:
+        if _client is None:
+            import httpx
+            import openai
+
+            http_client = openai.DefaultHttpxClient(
+                limits=httpx.Limits(
+                    max_connections=LLM_MAX_CONNECTIONS,
+                    max_keepalive_connections=LLM_MAX_KEEPALIVE,
+                    keepalive_expiry=LLM_KEEPALIVE_EXPIRY
+                ),
+                timeout=httpx.Timeout(LLM_TIMEOUT, connect=LLM_CONNECT_TIMEOUT)
+            )
+            raw = openai.OpenAI(
+                api_key=api_key or os.getenv("OPENAI_API_KEY"),
+                http_client=http_client,
+                max_retries=0   # 재시도는 ResilientClient 가 직접 합니다.
+            )
+            _client = ResilientClient(raw)
+        return _client
+
+
+class LazyClient:
+    """get_client() 를 처음 쓸 때 부르는 자리 표시자. (앱을 만들 때는 openai 를 import 하지 않음)"""
+
+    def __init__(self, api_key=None):
+        self._api_key = api_key
+
+    def __getattr__(self, name):
+        # chat / raw / breaker 등 모든 속성을 실제 공용 클라이언트로 넘깁니다.
+        return getattr(get_client(self._api_key), name)
@@ -0,0 +1,304 @@
+# interview/llm_json.py
+# LLM 응답(JSON) 공용 파서
+# - 정상 JSON 이면 json.loads 한 번으로 끝납니다. (대부분의 경우)
+# - 실패하면 앞뒤 설명문/코드블록을 건너뛰고 첫 번째로 짝이 맞는 { ... } 를 한 번 훑어서 찾습니다.
+# - 흔한 형식 오류는 모델을 다시 부르지 않고 고칩니다.
+#     trailing comma  : [1, 2,]  {"a": 1,}
+#     잘린 응답        : 마지막으로 온전한 값까지만 남기고 괄호를 닫음
+#     문자열 숫자      : "85", "85점" -> 85 (스키마에 숫자로 적힌 필드만)
+# - 엔드포인트별 스키마로 검사하고, 고친 횟수 / 실패 횟수를 parse_stats() 로 집계합니다.
+import json
+import re
+import threading
+from collections import Counter
+
+from interview.telemetry import stage
+
+
+class StructuredOutputError(ValueError):
+    pass
+
+
+# -------------------------
+# 스키마
+# -------------------------
+# str / int / float      : 해당 타입 (float 는 정수/실수 모두)
+# ("high", "low", ...)   : 이 값들 중 하나
+# [스키마]               : 각 항목이 스키마를 만족하는 리스트
+# {"키": 스키마}          : 적힌 키는 필수, 나머지 키는 그대로 통과
+# {"*": 스키마}           : 모든 값이 스키마를 만족하는 dict ("1", "2" 같은 질문 번호 키)
+# Optional(스키마, 기본값): 없으면 기본값을 채움
+class Optional:
+    def __init__(self, schema, default=None):
+        self.schema = schema
+        self.default = default
+
+
+_NUMBER_TEXT = re.compile(r"^\s*(-?\d+(?:\.\d+)?)\s*(점|%)?\s*$")
+
+
+def _number(value, schema, path, repairs):
+    if isinstance(value, bool):
+        raise StructuredOutputError(f"{path}: 숫자가 아닙니다.")
+    if isinstance(value, str):
+        match = _NUMBER_TEXT.match(value)
+        if not match:
+            raise StructuredOutputError(f"{path}: 숫자가 아닙니다.")
+        repairs.append("string_number")
+        value = float(match.group(1))
+    if not isinstance(value, (int, float)):
+        raise StructuredOutputError(f"{path}: 숫자가 아닙니다.")
+    if schema is int and not isinstance(value, int):
+        if not value.is_integer():
+            repairs.append("rounded_number")
+        value = round(value)
+    elif isinstance(value, float) and value.is_integer():
+        value = int(value)
+    return value
+
+
+def _validate(value, schema, path, repairs, truncated):
+    if isinstance(schema, Optional):
+        schema = schema.schema
+
+    if schema is str:
+        if not isinstance(value, str):
+            raise StructuredOutputError(f"{path}: 문자열이 아닙니다.")
+        return value
+
+    if schema is int or schema is float:
+        return _number(value, schema, path, repairs)
+
+    if isinstance(schema, tuple):
+        if value in schema:
+            return value
+        if isinstance(value, str) and value.strip().lower() in schema:
+            repairs.append("enum_case")
+            return value.strip().lower()
+        raise StructuredOutputError(f"{path}: {', '.join(schema)} 중 하나가 아닙니다.")
+
+    if isinstance(schema, list):
+        if not isinstance(value, list):
+            raise StructuredOutputError(f"{path}: 리스트가 아닙니다.")
+        items = []
+        for i, item in enumerate(value):
+            try:
+                items.append(_validate(item, schema[0], f"{path}[{i}]", repairs, truncated))
+            except StructuredOutputError:
+                # 잘린 응답의 마지막 항목은 반쯤 만들어졌을 수 있으므로 버립니다.
+                if truncated and i == len(value) - 1:
+                    repairs.append("dropped_partial_item")
+                    break
+                raise
+        return items
+
+    if isinstance(schema, dict):
+        if not isinstance(value, dict):
+            raise StructuredOutputError(f"{path}: 객체가 아닙니다.")
+        result = dict(value)
+        for key, sub in schema.items():
+            if key == "*":
+                for k, v in value.items():
+                    result[k] = _validate(v, sub, f"{path}.{k}", repairs, truncated)
+            elif key in value:
+                result[key] = _validate(value[key], sub, f"{path}.{key}", repairs, truncated)
+            elif isinstance(sub, Optional):
+                result[key] = json.loads(json.dumps(sub.default))   # 기본값 복사
+            else:
+                raise StructuredOutputError(f"{path}.{key}: 필수 항목이 없습니다.")
+        return result
+
+    raise TypeError(f"알 수 없는 스키마: {schema!r}")
+
+
+def validate(data, schema, repairs=None, truncated=False):
+    return _validate(data, schema, "$", [] if repairs is None else repairs, truncated)
+
+
+# -------------------------
+# 첫 번째 JSON 객체 찾기 (한 번 훑기)
+# -------------------------
+_SIGNIFICANT = re.compile(r"\S")
+
+
+def _string_end(text, i):
+    # text[i] 가 여는 따옴표일 때 닫는 따옴표 다음 위치. 끝까지 안 닫히면 -1
+    j = i + 1
+    while True:
+        j = text.find('"', j)
+        if j == -1:
+            return -1
+        k = j - 1
+        while text[k] == "\\":
+            k -= 1
+        if (j - 1 - k) % 2 == 0:
+            return j + 1
+        j += 1
+
+
+def scan_object(text, start):
+    """
+    text[start] 의 "{" 부터 한 번 훑습니다.
+    반환: (end, commas, cut, closers)
+      end     : 짝이 맞는 "}" 다음 위치 (끝까지 안 닫혔으면 None)
+      commas  : 닫는 괄호 바로 앞이라 지워야 하는 쉼표 위치들
+      cut     : 잘린 경우, 마지막으로 온전한 값이 끝난 위치
+      closers : 잘린 경우 cut 뒤에 붙일 닫는 괄호들
+    """
+    stack = []
+    commas = []
+    pending_comma = -1
+    prev = ""
+    cut, cut_depth = start + 1, 1
+    n = len(text)
+    i = start
+
+    while i < n:
+        ch = text[i]
+        if ch == '"':
+            is_value = stack[-1] == "[" or prev == ":"
+            end = _string_end(text, i)
+            if end == -1:
+                break
+            i = end
+            prev = '"'
+            pending_comma = -1
+            if is_value:
+                cut, cut_depth = i, len(stack)
+        else:
+            if ch == "{" or ch == "[":
+                stack.append(ch)
+                pending_comma = -1
+                cut, cut_depth = i + 1, len(stack)
+            elif ch == "}" or ch == "]":
+                if pending_comma >= 0:
+                    commas.append(pending_comma)
+                    pending_comma = -1
+                stack.pop()
+                if not stack:
+                    return i + 1, commas, None, ""
+                cut, cut_depth = i + 1, len(stack)
+            elif ch == ",":
+                if pending_comma >= 0:
+                    commas.append(pending_comma)     # ",," 앞쪽 쉼표
+                pending_comma = i
+                cut, cut_depth = i, len(stack)
+            else:
+                pending_comma = -1
+            prev = ch
+            i += 1
+
+        match = _SIGNIFICANT.search(text, i)
+        if match is None:
+            break
+        i = match.start()
+
+    closers = "".join("}" if c == "{" else "]" for c in reversed(stack[:cut_depth]))
+    return None, commas, cut, closers
+
+
+def _join_without(text, start, end, positions):
+    parts = []
+    last = start
+    for pos in positions:
+        if pos >= end:
+            break
+        parts.append(text[last:pos])
+        last = pos + 1
+    parts.append(text[last:end])
+    return "".join(parts)
+
+
+def extract_object(text, max_attempts=3):
+    """
+    설명문 / 코드블록 / 잘림이 섞인 text 에서 JSON 객체를 꺼냅니다.
+    반환: (data, repairs, truncated)
+    """
+    start = text.find("{")
+    attempts = 0
+    while start != -1 and attempts < max_attempts:
+        end, commas, cut, closers = scan_object(text, start)
+        repairs = []
+        if end is not None:
+            body = _join_without(text, start, end, commas)
+            if start > 0 or text[end:].strip():
+                repairs.append("extracted")
+        else:
+            body = _join_without(text, start, cut, commas) + closers
+            repairs.append("truncated")
+        if any(pos < (end or cut) for pos in commas):
+            repairs.append("trailing_comma")
+
+        try:
+            return json.loads(body), repairs, end is None
+        except ValueError:
+            start = text.find("{", start + 1)
+            attempts += 1
+
+    raise StructuredOutputError("AI 응답에서 JSON 객체를 찾지 못했습니다.")
+
+
+# -------------------------
+# 집계
+# -------------------------
+class ParseStats:
+    def __init__(self):
+        self._lock = threading.Lock()
+        self._counts = {}
+
+    def record(self, name, outcome, repairs=()):
+        with self._lock:
+            entry = self._counts.setdefault(name, {"ok": 0, "repaired": 0, "failed": 0, "repairs": Counter()})
+            entry[outcome] += 1
+            entry["repairs"].update(repairs)
+
+    def snapshot(self):
+        with self._lock:
+            return {
+                name: {**entry, "repairs": dict(entry["repairs"])}
+                for name, entry in self._counts.items()
+            }
+
+
+_stats = ParseStats()
+
+
+def parse_stats():
+    return _stats.snapshot()
+
+
+# -------------------------
+# 파싱 + 검사
+# -------------------------
+def parse_llm_json(raw, schema=None, name="default"):
+    """
+    LLM 응답 문자열을 dict 로 바꾸고 schema 로 검사합니다.
+    고칠 수 없으면 StructuredOutputError.
+    name 은 집계용 엔드포인트 이름입니다.
+    """
+    with stage("parse", name):
+        return _parse(raw, schema, name)
+
+
+def _parse(raw, schema, name):
+    repairs = []
+    truncated = False
+    try:
+        try:
+            data = json.loads(raw)
+        except (TypeError, ValueError):
+            if not isinstance(raw, str):
+                raise StructuredOutputError("AI 응답이 비어 있습니다.")
+            data, repairs, truncated = extract_object(raw)
+
+        if not isinstance(data, dict):
+            raise StructuredOutputError("AI 응답이 JSON 객체가 아닙니다.")
+        if schema is not None:
+            data = validate(data, schema, repairs, truncated)
+
+    except StructuredOutputError:
+        _stats.record(name, "failed", repairs)
+        raise
+
+    _stats.record(name, "repaired" if repairs else "ok", repairs)
+    return data
@@ -0,0 +1,126 @@
+# interview/pdf.py
+# PDF 텍스트 추출 단계
+# - 페이지를 몇 장씩 묶어서 프로세스 풀에 나눠 맡깁니다.
+# - 글자 수 / 페이지 수 예산을 넘으면 남은 작업은 취소하고 바로 멈춥니다.
+# - 결과는 항상 페이지 순서대로 모아서 마지막에 한 번만 join 합니다.
+# - 디스크에 받은 큰 업로드는 경로를 넘기면 mmap 으로 열어서 메모리로 복사하지 않습니다.
+#   (프로세스 풀 워커에도 바이트 대신 경로만 보냅니다.)
+import io
+import mmap
+import os
+from concurrent.futures import ProcessPoolExecutor
+
+
+# -------------------------
+# 설정 (환경 변수)
+# -------------------------
+PDF_MAX_PAGES = int(os.getenv("PDF_MAX_PAGES", "30"))              # 읽을 최대 페이지 수
+PDF_MAX_CHARS = int(os.getenv("PDF_MAX_CHARS", "20000"))           # 모을 최대 글자 수
+PDF_WORKERS = int(os.getenv("PDF_WORKERS", str(min(4, os.cpu_count() or 1))))
+PDF_PAGES_PER_TASK = int(os.getenv("PDF_PAGES_PER_TASK", "4"))     # 작업 하나가 맡는 페이지 수
+PDF_PARALLEL_MIN_PAGES = int(os.getenv("PDF_PARALLEL_MIN_PAGES", "8"))  # 이보다 작으면 그냥 순서대로
+
+_pool = None
+
+
+def _get_pool():
+    global _pool
+    if _pool is None:
+        _pool = ProcessPoolExecutor(max_workers=PDF_WORKERS)
+    return _pool
+
+
+# -------------------------
+# PDF 열기 (바이트 / 파일 경로)
+# -------------------------
+class _Source:
+    """bytes 면 BytesIO, 파일 경로면 읽기 전용 mmap 으로 PdfReader 를 엽니다."""
+
+    def __init__(self, source):
+        self._file = self._map = None
+        if isinstance(source, (bytes, bytearray)):
+            self.stream = io.BytesIO(source)
+        else:
+            self._file = open(source, "rb")
+            self._map = mmap.mmap(self._file.fileno(), 0, access=mmap.ACCESS_READ)
+            self.stream = self._map
+
+    def __enter__(self):
+        # PyPDF2 는 첫 PDF 를 열 때 import 합니다. (앱 시작 시간 단축)
+        import PyPDF2
+        return PyPDF2.PdfReader(self.stream)
+
+    def __exit__(self, *exc):
+        if self._map is not None:
+            try:
+                self._map.close()
+            except BufferError:
+                # 아직 mmap 을 가리키는 객체가 있으면 참조가 사라질 때 닫힙니다.
+                pass
+            self._file.close()
+
+
+# -------------------------
+# 프로세스 풀 작업 (페이지 범위 하나)
+# -------------------------
+def _extract_range(source, start, end):
+    with _Source(source) as reader:
+        return [reader.pages[i].extract_text() or "" for i in range(start, end)]
+
+
+# -------------------------
+# PDF -> 텍스트
+# -------------------------
+def extract_pdf_text(source, max_pages=None, max_chars=None):
+    """source: PDF 바이트 또는 디스크에 있는 PDF 파일 경로"""
+    with _Source(source) as reader:
+        return _extract_pages(reader, source, max_pages, max_chars)
+
+
+def _extract_pages(reader, source, max_pages=None, max_chars=None):
+    max_pages = PDF_MAX_PAGES if max_pages is None else max_pages
+    max_chars = PDF_MAX_CHARS if max_chars is None else max_chars
+
+    page_count = min(len(reader.pages), max_pages)
+
+    pages = []
+    chars = 0
+
+    if page_count < PDF_PARALLEL_MIN_PAGES or PDF_WORKERS <= 1:
+        # 작은 파일은 프로세스를 띄우는 비용이 더 크므로 여기서 바로 읽습니다.
+        for i in range(page_count):
+            text = reader.pages[i].extract_text() or ""
+            pages.append(text)
+            chars += len(text) + 1
+            if chars >= max_chars:
+                break
+    else:
+        ranges = [
+            (start, min(start + PDF_PAGES_PER_TASK, page_count))
+            for start in range(0, page_count, PDF_PAGES_PER_TASK)
+        ]
+        pool = _get_pool()
+
+        # 워커 수만큼만 미리 보내고, 앞에서부터 결과를 받으면서 다음 범위를 보냅니다.
+        # 이렇게 하면 예산을 채운 순간 뒤쪽 범위는 아예 시작하지 않습니다.
+        pending = [pool.submit(_extract_range, source, s, e) for s, e in ranges[:PDF_WORKERS]]
+        next_range = len(pending)
+
+        while pending:
+            future = pending.pop(0)
+            for text in future.result():
+                pages.append(text)
+                chars += len(text) + 1
+                if chars >= max_chars:
+                    break
+            if chars >= max_chars:
+                for rest in pending:
+                    rest.cancel()
+                break
+            if next_range < len(ranges):
+                s, e = ranges[next_range]
+                pending.append(pool.submit(_extract_range, source, s, e))
+                next_range += 1
+
+    text = "\n".join(pages) + "\n"
+    return text[:max_chars]
@@ -0,0 +1,160 @@
+# interview/prompt_budget.py
+# 질문 생성 프롬프트에 넣을 자기소개서/이력서(intro)를 토큰 예산 안으로 줄입니다.
+# 1) 빈 줄, 페이지 번호 같은 상투적인 줄, 중복된 줄을 지웁니다.
+# 2) 그래도 예산을 넘으면 문단(섹션)을 직무명과의 어휘 유사도(BM25)로 순위를 매겨
+#    점수가 높은 섹션만 원래 순서대로 남깁니다.
+# 네트워크나 모델 호출 없이 로컬에서만 계산합니다.
+import math
+import os
+import re
+from collections import Counter
+
+PROMPT_INTRO_TOKEN_BUDGET = int(os.getenv("PROMPT_INTRO_TOKEN_BUDGET", "1500"))
+
+try:
+    # tiktoken 이 설치되어 있으면 실제 토크나이저로 셉니다. (선택 사항)
+    import tiktoken
+    _encoding = tiktoken.get_encoding("o200k_base")
+except Exception:
+    _encoding = None
+
+
+# -------------------------
+# 토큰 수 세기
+# -------------------------
+_ASCII_RUN = re.compile(r"[\x00-\x7f]+")
+
+
+def count_tokens(text):
+    if _encoding is not None:
+        return len(_encoding.encode(text))
+    # 대략적인 추정: 영문/숫자는 4글자에 1토큰, 한글 등은 1글자에 1토큰
+    ascii_chars = sum(len(run) for run in _ASCII_RUN.findall(text))
+    return math.ceil(ascii_chars / 4) + (len(text) - ascii_chars)
+
+
+# -------------------------
+# 상투적인 줄 / 중복 줄 제거
+# -------------------------
+_BOILERPLATE = [
+    re.compile(r"^[-–—\s]*\d+\s*[-–—\s]*$"),                       # - 3 -
+    re.compile(r"^(page|p\.)\s*\d+(\s*(/|of)\s*\d+)?$", re.I),      # Page 2 of 5
+    re.compile(r"^\d+\s*/\s*\d+$"),                                 # 2 / 5
+    re.compile(r"^[\W_]+$"),                                        # ===== , ・・・
+    re.compile(r"^(이력서|자기소개서|경력기술서|resume|curriculum vitae|cv)$", re.I),
+    re.compile(r"위 (기재 )?사항(은|이) 사실과 (틀림|다름)(이|) 없"),
+    re.compile(r"^(confidential|all rights reserved)", re.I),
+]
+
+
+def clean_lines(text):
+    seen = set()
+    lines = []
+    for line in text.splitlines():
+        line = " ".join(line.split())
+        if not line:
+            # 문단 구분은 섹션을 나눌 때 필요하므로 빈 줄 하나만 남깁니다.
+            if lines and lines[-1] != "":
+                lines.append("")
+            continue
+        if any(p.search(line) for p in _BOILERPLATE):
+            continue
+        key = line.casefold()
+        if key in seen:
+            continue
+        seen.add(key)
+        lines.append(line)
+    return "\n".join(lines).strip()
+
+
+# -------------------------
+# 어휘 기반 섹션 순위 (BM25)
+# -------------------------
+_WORD = re.compile(r"[a-z0-9+#.]+|[가-힣]+", re.I)
+
+
+def lexical_terms(text):
+    # 영문은 단어 단위, 한글은 띄어쓰기가 들쭉날쭉하므로 2글자 단위(bigram)로 나눕니다.
+    terms = []
+    for word in _WORD.findall(text.casefold()):
+        if word[0] < "\x80":
+            terms.append(word)
+        elif len(word) == 1:
+            terms.append(word)
+        else:
+            terms.extend(word[i:i + 2] for i in range(len(word) - 1))
+    return terms
+
+
+def bm25_scores(query, documents, k1=1.5, b=0.75):
+    query_terms = set(lexical_terms(query))
+    doc_terms = [Counter(lexical_terms(doc)) for doc in documents]
+    if not documents:
+        return []
+
+    avg_len = sum(sum(c.values()) for c in doc_terms) / len(documents) or 1
+    doc_freq = Counter(term for counts in doc_terms for term in counts)
+
+    scores = []
+    for counts in doc_terms:
+        length = sum(counts.values())
+        score = 0.0
+        for term in query_terms:
+            tf = counts.get(term, 0)
+            if not tf:
+                continue
+            idf = math.log(1 + (len(documents) - doc_freq[term] + 0.5) / (doc_freq[term] + 0.5))
+            score += idf * tf * (k1 + 1) / (tf + k1 * (1 - b + b * length / avg_len))
+        scores.append(score)
+    return scores
+
+
+def split_sections(text):
+    return [section for section in text.split("\n\n") if section.strip()]
+
+
+# -------------------------
+# 예산 맞추기
+# -------------------------
+def fit_intro(intro, job, budget=None):
+    """
+    intro 를 정리하고 budget 토큰 안으로 줄인 텍스트와 통계를 돌려줍니다.
+    stats = {"originalTokens": .., "finalTokens": .., "savedTokens": .., "droppedSections": ..}
+    """
+    budget = PROMPT_INTRO_TOKEN_BUDGET if budget is None else budget
+    original_tokens = count_tokens(intro)
+
+    text = clean_lines(intro)
+    dropped = 0
+
+    if count_tokens(text) > budget:
+        sections = split_sections(text)
+        section_tokens = [count_tokens(section) for section in sections]
+        scores = bm25_scores(job, sections)
+
+        # 점수가 높은 섹션부터 담고, 같은 점수면 앞쪽(보통 자기소개서 본문)을 먼저 담습니다.
+        order = sorted(range(len(sections)), key=lambda i: (-scores[i], i))
+        keep = set()
+        used = 0
+        for i in order:
+            if used + section_tokens[i] <= budget:
+                keep.add(i)
+                used += section_tokens[i]
+
+        if not keep and sections:
+            # 섹션 하나가 예산보다 크면 가장 관련 있는 섹션을 글자 수로 잘라서라도 넣습니다.
+            best = order[0]
+            ratio = budget / max(section_tokens[best], 1)
+            sections[best] = sections[best][:int(len(sections[best]) * ratio)]
+            keep.add(best)
+
+        dropped = len(sections) - len(keep)
+        text = "\n\n".join(sections[i] for i in sorted(keep))
+
+    final_tokens = count_tokens(text)
+    return text, {
+        "originalTokens": original_tokens,
+        "finalTokens": final_tokens,
+        "savedTokens": max(0, original_tokens - final_tokens),
+        "droppedSections": dropped,
+    }
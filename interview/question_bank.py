@@ -0,0 +1,273 @@
+# interview/question_bank.py
+# 미리 만들어 둔 직무별 질문 은행 + 로컬 TF-IDF 검색
+# - 트래픽 대부분이 같은 몇십 개 직무라서, (직무, 경력) 마다 질문을 미리 넉넉히 만들어 두고
+#   면접 생성 때는 자기소개서와 가장 관련 있는 질문을 골라서 바로 돌려줍니다. (LLM 호출 없음)
+# - 은행에 질문이 모자란 만큼만 LLM 으로 채웁니다.
+# - 검색은 prompt_budget.lexical_terms (영문 단어 + 한글 2글자) 기반 TF-IDF 코사인 유사도이고
+#   네트워크를 쓰지 않습니다.
+#
+# 은행 만들기 (오프라인):
+#   python -m interview.question_bank jobs.txt -o question_bank.json --per-job 20
+#   python -m interview.question_bank --from-sessions interview_sessions.db --top 30 -o question_bank.json
+#   jobs.txt 는 한 줄에 "직무<TAB>경력" (경력은 생략 가능)
+import argparse
+import json
+import math
+import os
+import sqlite3
+import sys
+import threading
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+
+from dotenv import load_dotenv
+
+# interview.* 모듈은 import 할 때 환경 변수를 읽으므로 .env 를 먼저 불러옵니다.
+load_dotenv()
+
+from interview.llm_client import get_client  # noqa: E402
+from interview.llm_json import parse_llm_json  # noqa: E402
+from interview.prompt_budget import lexical_terms  # noqa: E402
+
+QUESTION_BANK_PATH = os.getenv("QUESTION_BANK_PATH", "question_bank.json")
+# 이미 고른 질문과 이 값보다 비슷하면 건너뜁니다. (비슷한 질문 두 개가 같이 나오지 않게)
+QUESTION_BANK_MAX_OVERLAP = float(os.getenv("QUESTION_BANK_MAX_OVERLAP", "0.6"))
+
+BANK_SCHEMA = {"questions": [str]}
+
+
+def bank_key(job, experience):
+    return f"{' '.join(job.split()).casefold()}|{' '.join(experience.split()).casefold()}"
+
+
+# -------------------------
+# TF-IDF 벡터
+# -------------------------
+def _tf(text):
+    return Counter(lexical_terms(text))
+
+
+def _vector(counts, idf):
+    vec = {term: (1 + math.log(tf)) * idf.get(term, 0.0) for term, tf in counts.items()}
+    norm = math.sqrt(sum(v * v for v in vec.values()))
+    return {term: v / norm for term, v in vec.items()} if norm else {}
+
+
+def _cosine(a, b):
+    if len(a) > len(b):
+        a, b = b, a
+    return sum(v * b.get(term, 0.0) for term, v in a.items())
+
+
+# -------------------------
+# 질문 은행 (읽기 전용 인덱스)
+# -------------------------
+class QuestionBank:
+    def __init__(self, entries):
+        # entries: [{"job": .., "experience": .., "questions": [...]}]
+        self._entries = {}
+        doc_freq = Counter()
+        term_counts = []
+        for entry in entries:
+            questions = [q.strip() for q in entry.get("questions", []) if isinstance(q, str) and q.strip()]
+            counts = [_tf(q) for q in questions]
+            term_counts.append((entry, questions, counts))
+            for c in counts:
+                doc_freq.update(c.keys())
+
+        total = sum(len(questions) for _, questions, _ in term_counts) or 1
+        self.idf = {term: math.log((1 + total) / (1 + df)) + 1 for term, df in doc_freq.items()}
+
+        for entry, questions, counts in term_counts:
+            key = bank_key(entry.get("job", ""), entry.get("experience", ""))
+            self._entries[key] = (questions, [_vector(c, self.idf) for c in counts])
+
+    def __len__(self):
+        return len(self._entries)
+
+    def _lookup(self, job, experience):
+        # (직무, 경력) 이 없으면 경력 구분 없는 항목을 씁니다.
+        return self._entries.get(bank_key(job, experience)) or self._entries.get(bank_key(job, ""))
+
+    def select(self, job, experience, intro, k=5):
+        """
+        자기소개서(intro)와 관련 높은 순으로 최대 k 개 질문을 고릅니다.
+        은행에 해당 직무가 없거나 질문이 모자라면 k 개보다 적게 돌려줍니다.
+        """
+        found = self._lookup(job, experience)
+        if found is None:
+            return []
+        questions, vectors = found
+
+        query = _vector(_tf(intro), self.idf) if intro else {}
+        scores = [_cosine(query, vec) if query else 0.0 for vec in vectors]
+        # 점수가 같으면 은행에 적힌 순서(기본 질문 먼저)를 따릅니다.
+        order = sorted(range(len(questions)), key=lambda i: (-scores[i], i))
+
+        picked = []
+        for i in order:
+            if len(picked) >= k:
+                break
+            if any(_cosine(vectors[i], vectors[j]) > QUESTION_BANK_MAX_OVERLAP for j in picked):
+                continue
+            picked.append(i)
+        return [questions[i] for i in picked]
+
+
+class QuestionBankLoader:
+    """파일이 바뀌면(오프라인 작업이 다시 만들면) 다음 조회 때 다시 읽습니다."""
+
+    def __init__(self, path):
+        self.path = path
+        self._bank = None
+        self._mtime = None
+        self._lock = threading.Lock()
+
+    def get(self):
+        try:
+            mtime = os.stat(self.path).st_mtime
+        except OSError:
+            return None
+        with self._lock:
+            if mtime != self._mtime:
+                with open(self.path, encoding="utf-8") as f:
+                    self._bank = QuestionBank(json.load(f).get("entries", []))
+                self._mtime = mtime
+            return self._bank
+
+    def select(self, job, experience, intro, k=5):
+        bank = self.get()
+        return bank.select(job, experience, intro, k) if bank is not None else []
+
+
+def build_question_bank():
+    """
+    QUESTION_BANK_PATH         질문 은행 JSON 경로 (기본 question_bank.json, 없으면 은행 사용 안 함)
+    QUESTION_BANK_MAX_OVERLAP  고른 질문끼리 허용하는 최대 유사도 (기본 0.6)
+    """
+    return QuestionBankLoader(QUESTION_BANK_PATH)
+
+
+# =====================================================================
+# 오프라인 빌드
+# =====================================================================
+def build_bank_prompt(job, experience, count):
+    return f"""
+당신은 전문 면접관입니다.
+아래 직무와 경력의 지원자에게 실제 면접에서 쓸 질문 {count}개를 만드세요.
+- 처음 몇 개는 누구에게나 물을 수 있는 기본 질문, 나머지는 직무 역량 / 기술 / 경험을 묻는 질문
+- 서로 다른 주제를 다루고, 비슷한 질문은 넣지 마세요.
+
+직무: {job}
+경력: {experience or "무관"}
+
+JSON 형식으로만 응답하세요:
+{{"questions": ["질문1", "질문2", ...]}}
+"""
+
+
+def generate_entry(client, model, job, experience, count):
+    resp = client.chat.completions.create(
+        model=model,
+        messages=[{"role": "user", "content": build_bank_prompt(job, experience, count)}],
+        response_format={"type": "json_object"}
+    )
+    result = parse_llm_json(resp.choices[0].message.content, BANK_SCHEMA, "question_bank")
+
+    seen = set()
+    questions = []
+    for question in result["questions"]:
+        question = question.strip()
+        if question and question.casefold() not in seen:
+            seen.add(question.casefold())
+            questions.append(question)
+    return {"job": job, "experience": experience, "questions": questions}
+
+
+def read_jobs(path):
+    jobs = []
+    with open(path, encoding="utf-8") as f:
+        for line in f:
+            if not line.strip() or line.startswith("#"):
+                continue
+            job, _, experience = line.rstrip("\n").partition("\t")
+            jobs.append((job.strip(), experience.strip()))
+    return jobs
+
+
+def top_jobs_from_sessions(db_path, top):
+    # 실제 트래픽에서 가장 많이 들어온 (직무, 경력) 조합
+    conn = sqlite3.connect(db_path)
+    try:
+        rows = conn.execute(
+            "SELECT job, experience, COUNT(*) AS n FROM sessions GROUP BY job, experience ORDER BY n DESC LIMIT ?",
+            (top,)
+        ).fetchall()
+    finally:
+        conn.close()
+    return [(job, experience) for job, experience, _ in rows]
+
+
+def load_entries(path):
+    if not os.path.exists(path):
+        return []
+    with open(path, encoding="utf-8") as f:
+        return json.load(f).get("entries", [])
+
+
+def save_entries(path, entries):
+    # 서버가 읽는 도중에 반쯤 쓰인 파일을 보지 않도록 임시 파일에 쓰고 바꿔치기합니다.
+    tmp_path = f"{path}.tmp"
+    with open(tmp_path, "w", encoding="utf-8") as f:
+        json.dump({"version": 1, "entries": entries}, f, ensure_ascii=False, indent=2)
+    os.replace(tmp_path, path)
+
+
+def build(client, jobs, output_path, model="gpt-4o-mini", per_job=20, concurrency=4,
+          refresh=False, log=sys.stderr):
+    entries = {bank_key(e["job"], e.get("experience", "")): e for e in load_entries(output_path)}
+    todo = [(job, exp) for job, exp in dict.fromkeys(jobs) if refresh or bank_key(job, exp) not in entries]
+    print(f"[bank] 새로 만들 항목 {len(todo)}개 (기존 {len(entries)}개)", file=log)
+
+    failed = 0
+    with ThreadPoolExecutor(max_workers=concurrency) as pool:
+        futures = {pool.submit(generate_entry, client, model, job, exp, per_job): (job, exp) for job, exp in todo}
+        for future, (job, exp) in futures.items():
+            try:
+                entries[bank_key(job, exp)] = future.result()
+            except Exception as e:
+                failed += 1
+                print(f"[bank] 실패: {job} / {exp}: {e}", file=log)
+
+    save_entries(output_path, list(entries.values()))
+    print(f"[bank] 완료: {len(entries)}개 항목 (실패 {failed}개) -> {output_path}", file=log)
+    return len(entries), failed
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="직무별 면접 질문 은행을 만듭니다.")
+    parser.add_argument("jobs", nargs="?", help="한 줄에 '직무<TAB>경력' 인 텍스트 파일")
+    parser.add_argument("-o", "--output", default=QUESTION_BANK_PATH, help="질문 은행 JSON 파일")
+    parser.add_argument("--from-sessions", help="세션 DB(interview_sessions.db)에서 많이 들어온 직무를 가져옴")
+    parser.add_argument("--top", type=int, default=30, help="--from-sessions 로 가져올 직무 수")
+    parser.add_argument("--per-job", type=int, default=20, help="직무/경력 하나당 만들 질문 수")
+    parser.add_argument("--concurrency", type=int, default=4)
+    parser.add_argument("--model", default="gpt-4o-mini")
+    parser.add_argument("--refresh", action="store_true", help="이미 있는 항목도 다시 만듦")
+    args = parser.parse_args(argv)
+
+    jobs = read_jobs(args.jobs) if args.jobs else []
+    if args.from_sessions:
+        jobs += top_jobs_from_sessions(args.from_sessions, args.top)
+    if not jobs:
+        parser.error("jobs 파일이나 --from-sessions 중 하나는 필요합니다.")
+
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise EnvironmentError("OPENAI_API_KEY 누락됨 (.env 확인)")
+
+    build(get_client(api_key), jobs, args.output, args.model, args.per_job, args.concurrency, args.refresh)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,130 @@
+# interview/resume.py
+# 업로드된 이력서 파일(txt, pdf, docx)에서 텍스트를 뽑는 코드입니다.
+# 같은 파일이 다시 올라오면 파일 내용의 SHA-256 으로 캐시를 찾아서
+# PDF/DOCX 파싱을 아예 건너뜁니다.
+# 파싱 전에 크기와 실제 형식(magic bytes)을 확인하고(interview/uploads.py),
+# 업로드 스트림을 통째로 read() 하지 않고 조각 단위로 읽습니다.
+import codecs
+import hashlib
+import os
+
+from interview.cache import MemoryCache, ResponseCache, SQLiteCache
+from interview.pdf import extract_pdf_text
+from interview.telemetry import stage
+from interview.uploads import check_upload
+
+
+class UnsupportedFileType(ValueError):
+    pass
+
+
+# -------------------------
+# 추출 텍스트 캐시
+# -------------------------
+def build_resume_cache():
+    """
+    RESUME_CACHE_SIZE      메모리 캐시 최대 항목 수 (0 이면 캐시 끔, 기본 128)
+    RESUME_CACHE_TTL       유효 시간(초, 기본 1일)
+    RESUME_CACHE_MAX_BYTES 항목 하나의 최대 크기 (기본 512KB)
+    RESUME_CACHE_DB        SQLite 파일 경로 (지정하면 디스크 계층 사용)
+    RESUME_CACHE_DB_SIZE   디스크 캐시 최대 항목 수 (기본 5000)
+    """
+    size = int(os.getenv("RESUME_CACHE_SIZE", "128"))
+    if size <= 0:
+        return None
+
+    ttl = int(os.getenv("RESUME_CACHE_TTL", "86400"))
+    max_bytes = int(os.getenv("RESUME_CACHE_MAX_BYTES", str(512 * 1024)))
+    memory = MemoryCache(max_entries=size, ttl=ttl, max_entry_bytes=max_bytes)
+
+    disk = None
+    db_path = os.getenv("RESUME_CACHE_DB")
+    if db_path:
+        disk = SQLiteCache(
+            db_path, ttl=ttl, max_entry_bytes=max_bytes,
+            max_entries=int(os.getenv("RESUME_CACHE_DB_SIZE", "5000"))
+        )
+
+    return ResponseCache(memory, disk)
+
+
+resume_cache = build_resume_cache()
+
+
+# -------------------------
+# 형식별 추출
+# -------------------------
+_CHUNK = 64 * 1024
+
+
+def _extract_txt(stream):
+    decoder = codecs.getincrementaldecoder("utf-8")()
+    parts = [decoder.decode(chunk) for chunk in iter(lambda: stream.read(_CHUNK), b"")]
+    parts.append(decoder.decode(b"", final=True))
+    return "".join(parts)
+
+
+def _extract_pdf(stream):
+    # 디스크에 받은 업로드(이름 있는 임시 파일)는 경로로 넘겨서 mmap 으로 엽니다.
+    path = getattr(stream, "name", None)
+    if isinstance(path, str) and os.path.isfile(path):
+        stream.flush()
+        return extract_pdf_text(path)
+    return extract_pdf_text(stream.read())
+
+
+def _extract_docx(stream):
+    # python-docx 는 첫 docx 업로드 때 import 합니다. (앱 시작 시간 단축)
+    import docx
+
+    doc = docx.Document(stream)
+    return "\n".join(p.text for p in doc.paragraphs)
+
+
+_EXTRACTORS = {"txt": _extract_txt, "pdf": _extract_pdf, "docx": _extract_docx}
+
+
+def _extract(kind, stream):
+    stream.seek(0)
+    return _EXTRACTORS[kind](stream)
+
+
+def _sha256(stream):
+    digest = hashlib.sha256()
+    stream.seek(0)
+    for chunk in iter(lambda: stream.read(_CHUNK), b""):
+        digest.update(chunk)
+    stream.seek(0)
+    return digest.hexdigest()
+
+
+# -------------------------
+# 업로드 파일 -> 텍스트
+# -------------------------
+def extract_resume_text(file):
+    """
+    Flask 업로드 파일(FileStorage)을 받아서 텍스트를 돌려줍니다.
+    지원하지 않는 확장자면 UnsupportedFileType,
+    너무 크면 FileTooLarge, 확장자와 내용이 다르면 MislabeledFile 을 (파싱 전에) 던집니다.
+    """
+    filename = file.filename.lower()
+    if not filename.endswith((".txt", ".pdf", ".docx")):
+        raise UnsupportedFileType(filename)
+    extension = filename.rsplit(".", 1)[-1]
+
+    with stage("upload_read"):
+        # 파서는 확장자가 아니라 magic bytes 로 판별한 형식으로 고릅니다.
+        kind = check_upload(file.stream, extension)
+        # 파일 이름이 달라도 내용(SHA-256)과 형식이 같으면 같은 항목입니다.
+        key = f"resume:{kind}:{_sha256(file.stream)}" if resume_cache is not None else None
+
+    if key is not None:
+        cached = resume_cache.get(key)
+        if cached is not None:
+            return cached["text"]
+
+    with stage("extract"):
+        text = _extract(kind, file.stream)
+    if key is not None:
+        resume_cache.set(key, {"text": text})
+    return text
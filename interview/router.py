@@ -0,0 +1,293 @@
+# interview/router.py
+# 지연 시간을 보고 모델을 고르는 라우터
+# - 모델 등급(tier)은 빠른 것부터 LLM_MODEL_TIERS 순서로 둡니다.
+# - 핸들러가 원래 쓰던 모델(preferred)에서 시작해서
+#     1) 프롬프트 토큰 수가 엔드포인트 기준(LLM_LARGE_PROMPT_<ENDPOINT>)을 넘으면 한 단계 빠른 모델로,
+#     2) 그 모델의 최근 p95 지연 시간이 엔드포인트 SLO(LLM_SLO_<ENDPOINT>)를 넘으면 다시 한 단계씩 빠른 모델로
+#   내려갑니다. 호출이 timeout 으로 실패해도 한 단계 빠른 모델로 한 번 더 시도합니다.
+# - 내려갈 더 빠른 모델이 있을 때만 엔드포인트 SLO 를 timeout 으로 걸고, 클라이언트(ResilientClient)의
+#   timeout 재시도는 끕니다. (LLM_TIMEOUT 을 몇 번씩 기다린 뒤에야 빠른 모델로 넘어가지 않도록)
+#   가장 빠른 모델이거나 이미 한 번 내려온 호출은 클라이언트의 LLM_TIMEOUT / 재시도를 그대로 씁니다.
+#   호출하는 쪽이 timeout 을 직접 넘기면 그 값을 씁니다.
+# - 지연 시간은 모델별로 최근 LLM_LATENCY_WINDOW 초 동안만 기억하므로,
+#   느려졌던 모델도 시간이 지나면 다시 선택됩니다.
+# - 라우팅 결정은 "interview.router" 로거로 남겨서 기준값 조정에 씁니다.
+# - 호출마다 LLM 대기 시간(llm_wait 단계)과 resp.usage 토큰 수를 interview/telemetry.py 지표로 남깁니다.
+# - admission 을 붙이면(interview/admission.py) 호출마다 전체 토큰 / 동시 호출 자리를 얻고 부릅니다.
+#   자리는 응답을 받으면(실패해도), 스트리밍은 스트림이 끝나거나 버려지면 돌려줍니다.
+#
+# 사용법: 기존 client 자리에 router.client("submit") 을 넘기면 model 인자는 "원래 쓰려던 모델"이 됩니다.
+import logging
+import os
+import threading
+import time
+import weakref
+from collections import Counter, deque
+
+from interview.prompt_budget import count_tokens
+from interview.telemetry import LLM_REQUESTS, current_endpoint, observe_stage, record_usage
+
+logger = logging.getLogger("interview.router")
+
+LLM_MODEL_TIERS = [m.strip() for m in os.getenv("LLM_MODEL_TIERS", "gpt-5-nano,gpt-4o-mini,gpt-5-mini").split(",")
+                   if m.strip()]
+LLM_LATENCY_WINDOW = float(os.getenv("LLM_LATENCY_WINDOW", "300"))      # p95 계산에 쓰는 최근 구간(초)
+LLM_LATENCY_MIN_SAMPLES = int(os.getenv("LLM_LATENCY_MIN_SAMPLES", "5"))  # 이보다 적으면 p95 를 믿지 않음
+
+# 엔드포인트별 기본값: SLO(초), 큰 프롬프트 기준(토큰)
+DEFAULT_POLICIES = {
+    "create": {"slo": 10, "large_prompt": 3000},
+    "submit": {"slo": 30, "large_prompt": 6000},
+    "answer": {"slo": 15, "large_prompt": 2000},
+    "generate_questions": {"slo": 10, "large_prompt": 3000},
+    "analyze_answer": {"slo": 15, "large_prompt": 2000},
+}
+
+
+def endpoint_policy(endpoint):
+    policy = DEFAULT_POLICIES.get(endpoint, {"slo": 30, "large_prompt": 6000})
+    key = endpoint.upper()
+    return {
+        "slo": float(os.getenv(f"LLM_SLO_{key}", str(policy["slo"]))),
+        "large_prompt": int(os.getenv(f"LLM_LARGE_PROMPT_{key}", str(policy["large_prompt"]))),
+    }
+
+
+# -------------------------
+# 모델별 지연 시간 (최근 구간)
+# -------------------------
+class LatencyTracker:
+    def __init__(self, window=300, max_samples=512):
+        self.window = window
+        self._samples = {}      # model -> deque[(시각, 초)]
+        self._max_samples = max_samples
+        self._lock = threading.Lock()
+
+    def observe(self, model, seconds):
+        with self._lock:
+            samples = self._samples.setdefault(model, deque(maxlen=self._max_samples))
+            samples.append((time.time(), seconds))
+
+    def _recent(self, model):
+        samples = self._samples.get(model)
+        if not samples:
+            return []
+        cutoff = time.time() - self.window
+        while samples and samples[0][0] < cutoff:
+            samples.popleft()
+        return sorted(seconds for _, seconds in samples)
+
+    def p95(self, model, min_samples=1):
+        with self._lock:
+            recent = self._recent(model)
+        if len(recent) < max(min_samples, 1):
+            return None
+        return recent[min(len(recent) - 1, int(len(recent) * 0.95))]
+
+    def stats(self):
+        with self._lock:
+            models = {model: self._recent(model) for model in list(self._samples)}
+        return {
+            model: {
+                "count": len(recent),
+                "p50": round(recent[len(recent) // 2], 3) if recent else None,
+                "p95": round(recent[min(len(recent) - 1, int(len(recent) * 0.95))], 3) if recent else None,
+            }
+            for model, recent in models.items()
+        }
+
+
+# -------------------------
+# 라우터
+# -------------------------
+def _is_timeout(error):
+    # 호출이 실패했을 때만 보므로 openai 는 이미 올라와 있습니다. (모듈 import 때는 불러오지 않음)
+    import openai
+    return isinstance(error, openai.APITimeoutError)
+
+
+def _prompt_tokens(messages):
+    return sum(count_tokens(m.get("content") or "") for m in messages if isinstance(m.get("content"), str))
+
+
+class _Slot:
+    """admission 자리 하나. release() 는 여러 번 불러도 한 번만 돌려줍니다."""
+
+    def __init__(self, admission, lane):
+        self.admission = admission
+        self.lane = lane
+        self._released = False
+        self._lock = threading.Lock()
+
+    def release(self):
+        with self._lock:
+            if self._released:
+                return
+            self._released = True
+        self.admission.release(self.lane)
+
+
+class ModelRouter:
+    def __init__(self, client, tiers=None, tracker=None, min_samples=None):
+        self.raw = client
+        self.tiers = list(tiers or LLM_MODEL_TIERS)
+        self.tracker = tracker or LatencyTracker(LLM_LATENCY_WINDOW)
+        self.min_samples = LLM_LATENCY_MIN_SAMPLES if min_samples is None else min_samples
+        self._decisions = Counter()
+        self._lock = threading.Lock()
+        self.admission = None       # AdmissionController (없으면 제한 없이 부름)
+
+    def choose(self, endpoint, preferred, prompt_tokens):
+        """(모델, 이유) 를 돌려줍니다. 이유: preferred / large_prompt / slo"""
+        if preferred not in self.tiers:
+            # 등급표에 없는 모델은 그대로 씁니다.
+            return preferred, "preferred"
+
+        policy = endpoint_policy(endpoint)
+        index = self.tiers.index(preferred)
+        reason = "preferred"
+
+        if prompt_tokens > policy["large_prompt"] and index > 0:
+            index -= 1
+            reason = "large_prompt"
+
+        while index > 0:
+            p95 = self.tracker.p95(self.tiers[index], self.min_samples)
+            if p95 is None or p95 <= policy["slo"]:
+                break
+            index -= 1
+            reason = "slo"
+
+        return self.tiers[index], reason
+
+    def _faster(self, model):
+        if model in self.tiers and self.tiers.index(model) > 0:
+            return self.tiers[self.tiers.index(model) - 1]
+        return None
+
+    def create(self, endpoint, **kwargs):
+        preferred = kwargs.pop("model")
+        tokens = _prompt_tokens(kwargs.get("messages", []))
+        model, reason = self.choose(endpoint, preferred, tokens)
+        slo = endpoint_policy(endpoint)["slo"]
+
+        while True:
+            with self._lock:
+                self._decisions[(endpoint, model, reason)] += 1
+            logger.info("route endpoint=%s tokens=%d preferred=%s model=%s reason=%s p95=%s",
+                        endpoint, tokens, preferred, model, reason, self.tracker.p95(model))
+
+            faster = None if reason == "timeout" else self._faster(model)
+            options = dict(kwargs)
+            if faster is not None:
+                options.setdefault("timeout", slo)
+                options["retry_timeouts"] = False
+
+            slot = self._enter(endpoint)
+            started = time.perf_counter()
+            try:
+                try:
+                    result = self.raw.chat.completions.create(model=model, **options)
+                except Exception as e:
+                    if not _is_timeout(e):
+                        self._observe(endpoint, model, time.perf_counter() - started, "error")
+                        raise
+                    # 시간 예산을 넘긴 것으로 보고 기록한 뒤, 더 빠른 모델로 한 번 더 시도합니다.
+                    self._observe(endpoint, model, time.perf_counter() - started, "timeout")
+                    if faster is None:
+                        raise
+                    model, reason = faster, "timeout"
+                    continue
+
+                if kwargs.get("stream"):
+                    # 자리는 스트림이 넘겨받아 다 읽거나 끊기면 돌려줍니다.
+                    stream = self._timed_stream(result, endpoint, model, started, slot)
+                    if slot is not None:
+                        # 한 번도 읽지 않고 버린 제너레이터는 finally 가 돌지 않으므로, 사라질 때 돌려줍니다.
+                        weakref.finalize(stream, slot.release)
+                    slot = None
+                    return stream
+                self._observe(endpoint, model, time.perf_counter() - started, "ok", getattr(result, "usage", None))
+                return result
+            finally:
+                # 예외 종류와 상관없이(GreenletExit, gevent Timeout, KeyboardInterrupt 포함) 자리를 돌려줍니다.
+                self._leave(slot)
+
+    def _enter(self, endpoint):
+        # 입장 제어 자리(_Slot)를 돌려줍니다. (제한 없는 엔드포인트면 None, 자리를 못 얻으면 Rejected)
+        lane = self.admission.lane_for(endpoint) if self.admission is not None else None
+        if lane is None:
+            return None
+        observe_stage("admission_wait", self.admission.acquire(lane), endpoint)
+        return _Slot(self.admission, lane)
+
+    def _leave(self, slot):
+        if slot is not None:
+            slot.release()
+
+    def _observe(self, endpoint, model, seconds, status, usage=None):
+        if status != "error":
+            self.tracker.observe(model, seconds)
+        observe_stage("llm_wait", seconds, endpoint)
+        LLM_REQUESTS.inc(endpoint=current_endpoint(endpoint), model=model, status=status)
+        record_usage(usage, model, endpoint)
+
+    def _timed_stream(self, stream, endpoint, model, started, slot=None):
+        # 스트리밍은 마지막 조각까지 받은 시간을 기록합니다.
+        # (stream_options.include_usage 를 켜면 마지막 조각에 usage 가 옵니다.)
+        usage = None
+        status = "error"
+        try:
+            for chunk in stream:
+                usage = getattr(chunk, "usage", None) or usage
+                yield chunk
+            status = "ok"
+        except GeneratorExit:
+            # 클라이언트가 중간에 끊은 경우
+            status = "cancelled"
+            raise
+        finally:
+            self._leave(slot)
+            self._observe(endpoint, model, time.perf_counter() - started, status, usage)
+
+    def client(self, endpoint):
+        return _RoutedClient(self, endpoint)
+
+    def stats(self):
+        with self._lock:
+            decisions = [
+                {"endpoint": endpoint, "model": model, "reason": reason, "count": count}
+                for (endpoint, model, reason), count in sorted(self._decisions.items())
+            ]
+        return {"tiers": self.tiers, "latency": self.tracker.stats(), "decisions": decisions}
+
+
+# client.chat.completions.create(...) 모양을 그대로 흉내 내서 기존 함수에 그대로 넘길 수 있게 합니다.
+class _RoutedCompletions:
+    def __init__(self, router, endpoint):
+        self._router = router
+        self._endpoint = endpoint
+
+    def create(self, **kwargs):
+        return self._router.create(self._endpoint, **kwargs)
+
+
+class _RoutedChat:
+    def __init__(self, router, endpoint):
+        self.completions = _RoutedCompletions(router, endpoint)
+
+
+class _RoutedClient:
+    def __init__(self, router, endpoint):
+        self.chat = _RoutedChat(router, endpoint)
+
+
+def build_model_router(client):
+    """
+    LLM_MODEL_TIERS           빠른 모델부터 쉼표로 (기본 gpt-5-nano,gpt-4o-mini,gpt-5-mini)
+    LLM_SLO_<ENDPOINT>        엔드포인트별 지연 시간 목표(초), 예: LLM_SLO_SUBMIT=20
+    LLM_LARGE_PROMPT_<ENDPOINT> 이 토큰 수를 넘는 프롬프트는 한 단계 빠른 모델 사용
+    LLM_LATENCY_WINDOW        p95 계산 구간(초, 기본 300)
+    LLM_LATENCY_MIN_SAMPLES   p95 를 믿기 위한 최소 호출 수 (기본 5)
+    """
+    return ModelRouter(client)
@@ -0,0 +1,225 @@
+# interview/scoring.py
+# 점수 산출 가중치 매핑(WEIGHT_MAP) / 기준별 최종 점수 계산(calculate_final_scores) / 등급 책정(grade)
+# 그리고 여러 면접을 한 번에 다시 채점하는 NumPy 배치 엔진입니다.
+#
+# 배치 엔진(score_batch)은 calculate_final_scores 와 완전히 같은 결과를 내도록
+# 질문 순서대로 더하고, 반올림도 파이썬 round 로 합니다.
+#
+# 사용법 (저장된 questionWeights / answerScores 재채점):
+#   python -m interview.scoring interviews.jsonl -o rescored.jsonl [--weights weights.json]
+import argparse
+import json
+import numbers
+import sys
+from operator import itemgetter
+
+CRITERIA = ["직무", "논리", "구체성", "키워드", "태도"]
+
+# -------------------------
+# 가중치 매핑
+# -------------------------
+WEIGHT_MAP = {
+    "high": 1.0,
+    "med-high": 0.8,
+    "med": 0.6,
+    "low": 0.4
+}
+
+
+# -------------------------
+# 기준별 최종 점수 계산 (면접 1건)
+# -------------------------
+def calculate_final_scores(question_weights, answer_scores, weight_map=None):
+    weight_map = WEIGHT_MAP if weight_map is None else weight_map
+    criteria_list = CRITERIA
+    final_scores = {c: 0 for c in criteria_list}
+
+    for criterion in criteria_list:
+        weighted_sum = 0
+        weight_total = 0
+
+        for q_num, weights in question_weights.items():
+            weight = weight_map[weights[criterion]]
+            score = answer_scores[q_num][criterion]
+
+            weighted_sum += score * weight
+            weight_total += weight
+
+        final_scores[criterion] = round(weighted_sum / weight_total, 2)
+
+    return final_scores
+
+
+# -------------------------
+# 등급 책정
+# -------------------------
+def grade(score):
+    if score >= 90:
+        return "우수"
+    elif score >= 80:
+        return "양호"
+    elif score >= 70:
+        return "보통"
+    else:
+        return "미흡"
+
+
+def total_score(radar):
+    return round(sum(radar.values()) / len(radar))
+
+
+# -------------------------
+# 배치 채점 (NumPy)
+# -------------------------
+class ScoreMatrix:
+    """
+    여러 면접의 questionWeights / answerScores 를 한 번만 배열로 바꿔 두고,
+    가중치(weight_map)가 바뀔 때마다 score() 로 전체를 다시 계산합니다.
+
+    codes  : (면접 수, 최대 질문 수, 기준 수) 가중치 라벨 인덱스
+    scores : 같은 모양의 답변 점수
+    질문 수가 모자란 면접은 가중치 0 인 빈 칸(pad)으로 채웁니다.
+    """
+
+    def __init__(self, interviews, labels=None):
+        # numpy 는 배치 엔진에서만 씁니다. (웹 앱은 calculate_final_scores 만 쓰므로 시작할 때 불러오지 않음)
+        import numpy as np
+
+        self.labels = list(WEIGHT_MAP if labels is None else labels)
+        self.pad_code = len(self.labels)
+        label_index = {label: i for i, label in enumerate(self.labels)}
+        pick = itemgetter(*CRITERIA)
+
+        counts = []
+        code_rows = []
+        score_rows = []
+        for question_weights, answer_scores in interviews:
+            if not question_weights:
+                # 원래 함수와 같은 예외 (weight_total == 0)
+                raise ZeroDivisionError("division by zero")
+            counts.append(len(question_weights))
+            for q_num, weights in question_weights.items():
+                code_rows.append([label_index[label] for label in pick(weights)])
+                row = pick(answer_scores[q_num])
+                for value in row:
+                    # np.array 는 "85" 같은 문자열도 숫자로 바꿔 버리므로, 원래 함수처럼 숫자가 아니면 TypeError
+                    if not isinstance(value, numbers.Real):
+                        raise TypeError(f"점수는 숫자여야 합니다: {q_num}번 {value!r}")
+                score_rows.append(row)
+
+        n = len(counts)
+        self.max_q = max(counts, default=0)
+        shape = (n, self.max_q, len(CRITERIA))
+        self.codes = np.full(shape, self.pad_code, dtype=np.intp)
+        self.scores = np.zeros(shape, dtype=np.float64)
+
+        if n:
+            counts = np.array(counts)
+            rows = np.repeat(np.arange(n), counts)
+            starts = np.repeat(np.cumsum(counts) - counts, counts)
+            cols = np.arange(len(rows)) - starts
+            self.codes[rows, cols] = np.array(code_rows, dtype=np.intp)
+            self.scores[rows, cols] = np.array(score_rows, dtype=np.float64)
+
+    def __len__(self):
+        return self.codes.shape[0]
+
+    def score(self, weight_map=None):
+        import numpy as np
+
+        weight_map = WEIGHT_MAP if weight_map is None else weight_map
+        if len(self) == 0:
+            return []
+
+        # 라벨 순서대로 가중치 벡터를 만들고, 마지막 칸(pad)은 0
+        weight_values = np.array([weight_map[label] for label in self.labels] + [0.0], dtype=np.float64)
+        weights = weight_values[self.codes]
+        weighted = self.scores * weights
+
+        # 질문 축은 앞에서부터 차례대로 더해서 파이썬 루프와 덧셈 순서를 맞춥니다.
+        weighted_sum = weighted[:, 0, :].copy()
+        weight_total = weights[:, 0, :].copy()
+        for j in range(1, self.max_q):
+            weighted_sum += weighted[:, j, :]
+            weight_total += weights[:, j, :]
+
+        if (weight_total == 0).any():
+            # 원래 함수와 같은 예외 (NaN 을 돌려주지 않음)
+            raise ZeroDivisionError("division by zero")
+        ratios = (weighted_sum / weight_total).tolist()
+        return [
+            dict(zip(CRITERIA, [round(value, 2) for value in row]))
+            for row in ratios
+        ]
+
+
+def score_batch(interviews, weight_map=None):
+    """
+    interviews: [(questionWeights, answerScores), ...]
+    반환: 면접마다 calculate_final_scores 와 같은 결과 dict 의 리스트
+    """
+    weight_map = WEIGHT_MAP if weight_map is None else weight_map
+    return ScoreMatrix(interviews, labels=weight_map).score(weight_map)
+
+
+# -------------------------
+# CLI: JSONL 재채점
+# -------------------------
+def _score_one(record, weight_map):
+    try:
+        return calculate_final_scores(record["questionWeights"], record["answerScores"], weight_map)
+    except Exception as e:
+        return e
+
+
+def _rescore_chunk(records, out, weight_map):
+    try:
+        interviews = [(r["questionWeights"], r["answerScores"]) for r in records]
+        radars = score_batch(interviews, weight_map)
+    except Exception:
+        # 한 건이라도 잘못되면 묶음 전체를 버리지 않고 한 건씩 다시 계산합니다.
+        radars = [_score_one(r, weight_map) for r in records]
+
+    for record, radar in zip(records, radars):
+        if isinstance(radar, Exception):
+            record["error"] = f"{type(radar).__name__}: {radar}"
+        else:
+            record["radarScores"] = radar
+            record["totalScore"] = total_score(radar)
+            record["grade"] = grade(record["totalScore"])
+        out.write(json.dumps(record, ensure_ascii=False) + "\n")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="저장된 면접 점수를 새 가중치로 다시 계산합니다.")
+    parser.add_argument("input", help="questionWeights / answerScores 가 들어있는 JSONL 파일")
+    parser.add_argument("-o", "--output", help="결과 JSONL 파일 (기본: 표준 출력)")
+    parser.add_argument("--weights", help="WEIGHT_MAP 대신 쓸 가중치 JSON 파일")
+    parser.add_argument("--chunk", type=int, default=10000, help="한 번에 계산할 면접 수")
+    args = parser.parse_args(argv)
+
+    weight_map = WEIGHT_MAP
+    if args.weights:
+        with open(args.weights, encoding="utf-8") as f:
+            weight_map = json.load(f)
+
+    out = open(args.output, "w", encoding="utf-8") if args.output else sys.stdout
+    try:
+        with open(args.input, encoding="utf-8") as f:
+            chunk = []
+            for line in f:
+                if not line.strip():
+                    continue
+                chunk.append(json.loads(line))
+                if len(chunk) >= args.chunk:
+                    _rescore_chunk(chunk, out, weight_map)
+                    chunk = []
+            if chunk:
+                _rescore_chunk(chunk, out, weight_map)
+    finally:
+        if out is not sys.stdout:
+            out.close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,143 @@
+# interview/serve.py
+# 운영용 실행 진입점 (gevent)
+# - 라우트는 지금처럼 동기 Flask 뷰 그대로 두고, gevent 로 소켓 / sleep / 스레드 / 큐를 협력형으로 바꿉니다.
+#   (monkey patch) 그러면 OpenAI 클라이언트가 응답을 기다리는 동안 같은 프로세스가 다른 요청을 처리하므로,
+#   프로세스 하나가 LLM 호출 수백 개를 동시에 기다릴 수 있습니다. 요청/응답 형식은 바뀌지 않습니다.
+# - 요청 하나 = greenlet 하나이고, 동시 연결 수는 SERVE_MAX_CONNECTIONS 로 제한합니다.
+#   비동기 제출 작업 큐 / 답변별 미리 평가 / 질문별 병렬 평가의 스레드도 greenlet 이 됩니다.
+# - PDF 파싱처럼 CPU 를 오래 쓰는 작업은 그동안 다른 요청을 막으므로 지금처럼 프로세스 풀(interview/pdf.py)에 맡깁니다.
+# - --workers N 이면 포트를 먼저 열고 fork 해서 N 개 프로세스가 같은 소켓에서 나눠 받습니다.
+#   (앱은 fork 뒤에 프로세스마다 따로 import 합니다. 캐시 / 지표는 프로세스별,
+#    세션 / 비동기 작업 상태 / 답변별 미리 평가 결과는 SQLite 로 공유)
+#   프로세스 메모리에만 상태를 두는 기능이 켜져 있으면 앱을 만들 때 거절하고 모든 워커가 끝납니다.
+#   (interview/web/factory.py 의 process_local_features)
+#
+# 사용법:
+#   python -m interview.serve app_interview_basic2 --port 5000 --workers 2
+#   python -m interview.serve env.app --port 5001
+#   (개발할 때는 지금처럼 python app_interview_basic2.py)
+try:
+    from gevent import monkey
+except ImportError:
+    raise SystemExit("gevent 가 필요합니다. (pip install gevent)")
+
+# 다른 모듈(특히 socket / ssl / threading)을 import 하기 전에 바꿔야 합니다.
+# aggressive=False: select.epoll 을 지우지 않습니다. (httpcore 가 import 하는 trio 가 클래스 정의에서 참조함)
+monkey.patch_all(aggressive=False)
+
+import argparse  # noqa: E402
+import importlib  # noqa: E402
+import logging  # noqa: E402
+import os  # noqa: E402
+import signal  # noqa: E402
+import socket  # noqa: E402
+import sys  # noqa: E402
+
+import gevent  # noqa: E402
+from gevent.pool import Pool  # noqa: E402
+from gevent.pywsgi import WSGIServer  # noqa: E402
+
+logger = logging.getLogger("interview.serve")
+
+SERVE_HOST = os.getenv("SERVE_HOST", "0.0.0.0")
+SERVE_PORT = int(os.getenv("SERVE_PORT", "5000"))
+SERVE_WORKERS = int(os.getenv("SERVE_WORKERS", "1"))
+SERVE_MAX_CONNECTIONS = int(os.getenv("SERVE_MAX_CONNECTIONS", "1000"))   # 프로세스당 동시 요청 수
+SERVE_BACKLOG = int(os.getenv("SERVE_BACKLOG", "2048"))
+SERVE_GRACEFUL_TIMEOUT = float(os.getenv("SERVE_GRACEFUL_TIMEOUT", "30"))  # 종료 때 진행 중 요청을 기다릴 시간(초)
+
+
+def load_app(target):
+    # "app_interview_basic2" 또는 "env.app:app" (":" 뒤를 생략하면 app)
+    module_name, _, attr = target.partition(":")
+    # 저장소 루트에서 실행해도 앱 파일(app_interview_basic*.py)을 찾을 수 있게 합니다.
+    sys.path.insert(0, os.getcwd())
+    return getattr(importlib.import_module(module_name), attr or "app")
+
+
+def listen(host, port, backlog):
+    sock = socket.socket(socket.AF_INET6 if ":" in host else socket.AF_INET, socket.SOCK_STREAM)
+    sock.setsockopt(socket.SOL_SOCKET, socket.SO_REUSEADDR, 1)
+    sock.bind((host, port))
+    sock.listen(backlog)
+    return sock
+
+
+def serve(target, listener, max_connections, graceful_timeout):
+    """이 프로세스에서 앱을 import 하고 listener 로 요청을 받습니다. (종료 신호까지 블록)"""
+    app = load_app(target)
+    server = WSGIServer(listener, app, spawn=Pool(max_connections), log=None, error_log=logger)
+
+    def stop():
+        # 새 연결은 받지 않고, 진행 중인 요청은 graceful_timeout 까지 기다립니다.
+        logger.info("shutting down pid=%d", os.getpid())
+        server.stop(timeout=graceful_timeout)
+
+    gevent.signal_handler(signal.SIGTERM, stop)
+    gevent.signal_handler(signal.SIGINT, stop)
+    logger.info("serving %s pid=%d max_connections=%d", target, os.getpid(), max_connections)
+    server.serve_forever()
+
+
+def run(target, host=SERVE_HOST, port=SERVE_PORT, workers=SERVE_WORKERS,
+        max_connections=SERVE_MAX_CONNECTIONS, backlog=SERVE_BACKLOG, graceful_timeout=SERVE_GRACEFUL_TIMEOUT):
+    # 앱 팩토리가 여러 워커로 떠도 되는 설정인지 확인할 수 있게 넘깁니다.
+    os.environ["SERVE_WORKERS"] = str(max(workers, 1))
+    listener = listen(host, port, backlog)
+    if workers <= 1:
+        serve(target, listener, max_connections, graceful_timeout)
+        return
+
+    children = []
+    for _ in range(workers):
+        pid = gevent.fork()
+        if pid == 0:
+            try:
+                serve(target, listener, max_connections, graceful_timeout)
+            except Exception:
+                logger.exception("worker failed pid=%d", os.getpid())
+                os._exit(1)
+            os._exit(0)
+        children.append(pid)
+
+    # 부모는 요청을 받지 않고, 종료 신호를 자식에게 넘긴 뒤 모두 끝날 때까지 기다립니다.
+    def forward(signum, frame):
+        for pid in children:
+            try:
+                os.kill(pid, signal.SIGTERM)
+            except ProcessLookupError:
+                pass
+
+    signal.signal(signal.SIGTERM, forward)
+    signal.signal(signal.SIGINT, forward)
+    listener.close()
+    failed = 0
+    for pid in children:
+        try:
+            _, status = os.waitpid(pid, 0)
+        except ChildProcessError:
+            continue
+        failed += status != 0
+    if failed:
+        raise SystemExit(f"워커 {failed}개가 비정상 종료했습니다.")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="gevent 로 면접 API 서버를 띄웁니다.")
+    parser.add_argument("app", help="앱 모듈 (예: app_interview_basic2, env.app:app)")
+    parser.add_argument("--host", default=SERVE_HOST)
+    parser.add_argument("--port", type=int, default=SERVE_PORT)
+    parser.add_argument("--workers", type=int, default=SERVE_WORKERS, help="프로세스 수 (기본 1)")
+    parser.add_argument("--max-connections", type=int, default=SERVE_MAX_CONNECTIONS,
+                        help="프로세스당 동시에 처리할 최대 요청 수")
+    args = parser.parse_args(argv)
+
+    # 동시에 기다리는 LLM 호출 수만큼 연결 풀도 넉넉히 둡니다. (직접 지정했으면 그 값)
+    os.environ.setdefault("LLM_MAX_CONNECTIONS", str(args.max_connections))
+    os.environ.setdefault("LLM_MAX_KEEPALIVE", str(min(args.max_connections, 100)))
+
+    run(args.app, args.host, args.port, args.workers, args.max_connections)
+
+
+if __name__ == "__main__":
+    main()
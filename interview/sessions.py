@@ -0,0 +1,231 @@
+# interview/sessions.py
+# 서버 쪽 면접 세션 저장소 (SQLite, WAL 모드)
+# - interviewId 는 서버가 만들고, 질문 / 답변 / 질문별 중간 평가 결과를 여기에 기록합니다.
+# - 제출할 때 클라이언트는 interviewId 와 답변만 보내면 됩니다.
+# - 여러 워커 프로세스가 같은 파일을 같이 써도 되도록 WAL + busy_timeout 을 씁니다.
+# - 바뀌지 않는 부분(직무, 경력, 질문 목록)은 선택적으로 메모리에도 올려 둡니다.
+# - 제출 평가가 끝난 성적표도 interviewId 로 저장해서, 결과 화면을 다시 열 때 LLM 을 다시 부르지 않습니다.
+#   (직렬화한 JSON 과 ETag 를 같이 저장하므로 조회는 키 하나 읽기)
+# - 비동기 제출 작업(interview/jobs.py)의 상태 / 결과도 저장해서, 작업을 받은 워커가 아닌
+#   다른 워커 프로세스가 GET /api/interview/jobs/<id> 를 받아도 같은 상태를 돌려줍니다.
+import hashlib
+import json
+import os
+import secrets
+import sqlite3
+import threading
+import time
+
+from interview.cache import MemoryCache
+
+
+def new_interview_id():
+    # URL 경로에 그대로 쓰므로 입력값(직무명 등)은 넣지 않고 무작위 값만 씁니다.
+    return f"ses-{secrets.token_hex(16)}"
+
+
+class SessionStore:
+    def __init__(self, path, memory_entries=0, ttl=7 * 86400):
+        self.path = path
+        self.ttl = ttl   # 세션 보관 기간(초)
+        self._local = threading.local()
+        # 질문 목록은 만든 뒤 바뀌지 않으므로 프로세스마다 메모리에 캐시해도 안전합니다.
+        self._memory = MemoryCache(max_entries=memory_entries, ttl=ttl, max_entry_bytes=256 * 1024) \
+            if memory_entries > 0 else None
+
+        with self._conn() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS sessions ("
+                " id TEXT PRIMARY KEY, job TEXT NOT NULL, experience TEXT NOT NULL,"
+                " questions TEXT NOT NULL, created_at REAL NOT NULL, updated_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS answers ("
+                " session_id TEXT NOT NULL, idx INTEGER NOT NULL, question TEXT NOT NULL DEFAULT '',"
+                " answer TEXT NOT NULL, result TEXT, updated_at REAL NOT NULL,"
+                " PRIMARY KEY (session_id, idx))"
+            )
+            columns = {row[1] for row in conn.execute("PRAGMA table_info(answers)")}
+            if "question" not in columns:
+                # 예전 파일: 질문 없이 저장된 결과는 어떤 질문에도 맞지 않으므로 제출 때 다시 평가됩니다.
+                conn.execute("ALTER TABLE answers ADD COLUMN question TEXT NOT NULL DEFAULT ''")
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS reports ("
+                " session_id TEXT PRIMARY KEY, body TEXT NOT NULL, etag TEXT NOT NULL, created_at REAL NOT NULL)"
+            )
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS jobs ("
+                " id TEXT PRIMARY KEY, body TEXT NOT NULL, updated_at REAL NOT NULL)"
+            )
+
+    def _conn(self):
+        # sqlite 연결은 스레드마다 따로 엽니다.
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA synchronous=NORMAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._local.conn = conn
+        return conn
+
+    # -------------------------
+    # 세션 (질문)
+    # -------------------------
+    def create(self, interview_id, job, experience, questions):
+        now = time.time()
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO sessions (id, job, experience, questions, created_at, updated_at)"
+                " VALUES (?, ?, ?, ?, ?, ?)",
+                (interview_id, job, experience, json.dumps(questions, ensure_ascii=False), now, now)
+            )
+            conn.execute("DELETE FROM answers WHERE session_id = ?", (interview_id,))
+            conn.execute("DELETE FROM reports WHERE session_id = ?", (interview_id,))
+            self._prune(conn, now)
+        return interview_id
+
+    def get(self, interview_id):
+        if self._memory is not None:
+            session = self._memory.get(interview_id)
+            if session is not None:
+                return session
+
+        row = self._conn().execute(
+            "SELECT job, experience, questions FROM sessions WHERE id = ?", (interview_id,)
+        ).fetchone()
+        if row is None:
+            return None
+
+        session = {"interviewId": interview_id, "job": row[0], "experience": row[1],
+                   "questions": json.loads(row[2])}
+        if self._memory is not None:
+            self._memory.set(interview_id, session, len(row[2].encode("utf-8")))
+        return session
+
+    # -------------------------
+    # 답변 / 질문별 중간 결과
+    # -------------------------
+    def save_answer(self, interview_id, index, question, answer):
+        # 질문이나 답변이 바뀌면 이전 값으로 계산한 결과는 지웁니다.
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT INTO answers (session_id, idx, question, answer, result, updated_at)"
+                " VALUES (?, ?, ?, ?, NULL, ?)"
+                " ON CONFLICT (session_id, idx) DO UPDATE SET"
+                " result = CASE WHEN answers.answer = excluded.answer AND answers.question = excluded.question"
+                " THEN answers.result ELSE NULL END,"
+                " question = excluded.question, answer = excluded.answer, updated_at = excluded.updated_at",
+                (interview_id, index, question, answer, time.time())
+            )
+
+    def save_answers(self, interview_id, qna_list):
+        for index, item in enumerate(qna_list):
+            self.save_answer(interview_id, index, item["question"].strip(), item["answer"].strip())
+
+    def save_result(self, interview_id, index, question, answer, result):
+        # 평가하는 동안 질문이나 답변이 바뀌었으면 저장하지 않습니다.
+        with self._conn() as conn:
+            conn.execute(
+                "UPDATE answers SET result = ?, updated_at = ?"
+                " WHERE session_id = ? AND idx = ? AND question = ? AND answer = ?",
+                (json.dumps(result, ensure_ascii=False), time.time(), interview_id, index, question, answer)
+            )
+
+    def answers(self, interview_id):
+        # {index: {"question": .., "answer": .., "result": .. 또는 None}}
+        rows = self._conn().execute(
+            "SELECT idx, question, answer, result FROM answers WHERE session_id = ?", (interview_id,)
+        ).fetchall()
+        return {
+            idx: {"question": question, "answer": answer, "result": json.loads(result) if result else None}
+            for idx, question, answer, result in rows
+        }
+
+    def qna_list(self, interview_id, answers=None):
+        """
+        저장된 질문과 답변(또는 넘겨받은 answers)으로 qnaList 를 만듭니다.
+        세션이 없으면 None.
+        """
+        session = self.get(interview_id)
+        if session is None:
+            return None
+
+        if answers is None:
+            stored = self.answers(interview_id)
+            answers = [stored.get(i, {}).get("answer", "") for i in range(len(session["questions"]))]
+
+        return [
+            {"question": question, "answer": answers[i] if i < len(answers) else ""}
+            for i, question in enumerate(session["questions"])
+        ]
+
+    # -------------------------
+    # 성적표 (제출 평가 결과)
+    # -------------------------
+    def save_report(self, interview_id, report):
+        """
+        평가 결과를 저장하고 (body, etag) 를 돌려줍니다. 세션이 없으면 저장하지 않고 None.
+        다시 제출하면 새 결과로 바뀝니다. (내용이 다르면 ETag 도 바뀜)
+        """
+        body = json.dumps(report, ensure_ascii=False, separators=(",", ":"))
+        etag = hashlib.sha256(body.encode("utf-8")).hexdigest()[:32]
+        with self._conn() as conn:
+            cursor = conn.execute(
+                "INSERT OR REPLACE INTO reports (session_id, body, etag, created_at)"
+                " SELECT id, ?, ?, ? FROM sessions WHERE id = ?",
+                (body, etag, time.time(), interview_id)
+            )
+        return (body, etag) if cursor.rowcount else None
+
+    def get_report(self, interview_id):
+        # {"body": 직렬화한 JSON, "etag": .., "createdAt": ..} 또는 None
+        row = self._conn().execute(
+            "SELECT body, etag, created_at FROM reports WHERE session_id = ?", (interview_id,)
+        ).fetchone()
+        if row is None:
+            return None
+        return {"body": row[0], "etag": row[1], "createdAt": row[2]}
+
+    # -------------------------
+    # 비동기 제출 작업
+    # -------------------------
+    def save_job(self, job):
+        # 상태가 바뀔 때마다 작업 dict 전체를 덮어씁니다. (jobId / status / result / error / 시각)
+        with self._conn() as conn:
+            conn.execute(
+                "INSERT OR REPLACE INTO jobs (id, body, updated_at) VALUES (?, ?, ?)",
+                (job["jobId"], json.dumps(job, ensure_ascii=False), time.time())
+            )
+
+    def get_job(self, job_id):
+        row = self._conn().execute("SELECT body FROM jobs WHERE id = ?", (job_id,)).fetchone()
+        return json.loads(row[0]) if row else None
+
+    def prune_jobs(self, older_than):
+        with self._conn() as conn:
+            conn.execute("DELETE FROM jobs WHERE updated_at < ?", (time.time() - older_than,))
+
+    def _prune(self, conn, now):
+        conn.execute(
+            "DELETE FROM reports WHERE session_id IN (SELECT id FROM sessions WHERE updated_at < ?)",
+            (now - self.ttl,)
+        )
+        conn.execute(
+            "DELETE FROM answers WHERE session_id IN (SELECT id FROM sessions WHERE updated_at < ?)",
+            (now - self.ttl,)
+        )
+        conn.execute("DELETE FROM sessions WHERE updated_at < ?", (now - self.ttl,))
+
+
+def build_session_store():
+    """
+    SESSION_DB           SQLite 파일 경로 (기본 interview_sessions.db)
+    SESSION_MEMORY_SIZE  질문 목록을 메모리에 캐시할 세션 수 (0 이면 끔, 기본 1024)
+    SESSION_TTL          세션 보관 기간(초, 기본 7일)
+    """
+    return SessionStore(
+        os.getenv("SESSION_DB", "interview_sessions.db"),
+        memory_entries=int(os.getenv("SESSION_MEMORY_SIZE", "1024")),
+        ttl=int(os.getenv("SESSION_TTL", str(7 * 86400)))
+    )
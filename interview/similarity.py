@@ -0,0 +1,151 @@
+# interview/similarity.py
+# 거의 같은 답변 평가 재사용 캐시 (MinHash + LSH)
+# - 같은 질문에 템플릿처럼 비슷한 답변이 자주 들어옵니다.
+#   이미 평가한 답변과 충분히 비슷하면(추정 Jaccard >= 기준값) 질문별 평가 결과를 그대로 씁니다.
+# - 답변은 공백/문장부호를 지운 글자 3-gram 집합으로 보고, MinHash 서명만 메모리에 둡니다.
+#   (원문은 저장하지 않음)
+# - LSH 밴드로 후보만 빠르게 찾고, 항목 수는 LRU 로 제한합니다.
+# - 재사용한 결과에는 "cache": {"hit": true, "similarity": ..} 를 붙여서 응답에서 확인할 수 있게 합니다.
+import os
+import re
+import threading
+import time
+import zlib
+from collections import OrderedDict
+
+import numpy as np
+
+_PRIME = (1 << 32) - 5       # 2^32 보다 작은 가장 큰 소수
+_NON_WORD = re.compile(r"[\W_]+")
+
+
+def shingles(text, size=3):
+    text = _NON_WORD.sub("", text.casefold())
+    if len(text) <= size:
+        return {text} if text else set()
+    return {text[i:i + size] for i in range(len(text) - size + 1)}
+
+
+class MinHasher:
+    def __init__(self, permutations=64, seed=1):
+        rng = np.random.default_rng(seed)
+        self.a = rng.integers(1, _PRIME, size=permutations, dtype=np.uint64)
+        self.b = rng.integers(0, _PRIME, size=permutations, dtype=np.uint64)
+
+    def signature(self, text):
+        grams = shingles(text)
+        if not grams:
+            return None
+        hashes = np.fromiter((zlib.crc32(g.encode("utf-8")) for g in grams), dtype=np.uint64, count=len(grams))
+        # (a * h + b) mod p 를 순열 수만큼 한 번에 계산 (a, h < 2^32 이라 uint64 에서 넘치지 않음)
+        return ((self.a[:, None] * hashes[None, :] + self.b[:, None]) % _PRIME).min(axis=1).astype(np.uint32)
+
+
+class AnswerSimilarityCache:
+    def __init__(self, max_entries=5000, threshold=0.85, permutations=64, bands=16):
+        if permutations % bands:
+            raise ValueError("permutations 는 bands 의 배수여야 합니다.")
+        self.max_entries = max_entries
+        self.threshold = threshold
+        self.bands = bands
+        self.rows = permutations // bands
+        self.hasher = MinHasher(permutations)
+
+        self._entries = OrderedDict()   # id -> (band keys, 서명, 결과, 저장 시각)
+        self._buckets = {}              # band key -> {id, ...}
+        self._next_id = 0
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+
+    def _band_keys(self, namespace, question, signature):
+        # 질문 문장이 같은 항목끼리만 비교합니다.
+        question_key = zlib.crc32(" ".join(question.split()).casefold().encode("utf-8"))
+        return [
+            (namespace, question_key, band, signature[band * self.rows:(band + 1) * self.rows].tobytes())
+            for band in range(self.bands)
+        ]
+
+    def get(self, namespace, question, answer):
+        """비슷한 답변의 결과가 있으면 cache 표시를 붙인 복사본, 없으면 None"""
+        signature = self.hasher.signature(answer)
+        if signature is None:
+            return None
+        keys = self._band_keys(namespace, question, signature)
+
+        with self._lock:
+            candidates = set()
+            for key in keys:
+                candidates.update(self._buckets.get(key, ()))
+
+            best_id, best_sim = None, 0.0
+            for entry_id in candidates:
+                similarity = float(np.mean(self._entries[entry_id][1] == signature))
+                if similarity > best_sim:
+                    best_id, best_sim = entry_id, similarity
+
+            if best_id is None or best_sim < self.threshold:
+                self.misses += 1
+                return None
+
+            self.hits += 1
+            self._entries.move_to_end(best_id)
+            _, _, result, stored_at = self._entries[best_id]
+
+        return {**result, "cache": {"hit": True, "similarity": round(best_sim, 3), "storedAt": stored_at}}
+
+    def put(self, namespace, question, answer, result):
+        signature = self.hasher.signature(answer)
+        if signature is None or self.max_entries <= 0:
+            return
+        keys = self._band_keys(namespace, question, signature)
+        result = {k: v for k, v in result.items() if k != "cache"}
+
+        with self._lock:
+            entry_id = self._next_id
+            self._next_id += 1
+            self._entries[entry_id] = (keys, signature, result, int(time.time()))
+            for key in keys:
+                self._buckets.setdefault(key, set()).add(entry_id)
+
+            while len(self._entries) > self.max_entries:
+                old_id, (old_keys, _, _, _) = self._entries.popitem(last=False)
+                for key in old_keys:
+                    bucket = self._buckets.get(key)
+                    if bucket is not None:
+                        bucket.discard(old_id)
+                        if not bucket:
+                            del self._buckets[key]
+
+    def stats(self):
+        with self._lock:
+            total = self.hits + self.misses
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hitRatio": round(self.hits / total, 4) if total else 0.0,
+                "entries": len(self._entries),
+                "threshold": self.threshold,
+            }
+
+
+def build_answer_cache():
+    """
+    ANSWER_CACHE_SIZE          기억할 답변 수 (0 이면 끔, 기본 5000)
+    ANSWER_CACHE_THRESHOLD     재사용할 최소 유사도 (추정 Jaccard, 기본 0.85)
+    ANSWER_CACHE_PERMUTATIONS  MinHash 서명 길이 (기본 64)
+    ANSWER_CACHE_BANDS         LSH 밴드 수 (기본 16, PERMUTATIONS 의 약수)
+    """
+    size = int(os.getenv("ANSWER_CACHE_SIZE", "5000"))
+    if size <= 0:
+        return None
+    return AnswerSimilarityCache(
+        max_entries=size,
+        threshold=float(os.getenv("ANSWER_CACHE_THRESHOLD", "0.85")),
+        permutations=int(os.getenv("ANSWER_CACHE_PERMUTATIONS", "64")),
+        bands=int(os.getenv("ANSWER_CACHE_BANDS", "16"))
+    )
+
+
+# 프로세스당 하나 (질문별 평가 / analyze_answer 가 같이 씀)
+answer_cache = build_answer_cache()
@@ -0,0 +1,252 @@
+# interview/singleflight.py
+# 같은 요청 합치기 (single-flight)
+# - 더블 클릭 / 브라우저 재시도 / 프론트 재시도로 같은 제출이 평가 도중에 또 들어오면,
+#   처음 요청(leader)만 LLM 을 부르고 나머지(follower)는 그 결과를 기다렸다가 같은 결과를 받습니다.
+# - 키는 호출하는 쪽이 정합니다. (제출: interviewId + 요청 내용 해시, 질문 생성: 질문 캐시 키)
+# - 프로세스 안: 키마다 Event 하나로 기다립니다. (폴링 없음)
+# - 프로세스 사이: SQLite 잠금 테이블(flights)에 키를 먼저 넣은 프로세스가 leader 가 되고,
+#   다른 프로세스는 행의 상태가 done / error 가 될 때까지 짧게 폴링합니다.
+#   (한 프로세스에서는 스레드 하나만 폴링하고, 같은 프로세스의 다른 스레드는 Event 로 기다림)
+# - leader 가 죽거나(임대 시간 SINGLEFLIGHT_LEASE 초과) 중간에 그만두면(abandon) 기다리던 쪽이 이어받습니다.
+# - 끝난 결과는 SINGLEFLIGHT_RESULT_TTL 동안 남겨서, 끝난 직후에 도착한 재시도도 같은 결과를 받습니다.
+#
+# 사용법:
+#   result, shared = single_flight.do("submit", key, lambda: evaluate(...))
+#   또는 스트리밍처럼 끝나는 시점이 나중이면 flight = single_flight.begin(...) 후 finish / fail / abandon
+import hashlib
+import json
+import os
+import sqlite3
+import threading
+import time
+import uuid
+
+from interview.telemetry import Counter, registry
+
+COALESCED = registry.register(Counter(
+    "interview_singleflight_total", "Calls by single-flight role (leader / local / remote / cached)",
+    ("name", "role")))
+
+
+class SingleFlightError(RuntimeError):
+    """다른 프로세스의 leader 가 실패했을 때 (메시지만 전달됨)"""
+
+
+class FlightTimeout(SingleFlightError):
+    pass
+
+
+def payload_key(*parts):
+    # 같은 내용이면 같은 키 (dict 키 순서와 무관)
+    text = json.dumps(parts, ensure_ascii=False, sort_keys=True, separators=(",", ":"))
+    return hashlib.sha256(text.encode("utf-8")).hexdigest()[:32]
+
+
+class _LocalFlight:
+    def __init__(self):
+        self.event = threading.Event()
+        self.state = None       # done / error / abandoned
+        self.result = None
+        self.error = None
+
+
+class Flight:
+    """begin() 이 돌려주는 손잡이. leader 면 finish / fail / abandon 중 하나를 꼭 불러야 합니다. (두 번째부터는 무시)"""
+
+    def __init__(self, group, key, local, leader, result=None):
+        self._group = group
+        self._key = key
+        self._local = local
+        self.leader = leader
+        self.result = result
+
+    def finish(self, result):
+        if self._local is not None:
+            self._group._complete(self._key, self._local, "done", result=result)
+            self._local = None
+
+    def fail(self, error):
+        if self._local is not None:
+            self._group._complete(self._key, self._local, "error", error=error)
+            self._local = None
+
+    def abandon(self):
+        # 결과 없이 그만둠 (스트리밍 연결이 끊긴 경우 등). 기다리던 요청 중 하나가 이어받습니다.
+        if self._local is not None:
+            self._group._complete(self._key, self._local, "abandoned")
+            self._local = None
+
+
+class SingleFlight:
+    def __init__(self, path=None, lease=180, result_ttl=10, poll_max=0.25):
+        self.path = path            # None 이면 프로세스 안에서만 합침
+        self.lease = lease
+        self.result_ttl = result_ttl
+        self.poll_max = poll_max
+        self._flights = {}
+        self._lock = threading.Lock()
+        self._db = threading.local()
+        self._owner_prefix = f"{os.getpid()}-"
+
+        if self.path:
+            with self._conn() as conn:
+                conn.execute(
+                    "CREATE TABLE IF NOT EXISTS flights ("
+                    " key TEXT PRIMARY KEY, owner TEXT NOT NULL, status TEXT NOT NULL, result TEXT,"
+                    " started_at REAL NOT NULL, expires_at REAL NOT NULL)"
+                )
+
+    def _conn(self):
+        # sqlite 연결은 스레드마다 따로 엽니다.
+        conn = getattr(self._db, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            conn.execute("PRAGMA busy_timeout=5000")
+            self._db.conn = conn
+        return conn
+
+    # -------------------------
+    # 시작 / 기다리기
+    # -------------------------
+    def do(self, name, key, fn, timeout=None):
+        """fn() 결과와 다른 요청의 결과를 받았는지 여부(shared)를 돌려줍니다."""
+        flight = self.begin(name, key, timeout)
+        if not flight.leader:
+            return flight.result, True
+        try:
+            result = fn()
+        except Exception as e:
+            flight.fail(e)
+            raise
+        except BaseException:
+            flight.abandon()
+            raise
+        flight.finish(result)
+        return result, False
+
+    def begin(self, name, key, timeout=None):
+        """
+        leader 면 바로 돌아오고(flight.leader=True), 아니면 leader 가 끝날 때까지 기다린 뒤 결과를 담아 돌아옵니다.
+        leader 가 실패하면 같은 예외(다른 프로세스면 SingleFlightError), 오래 걸리면 FlightTimeout.
+        """
+        key = f"{name}:{key}"
+        deadline = time.monotonic() + (timeout or self.lease)
+        while True:
+            with self._lock:
+                local = self._flights.get(key)
+                representative = local is None
+                if representative:
+                    local = self._flights[key] = _LocalFlight()
+
+            if not representative:
+                # 같은 프로세스의 다른 스레드가 이미 처리(또는 다른 프로세스를 기다리는) 중
+                if not local.event.wait(max(0.0, deadline - time.monotonic())):
+                    raise FlightTimeout("같은 요청의 처리가 끝나지 않았습니다.")
+                if local.state == "done":
+                    COALESCED.inc(name=name, role="local")
+                    return Flight(self, key, None, leader=False, result=local.result)
+                if local.state == "error":
+                    raise local.error
+                continue    # abandoned: 다시 시도 (이번에는 leader 가 될 수 있음)
+
+            try:
+                outcome, result = self._acquire(key, deadline)
+            except BaseException as e:
+                self._settle(key, local, "error", error=e)
+                raise
+
+            if outcome == "leader":
+                COALESCED.inc(name=name, role="leader")
+                return Flight(self, key, local, leader=True)
+            COALESCED.inc(name=name, role=outcome)
+            self._settle(key, local, "done", result=result)
+            return Flight(self, key, None, leader=False, result=result)
+
+    def _acquire(self, key, deadline):
+        # ("leader", None) / ("remote", 결과) / ("cached", 결과)
+        if not self.path:
+            return "leader", None
+
+        owner = self._owner_prefix + uuid.uuid4().hex[:12]
+        conn = self._conn()
+        delay = 0.01
+        waited_on = None
+        while True:
+            now = time.time()
+            expires = now + self.lease
+            if conn.execute(
+                "INSERT OR IGNORE INTO flights (key, owner, status, result, started_at, expires_at)"
+                " VALUES (?, ?, 'running', NULL, ?, ?)", (key, owner, now, expires)
+            ).rowcount:
+                return "leader", None
+            # 포기 / 임대 만료된 행, 그리고 기다리던 것이 아닌 예전 실패 행은 이어받습니다.
+            # (기다리던 leader 가 실패했으면 이어받지 않고 같은 실패를 돌려줌)
+            if conn.execute(
+                "UPDATE flights SET owner = ?, status = 'running', result = NULL, started_at = ?, expires_at = ?"
+                " WHERE key = ? AND (status = 'abandoned' OR status = 'error' AND owner != ? OR expires_at < ?)",
+                (owner, now, expires, key, waited_on or "", now)
+            ).rowcount:
+                return "leader", None
+
+            row = conn.execute("SELECT owner, status, result FROM flights WHERE key = ?", (key,)).fetchone()
+            if row is not None:
+                row_owner, status, result = row
+                if status == "done":
+                    return ("remote" if waited_on else "cached"), json.loads(result)
+                if status == "error" and row_owner == waited_on:
+                    raise SingleFlightError(result or "같은 요청의 처리가 실패했습니다.")
+                if status == "running":
+                    waited_on = row_owner
+
+            if time.monotonic() >= deadline:
+                raise FlightTimeout("같은 요청의 처리가 끝나지 않았습니다.")
+            time.sleep(delay)
+            delay = min(delay * 2, self.poll_max)
+
+    # -------------------------
+    # 끝내기
+    # -------------------------
+    def _complete(self, key, local, state, result=None, error=None):
+        if self.path:
+            now = time.time()
+            if state == "done":
+                values = ("done", json.dumps(result, ensure_ascii=False), now + self.result_ttl)
+            elif state == "error":
+                values = ("error", str(error) or type(error).__name__, now + self.result_ttl)
+            else:
+                values = ("abandoned", None, now)
+            try:
+                conn = self._conn()
+                conn.execute("UPDATE flights SET status = ?, result = ?, expires_at = ? WHERE key = ?",
+                             (*values, key))
+                # 오래된 행 정리
+                conn.execute("DELETE FROM flights WHERE expires_at < ?", (now - self.lease,))
+            except sqlite3.Error:
+                # 잠금 테이블에 못 써도 이 프로세스의 요청은 결과를 받아야 합니다. (다른 프로세스는 임대 만료 후 이어받음)
+                pass
+        self._settle(key, local, state, result=result, error=error)
+
+    def _settle(self, key, local, state, result=None, error=None):
+        with self._lock:
+            local.state = state
+            local.result = result
+            local.error = error
+            if self._flights.get(key) is local:
+                del self._flights[key]
+        local.event.set()
+
+
+def build_single_flight():
+    """
+    SINGLEFLIGHT_DB          워커 프로세스끼리 같이 쓰는 잠금 테이블 SQLite 파일
+                             (기본: SESSION_DB 와 같은 파일, "off" 면 프로세스 안에서만 합침)
+    SINGLEFLIGHT_LEASE       leader 임대 시간(초, 기본 180). 넘으면 기다리던 쪽이 이어받음
+    SINGLEFLIGHT_RESULT_TTL  끝난 결과를 같은 요청에 다시 돌려주는 시간(초, 기본 10)
+    """
+    path = os.getenv("SINGLEFLIGHT_DB") or os.getenv("SESSION_DB", "interview_sessions.db")
+    return SingleFlight(
+        None if path == "off" else path,
+        lease=float(os.getenv("SINGLEFLIGHT_LEASE", "180")),
+        result_ttl=float(os.getenv("SINGLEFLIGHT_RESULT_TTL", "10"))
+    )
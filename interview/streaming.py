@@ -0,0 +1,147 @@
+# interview/streaming.py
+# 질문 생성 결과를 SSE(text/event-stream)로 흘려보내기 위한 코드입니다.
+# 모델이 토큰 단위로 보내는 JSON 조각을 읽으면서,
+# "questions" 배열의 문자열이 하나 완성될 때마다 바로 꺼내 줍니다.
+import json
+import re
+
+
+# -------------------------
+# 질문 배열 증분 디코더
+# -------------------------
+_QUESTIONS_KEY = re.compile(r'"questions"\s*:\s*\[')
+
+
+class QuestionStreamDecoder:
+    """
+    토큰 조각을 feed() 로 넣으면, 새로 완성된 질문 문자열 리스트를 돌려줍니다.
+
+    decoder = QuestionStreamDecoder()
+    decoder.feed('{"questions": ["자기')   # -> []
+    decoder.feed('소개 해주세요", "')      # -> ["자기소개 해주세요"]
+    """
+
+    def __init__(self):
+        self.buffer = ""
+        self.questions = []
+        self._pos = 0            # 다음에 읽을 위치 (이미 읽은 부분은 다시 보지 않음)
+        self._state = "key"      # key -> array -> string -> done
+        self._string_start = 0
+        self._escaped = False
+
+    @property
+    def done(self):
+        return self._state == "done"
+
+    def feed(self, chunk):
+        if not chunk or self.done:
+            return []
+        self.buffer += chunk
+        found = []
+
+        while self._pos < len(self.buffer) and not self.done:
+            if self._state == "key":
+                match = _QUESTIONS_KEY.search(self.buffer, self._pos)
+                if not match:
+                    # 키가 조각 경계에 걸쳐 있을 수 있으니 끝부분은 남겨둡니다.
+                    self._pos = max(self._pos, len(self.buffer) - 32)
+                    break
+                self._pos = match.end()
+                self._state = "array"
+
+            elif self._state == "array":
+                ch = self.buffer[self._pos]
+                if ch == '"':
+                    self._string_start = self._pos
+                    self._escaped = False
+                    self._state = "string"
+                elif ch == "]":
+                    self._state = "done"
+                self._pos += 1
+
+            else:  # string
+                ch = self.buffer[self._pos]
+                self._pos += 1
+                if self._escaped:
+                    self._escaped = False
+                elif ch == "\\":
+                    self._escaped = True
+                elif ch == '"':
+                    literal = self.buffer[self._string_start:self._pos]
+                    question = json.loads(literal).strip()
+                    if question:
+                        self.questions.append(question)
+                        found.append(question)
+                    self._state = "array"
+
+        return found
+
+
+# -------------------------
+# SSE 이벤트 포맷
+# -------------------------
+def sse_event(event, data):
+    payload = json.dumps(data, ensure_ascii=False)
+    return f"event: {event}\ndata: {payload}\n\n"
+
+
+# -------------------------
+# 스트리밍 질문 생성
+# -------------------------
+def stream_questions(client, model, prompt, interview_id, on_complete=None, prefix=None, limit=None):
+    """
+    LLM 을 stream=True 로 호출하고 SSE 문자열을 하나씩 yield 합니다.
+    on_complete 를 넘기면 질문이 모두 도착한 뒤 질문 리스트로 한 번 호출합니다.
+    prefix 는 이미 가지고 있는 질문(질문 은행 등)으로, LLM 질문보다 먼저 보내고 번호를 이어 붙입니다.
+    limit 를 넘기면 LLM 질문은 앞에서부터 그 개수까지만 보냅니다. (모델이 더 만들어도 버림)
+
+    event: question  -> {"index": 0, "question": "..."}
+    event: done      -> {"questions": [...], "interviewId": "..."}
+    event: error     -> {"error": "..."}
+    """
+    decoder = QuestionStreamDecoder()
+    prefix = list(prefix or [])
+    for index, question in enumerate(prefix):
+        yield sse_event("question", {"index": index, "question": question})
+
+    try:
+        stream = client.chat.completions.create(
+            model=model,
+            messages=[{"role": "user", "content": prompt}],
+            response_format={"type": "json_object"},
+            stream=True,
+            # 마지막 조각에 토큰 사용량(usage)을 받아서 지표로 남깁니다. (choices 가 빈 조각)
+            stream_options={"include_usage": True}
+        )
+
+        for chunk in stream:
+            if not chunk.choices:
+                continue
+            delta = chunk.choices[0].delta.content
+            start = len(decoder.questions)
+            for offset, question in enumerate(decoder.feed(delta)):
+                if limit is not None and start + offset >= limit:
+                    break
+                yield sse_event("question", {"index": len(prefix) + start + offset, "question": question})
+
+    except Exception as e:
+        yield sse_event("error", {"error": str(e)})
+        return
+
+    if not decoder.questions:
+        yield sse_event("error", {"error": "AI 응답 파싱 실패", "raw": decoder.buffer})
+        return
+
+    questions = prefix + decoder.questions[:limit]
+    if on_complete is not None:
+        on_complete(questions)
+
+    # interviewId 는 모델이 아니라 서버가 만든 값을 보냅니다.
+    yield sse_event("done", {"questions": questions, "interviewId": interview_id})
+
+
+def replay_questions(questions, interview_id):
+    # 캐시 등에서 이미 가지고 있는 질문을 같은 이벤트 형식으로 보냅니다.
+    for index, question in enumerate(questions):
+        yield sse_event("question", {"index": index, "question": question})
+    yield sse_event("done", {"questions": questions, "interviewId": interview_id})
@@ -0,0 +1,261 @@
+# interview/telemetry.py
+# 단계별 처리 시간 / 토큰 사용량 지표 + 요청 ID 로그
+# - 지표는 Prometheus 텍스트 형식으로 /metrics 에서 내보냅니다. (외부 라이브러리 없음, 프로세스별 집계)
+#     interview_stage_seconds{endpoint, stage}       단계별 처리 시간 히스토그램
+#         stage: upload_read / extract / prompt_build / llm_wait / parse / scoring
+#     interview_llm_tokens_total{endpoint, model, type}  resp.usage 의 prompt / completion 토큰 수
+#     interview_llm_requests_total{endpoint, model, status}
+#     interview_http_request_seconds{endpoint, method, status}
+# - endpoint 라벨은 Flask 뷰 함수 이름(generate_question 등)이고, 요청 밖(배치 평가 등)에서는
+#   호출한 쪽이 넘긴 이름을 씁니다.
+# - 요청마다 X-Request-ID (없으면 새로 만듦)를 contextvar 에 넣어 두고,
+#   로그 한 줄마다 requestId / endpoint 로 붙입니다. 응답 헤더에도 같은 값을 돌려줍니다.
+#   (백그라운드 스레드로 넘기는 작업은 bind_context() 로 감싸면 같은 요청 ID 로 남습니다.)
+#
+# 사용법:
+#   init_telemetry(app)
+#   with stage("prompt_build"):
+#       ...
+import contextvars
+import json
+import logging
+import os
+import re
+import threading
+import time
+import uuid
+from contextlib import contextmanager
+
+LOG_FORMAT = os.getenv("LOG_FORMAT", "json")       # json / text
+LOG_LEVEL = os.getenv("LOG_LEVEL", "INFO")
+
+# 초 단위 버킷 (파일 파싱 몇 ms ~ LLM 응답 수십 초)
+STAGE_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10, 20, 30, 60)
+
+_request_id = contextvars.ContextVar("request_id", default=None)
+_endpoint = contextvars.ContextVar("endpoint", default=None)
+
+_REQUEST_ID = re.compile(r"^[A-Za-z0-9._-]{1,64}$")
+
+
+def current_request_id():
+    return _request_id.get()
+
+
+def current_endpoint(default="-"):
+    return _endpoint.get() or default
+
+
+def bind_context(fn):
+    """지금 요청의 contextvar(요청 ID / endpoint)를 그대로 가지고 다른 스레드에서 fn 을 실행하게 합니다."""
+    ctx = contextvars.copy_context()
+    return lambda *args, **kwargs: ctx.run(fn, *args, **kwargs)
+
+
+# -------------------------
+# 지표
+# -------------------------
+def _label_text(names, values):
+    pairs = []
+    for name, value in zip(names, values):
+        value = str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+        pairs.append(f'{name}="{value}"')
+    return "{" + ",".join(pairs) + "}" if pairs else ""
+
+
+class Counter:
+    def __init__(self, name, help_text, labels=()):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self._values = {}
+        self._lock = threading.Lock()
+
+    def inc(self, amount=1, **labels):
+        key = tuple(labels.get(name, "") for name in self.labels)
+        with self._lock:
+            self._values[key] = self._values.get(key, 0) + amount
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} counter"]
+        with self._lock:
+            items = sorted(self._values.items())
+        for key, value in items:
+            lines.append(f"{self.name}{_label_text(self.labels, key)} {value}")
+        return lines
+
+
+class Histogram:
+    def __init__(self, name, help_text, labels=(), buckets=STAGE_BUCKETS):
+        self.name = name
+        self.help = help_text
+        self.labels = tuple(labels)
+        self.buckets = tuple(sorted(buckets))
+        self._values = {}       # labels -> [버킷별 개수..., 합계, 개수]
+        self._lock = threading.Lock()
+
+    def observe(self, seconds, **labels):
+        key = tuple(labels.get(name, "") for name in self.labels)
+        with self._lock:
+            entry = self._values.get(key)
+            if entry is None:
+                entry = self._values[key] = [0] * len(self.buckets) + [0.0, 0]
+            for i, bound in enumerate(self.buckets):
+                if seconds <= bound:
+                    entry[i] += 1
+                    break
+            entry[-2] += seconds
+            entry[-1] += 1
+
+    def render(self):
+        lines = [f"# HELP {self.name} {self.help}", f"# TYPE {self.name} histogram"]
+        with self._lock:
+            items = sorted((key, list(entry)) for key, entry in self._values.items())
+        names = self.labels + ("le",)
+        for key, entry in items:
+            cumulative = 0
+            for bound, count in zip(self.buckets, entry):
+                cumulative += count
+                lines.append(f"{self.name}_bucket{_label_text(names, key + (bound,))} {cumulative}")
+            lines.append(f"{self.name}_bucket{_label_text(names, key + ('+Inf',))} {entry[-1]}")
+            lines.append(f"{self.name}_sum{_label_text(self.labels, key)} {round(entry[-2], 6)}")
+            lines.append(f"{self.name}_count{_label_text(self.labels, key)} {entry[-1]}")
+        return lines
+
+
+class Registry:
+    def __init__(self):
+        self._metrics = []
+
+    def register(self, metric):
+        self._metrics.append(metric)
+        return metric
+
+    def render(self):
+        lines = []
+        for metric in self._metrics:
+            lines.extend(metric.render())
+        return "\n".join(lines) + "\n"
+
+
+registry = Registry()
+
+STAGE_SECONDS = registry.register(Histogram(
+    "interview_stage_seconds", "Time spent in each request stage", ("endpoint", "stage")))
+LLM_TOKENS = registry.register(Counter(
+    "interview_llm_tokens_total", "Tokens reported in resp.usage", ("endpoint", "model", "type")))
+LLM_REQUESTS = registry.register(Counter(
+    "interview_llm_requests_total", "LLM calls by outcome", ("endpoint", "model", "status")))
+HTTP_SECONDS = registry.register(Histogram(
+    "interview_http_request_seconds", "HTTP handler time (until the response starts)",
+    ("endpoint", "method", "status")))
+
+
+@contextmanager
+def stage(name, endpoint=None):
+    started = time.perf_counter()
+    try:
+        yield
+    finally:
+        STAGE_SECONDS.observe(time.perf_counter() - started, endpoint=current_endpoint(endpoint or "-"), stage=name)
+
+
+def observe_stage(name, seconds, endpoint=None):
+    STAGE_SECONDS.observe(seconds, endpoint=current_endpoint(endpoint or "-"), stage=name)
+
+
+def record_usage(usage, model, endpoint=None):
+    # usage 는 openai 응답의 resp.usage (없으면 기록하지 않음)
+    if usage is None:
+        return
+    endpoint = current_endpoint(endpoint or "-")
+    for kind in ("prompt", "completion"):
+        tokens = getattr(usage, f"{kind}_tokens", None)
+        if tokens:
+            LLM_TOKENS.inc(tokens, endpoint=endpoint, model=model, type=kind)
+
+
+# -------------------------
+# 구조화 로그
+# -------------------------
+class RequestContextFilter(logging.Filter):
+    def filter(self, record):
+        record.request_id = _request_id.get() or "-"
+        record.endpoint = _endpoint.get() or "-"
+        return True
+
+
+class JsonFormatter(logging.Formatter):
+    def format(self, record):
+        entry = {
+            "ts": self.formatTime(record, "%Y-%m-%dT%H:%M:%S"),
+            "level": record.levelname,
+            "logger": record.name,
+            "requestId": getattr(record, "request_id", "-"),
+            "endpoint": getattr(record, "endpoint", "-"),
+            "message": record.getMessage(),
+        }
+        if record.exc_info:
+            entry["exception"] = self.formatException(record.exc_info)
+        return json.dumps(entry, ensure_ascii=False)
+
+
+def configure_logging():
+    # 루트 로거에 핸들러 하나만 둡니다. (Flask app.logger / interview.* 로거가 모두 여기로 전파)
+    root = logging.getLogger()
+    if any(getattr(h, "_interview_telemetry", False) for h in root.handlers):
+        return
+    handler = logging.StreamHandler()
+    handler._interview_telemetry = True
+    handler.addFilter(RequestContextFilter())
+    if LOG_FORMAT == "json":
+        handler.setFormatter(JsonFormatter())
+    else:
+        handler.setFormatter(logging.Formatter(
+            "%(asctime)s %(levelname)s [%(request_id)s %(endpoint)s] %(name)s: %(message)s"))
+    root.addHandler(handler)
+    root.setLevel(LOG_LEVEL)
+
+
+# -------------------------
+# Flask 연결
+# -------------------------
+def init_telemetry(app, metrics_path="/metrics"):
+    """
+    요청 ID / endpoint contextvar 설정, 요청 시간 기록, /metrics 라우트를 붙입니다.
+
+    LOG_FORMAT   json(기본) / text
+    LOG_LEVEL    루트 로거 레벨 (기본 INFO)
+    """
+    from flask import Response, g, request
+
+    configure_logging()
+    # Flask 기본 핸들러가 있으면 같은 줄이 두 번 찍히므로 루트 핸들러로만 보냅니다.
+    from flask.logging import default_handler
+    app.logger.removeHandler(default_handler)
+
+    @app.before_request
+    def _start_request():
+        request_id = request.headers.get("X-Request-ID", "")
+        if not _REQUEST_ID.match(request_id):
+            request_id = uuid.uuid4().hex
+        g.request_id = request_id
+        g.request_started = time.perf_counter()
+        _request_id.set(request_id)
+        _endpoint.set(request.endpoint or "-")
+
+    @app.after_request
+    def _finish_request(response):
+        started = g.get("request_started")
+        if started is not None:
+            HTTP_SECONDS.observe(time.perf_counter() - started, endpoint=request.endpoint or "-",
+                                 method=request.method, status=str(response.status_code))
+        if g.get("request_id"):
+            response.headers["X-Request-ID"] = g.request_id
+        return response
+
+    def metrics():
+        return Response(registry.render(), mimetype="text/plain; version=0.0.4")
+
+    app.add_url_rule(metrics_path, "metrics", metrics, methods=["GET"])
+    return app
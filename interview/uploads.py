@@ -0,0 +1,137 @@
+# interview/uploads.py
+# 업로드 크기 제한 / 디스크 스풀 / 파일 형식 판별(magic bytes)
+# - 요청 본문 전체는 MAX_CONTENT_LENGTH(UPLOAD_MAX_BYTES + 폼 여유분)로 막습니다.
+#   Content-Length 가 이 값을 넘으면 본문을 읽기 전에 413 을 돌려줍니다.
+# - 업로드 파일은 요청 크기가 UPLOAD_SPOOL_BYTES 이하면 메모리(BytesIO),
+#   넘으면 처음부터 이름 있는 임시 파일로 받습니다. (PDF 는 이 파일을 mmap 으로 엽니다.)
+# - 파일 형식은 확장자가 아니라 앞부분 바이트로 판별합니다.
+#     pdf  : "%PDF-"
+#     docx : zip("PK\x03\x04") 이고 word/document.xml 이 있음 (중앙 디렉터리만 읽음)
+#     txt  : 앞부분에 NUL 이 없고 UTF-8 로 읽힘
+#   확장자와 내용이 다르면(이름만 .pdf 인 파일 등) 파싱하기 전에 거절합니다.
+import codecs
+import io
+import os
+import tempfile
+import zipfile
+
+from flask import Request, jsonify
+from werkzeug.exceptions import RequestEntityTooLarge
+
+UPLOAD_MAX_BYTES = int(os.getenv("UPLOAD_MAX_BYTES", str(10 * 1024 * 1024)))      # 파일 하나의 최대 크기
+UPLOAD_SPOOL_BYTES = int(os.getenv("UPLOAD_SPOOL_BYTES", str(512 * 1024)))        # 이보다 크면 디스크로 받음
+UPLOAD_FORM_BYTES = int(os.getenv("UPLOAD_FORM_BYTES", str(256 * 1024)))          # 파일 외 폼 필드(자기소개서 등) 여유분
+UPLOAD_DIR = os.getenv("UPLOAD_DIR") or None                                        # 임시 파일 위치 (기본: 시스템 임시 폴더)
+
+SNIFF_BYTES = 4096
+
+
+class FileTooLarge(ValueError):
+    pass
+
+
+class MislabeledFile(ValueError):
+    """확장자와 실제 내용(magic bytes)이 다른 파일"""
+
+    def __init__(self, extension, detected):
+        super().__init__(f".{extension} 파일이 아닙니다. (내용: {detected or '알 수 없음'})")
+        self.extension = extension
+        self.detected = detected
+
+
+def format_bytes(size):
+    if size >= 1024 * 1024:
+        return f"{size / (1024 * 1024):.0f}MB"
+    return f"{size / 1024:.0f}KB"
+
+
+# -------------------------
+# 업로드 스트림 (메모리 / 디스크)
+# -------------------------
+class UploadRequest(Request):
+    def _get_file_stream(self, total_content_length, content_type, filename=None, content_length=None):
+        # 요청 크기를 보고 처음부터 정합니다. (Content-Length 가 없으면 디스크)
+        if total_content_length is not None and total_content_length <= UPLOAD_SPOOL_BYTES:
+            return io.BytesIO()
+        # 이름 있는 임시 파일이라 PDF 프로세스 풀 워커도 같은 파일을 mmap 으로 열 수 있습니다.
+        # 요청이 끝나 파일이 닫히면 지워집니다.
+        return tempfile.NamedTemporaryFile("w+b", prefix="upload-", dir=UPLOAD_DIR)
+
+
+def install_upload_limits(app):
+    """
+    UPLOAD_MAX_BYTES    업로드 파일 하나의 최대 크기 (기본 10MB)
+    UPLOAD_SPOOL_BYTES  이보다 큰 요청은 파일을 디스크 임시 파일로 받음 (기본 512KB)
+    UPLOAD_FORM_BYTES   파일 외 폼 필드에 허용하는 여유분 (기본 256KB)
+    UPLOAD_DIR          임시 파일 폴더
+    """
+    app.request_class = UploadRequest
+    app.config["MAX_CONTENT_LENGTH"] = UPLOAD_MAX_BYTES + UPLOAD_FORM_BYTES
+
+    @app.errorhandler(RequestEntityTooLarge)
+    def _too_large(e):
+        return jsonify({"error": f"업로드 크기는 최대 {format_bytes(UPLOAD_MAX_BYTES)} 입니다."}), 413
+
+    return app
+
+
+# -------------------------
+# 크기 / 형식 확인
+# -------------------------
+def stream_size(stream):
+    position = stream.tell()
+    stream.seek(0, os.SEEK_END)
+    size = stream.tell()
+    stream.seek(position)
+    return size
+
+
+def _looks_like_text(head, complete):
+    if b"\x00" in head:
+        return False
+    try:
+        # 잘라 읽은 앞부분이라 마지막 글자가 중간에 끊겼을 수 있습니다. (final=complete)
+        codecs.getincrementaldecoder("utf-8")().decode(head, final=complete)
+    except UnicodeDecodeError:
+        return False
+    return True
+
+
+def _is_docx(stream):
+    try:
+        with zipfile.ZipFile(stream) as archive:
+            return "word/document.xml" in archive.namelist()
+    except zipfile.BadZipFile:
+        return False
+
+
+def sniff_type(stream):
+    """앞부분 바이트로 pdf / docx / txt 중 하나를 돌려줍니다. (모르면 None, 읽은 뒤 위치는 처음으로)"""
+    stream.seek(0)
+    head = stream.read(SNIFF_BYTES)
+    complete = len(head) < SNIFF_BYTES
+    try:
+        if head.startswith(b"%PDF-"):
+            return "pdf"
+        if head.startswith(b"PK\x03\x04"):
+            return "docx" if _is_docx(stream) else None
+        if _looks_like_text(head, complete):
+            return "txt"
+        return None
+    finally:
+        stream.seek(0)
+
+
+def check_upload(stream, extension):
+    """
+    파싱하기 전에 업로드 파일의 크기와 형식을 확인하고, magic bytes 로 판별한 형식을 돌려줍니다.
+    너무 크면 FileTooLarge, 확장자와 내용이 다르면 MislabeledFile.
+    """
+    size = stream_size(stream)
+    if size > UPLOAD_MAX_BYTES:
+        raise FileTooLarge(f"{format_bytes(size)} (최대 {format_bytes(UPLOAD_MAX_BYTES)})")
+
+    detected = sniff_type(stream)
+    if detected != extension:
+        raise MislabeledFile(extension, detected)
+    return detected
@@ -0,0 +1,20 @@
+# interview/web
+# 면접 API 앱 팩토리
+# - 예전에는 app_interview_basic.py / app_interview_basic2.py / 주석 버전 / env/app.py 가
+#   같은 서비스를 조금씩 바꿔 복사한 파일이었습니다. 이제 create_app(variant) 하나로 만들고,
+#   예전 파일은 이 함수를 부르는 얇은 진입점만 남겼습니다. (실행 방법은 그대로)
+# - 변형별 차이는 기능 플래그로 둡니다. (interview/web/features.py)
+#
+# 사용법:
+#   from interview.web import create_app
+#   app = create_app("basic2")
+#   (운영) python -m interview.serve app_interview_basic2
+from dotenv import load_dotenv
+
+# interview.* 모듈은 import 할 때 환경 변수를 읽으므로 .env 를 먼저 불러옵니다.
+load_dotenv()
+
+from interview.web.factory import Services, create_app  # noqa: E402
+from interview.web.features import VARIANTS, resolve_features  # noqa: E402
+
+__all__ = ["Services", "VARIANTS", "create_app", "resolve_features"]
@@ -0,0 +1,166 @@
+# interview/web/factory.py
+# 앱 팩토리: 변형(variant)과 기능 플래그(interview/web/features.py)대로 Flask 앱을 만듭니다.
+# - 라우트는 기능별 register_* 함수가 붙이고, 꺼진 기능의 모듈은 import 하지 않습니다.
+# - LLM 클라이언트는 LazyClient 로 두고 첫 호출 때 만듭니다. (openai / httpx import 포함)
+# - PyPDF2 / python-docx 도 첫 PDF / DOCX 업로드 때 import 합니다. (interview/pdf.py, interview/resume.py)
+import os
+import threading
+
+from flask import Flask
+
+from interview.llm_client import LazyClient
+from interview.router import build_model_router
+from interview.telemetry import init_telemetry
+from interview.web.features import resolve_features
+
+
+class Services:
+    """앱 하나가 같이 쓰는 객체 모음 (register_* 함수에 넘김, app.extensions["interview"])"""
+
+    def __init__(self, api_key, features):
+        self.features = features
+
+        # 공용 클라이언트 (연결 풀 / timeout / 재시도 / 서킷 브레이커), 첫 LLM 호출 때 만듦
+        self.client = LazyClient(api_key)
+
+        # 엔드포인트별로 프롬프트 크기 / 최근 지연 시간(p95)을 보고 모델을 고르는 라우터
+        self.router = build_model_router(self.client)
+
+        self.session_store = self.question_cache = self.question_bank = None
+        self.job_queue = self.answer_evaluator = self.single_flight = self.admission = None
+
+        if features["admission"]:
+            from interview.admission import build_admission_controller
+
+            # LLM 호출의 입장 제어 (submit > answer > create 우선, 넘치면 429 / 503 + Retry-After)
+            # 전체 토큰 / 동시 호출 수는 라우터가 LLM 을 부를 때마다 확인합니다.
+            self.admission = build_admission_controller()
+            self.router.admission = self.admission
+
+        if features["question_api"] or features["submit"]:
+            from interview.singleflight import build_single_flight
+
+            # 같은 질문 생성 / 제출이 처리 도중에 또 들어오면 LLM 호출 하나로 합침 (워커 프로세스끼리도)
+            self.single_flight = build_single_flight()
+
+        if features["question_api"]:
+            from interview.cache import build_question_cache
+            from interview.question_bank import build_question_bank
+            from interview.sessions import build_session_store
+
+            # 서버 쪽 면접 세션 저장소 (질문 / 답변 / 질문별 중간 결과, SESSION_DB)
+            self.session_store = build_session_store()
+            # 질문 생성 캐시 (QUESTION_CACHE_SIZE=0 이면 사용 안 함)
+            self.question_cache = build_question_cache()
+            # 미리 만들어 둔 직무별 질문 은행 (QUESTION_BANK_PATH, 파일이 없으면 항상 LLM 으로 생성)
+            self.question_bank = build_question_bank()
+
+        if features["async_jobs"]:
+            from interview.jobs import build_job_queue
+
+            # 비동기 제출(202 Accepted)용 평가 작업 큐 (워커 스레드는 첫 작업 때 시작,
+            # 상태는 세션 DB 에도 기록해서 다른 워커 프로세스도 조회)
+            self.job_queue = build_job_queue(store=self.session_store)
+
+        if features["answer_api"]:
+            from interview.incremental import build_incremental_evaluator
+
+            # 면접 진행 중 답변별 미리 평가 (최종 제출 때는 모으기만 함)
+            self.answer_evaluator = build_incremental_evaluator(
+                self.router.client("answer"), "gpt-4o-mini", store=self.session_store)
+
+    def process_local_features(self):
+        """상태를 이 프로세스 메모리에만 두는 기능 이름 (여러 워커 프로세스로 띄우면 다른 워커가 못 찾음)"""
+        local = []
+        if self.job_queue is not None and self.job_queue.store is None:
+            local.append("async_jobs")
+        if self.answer_evaluator is not None and self.answer_evaluator.store is None:
+            local.append("answer_api")
+        return local
+
+
+def warm_up(services):
+    """첫 요청이 기다리지 않도록 LLM 클라이언트와 문서 파서를 미리 준비합니다."""
+    services.client.chat    # get_client() (openai / httpx import + 연결 풀)
+    if services.features["question_api"]:
+        import docx  # noqa: F401
+        import PyPDF2  # noqa: F401
+
+
+def create_app(variant=None, import_name="interview.web", **overrides):
+    """
+    variant 를 생략하면 APP_VARIANT 를 씁니다. overrides 로 기능 플래그를 직접 바꿀 수도 있습니다.
+    (템플릿 폴더는 import_name 모듈이 있는 폴더 기준 templates/)
+
+    APP_VARIANT     basic / basic2(기본) / env
+    APP_FEATURES    기능 플래그 덮어쓰기, 예: "async_jobs=off,submit=report"
+    OPENAI_API_KEY  없으면 EnvironmentError
+    APP_WARMUP      1 이면 앱을 만든 뒤 백그라운드 스레드에서 warm_up() (기본 0: 처음 쓸 때 준비)
+    SERVE_WORKERS   워커 프로세스 수 (interview/serve.py 가 설정). 2 이상인데 프로세스 메모리에만
+                    상태를 두는 기능이 켜져 있으면 RuntimeError
+    """
+    variant = variant or os.getenv("APP_VARIANT", "basic2")
+    features = resolve_features(variant, overrides)
+
+    api_key = os.getenv("OPENAI_API_KEY")
+    if not api_key:
+        raise EnvironmentError("OPENAI_API_KEY 환경변수가 설정되어 있지 않습니다. (.env 파일을 확인하세요)")
+
+    app = Flask(import_name)
+    if features["cors"]:
+        from flask_cors import CORS
+        CORS(app)
+
+    # 요청 ID 로그 + 단계별 처리 시간 / 토큰 사용량 지표 (GET /metrics, Prometheus 형식)
+    init_telemetry(app)
+
+    services = Services(api_key, features)
+    local = services.process_local_features()
+    if int(os.getenv("SERVE_WORKERS", "1")) > 1 and local:
+        # 작업 ID / 미리 평가한 결과를 받은 워커만 알고 있으면, 다른 워커로 간 조회가 404 가 됩니다.
+        raise RuntimeError(
+            f"{', '.join(local)} 의 상태가 프로세스 안에만 있어 여러 워커로 띄울 수 없습니다. "
+            f"(--workers 1 로 실행하거나 APP_FEATURES 로 끄세요)")
+    app.extensions["interview"] = services
+    app.config["APP_VARIANT"] = variant
+
+    if features["admission"]:
+        from interview.admission import install_admission
+
+        # 요청 ID 가 붙은 뒤에 거르도록 init_telemetry 다음에 붙입니다.
+        install_admission(app, services.admission)
+
+    if features["question_api"]:
+        from interview.uploads import install_upload_limits
+        from interview.web.questions import register_question_api
+
+        # 업로드 크기 제한 (UPLOAD_MAX_BYTES), 큰 파일은 디스크 임시 파일로 받기
+        install_upload_limits(app)
+        register_question_api(app, services)
+
+    if features["submit"]:
+        from interview.web import submit
+
+        submit.register_submit_api(app, services)
+        if features["answer_api"]:
+            submit.register_answer_api(app, services)
+        if features["async_jobs"]:
+            submit.register_job_api(app, services)
+
+    if features["index_page"] or features["legacy_api"]:
+        from interview.web import legacy
+
+        if features["index_page"]:
+            legacy.register_index_page(app, services)
+        if features["legacy_api"]:
+            legacy.register_legacy_api(app, services)
+
+    if features["stats_api"] or features["legacy_api"]:
+        from interview.web.stats import register_stats_api
+        register_stats_api(app, services)
+
+    if os.getenv("APP_WARMUP", "0") == "1":
+        # import 는 바로 끝내고(헬스 체크 통과), 무거운 준비는 요청을 받는 동안 뒤에서 합니다.
+        threading.Thread(target=warm_up, args=(services,), name="app-warmup", daemon=True).start()
+
+    return app
@@ -0,0 +1,87 @@
+# interview/web/features.py
+# 앱 변형(variant)별 기능 플래그
+# - 예전에는 앱 파일마다 코드를 복사해서 조금씩 바꿨는데, 이제 차이는 여기 플래그로만 둡니다.
+#     question_api : POST /api/interview/create (이력서 업로드 + 질문 생성, 세션 / 캐시 / 질문 은행)
+#     submit       : POST /api/interview/submit 방식
+#                    "report" = LLM 이 성적표 JSON 을 바로 만듦 (app_interview_basic.py)
+#                    "scored" = 질문별 평가 + 가중치 점수 계산 (app_interview_basic2.py)
+#                    None     = 제출 API 없음
+#     answer_api   : POST /api/interview/answer (면접 진행 중 답변별 미리 평가)
+#     async_jobs   : Prefer: respond-async 제출(202) + /api/interview/jobs/* 조회 API
+#     stats_api    : /api/cache/stats, /api/parser/stats, /api/router/stats
+#     legacy_api   : 예전 env/app.py 의 /generate_questions, /analyze_answer, /parser_stats, /router_stats
+#     index_page   : GET / 에서 templates/index.html 렌더링
+#     cors         : flask_cors 로 모든 출처 허용
+#     admission    : LLM 을 부르는 라우트의 입장 제어 (클라이언트별 / 전체 토큰 버킷, 우선순위 대기열, interview/admission.py)
+# - APP_FEATURES 환경 변수로 몇 개만 덮어쓸 수 있습니다. 예: APP_FEATURES="async_jobs=off,submit=report"
+import os
+
+VARIANTS = {
+    "basic": {
+        "question_api": True, "submit": "report", "answer_api": False, "async_jobs": False,
+        "stats_api": True, "legacy_api": False, "index_page": False, "cors": False,
+        "admission": True,
+    },
+    "basic2": {
+        "question_api": True, "submit": "scored", "answer_api": True, "async_jobs": True,
+        "stats_api": True, "legacy_api": False, "index_page": False, "cors": False,
+        "admission": True,
+    },
+    "env": {
+        "question_api": False, "submit": None, "answer_api": False, "async_jobs": False,
+        "stats_api": False, "legacy_api": True, "index_page": True, "cors": True,
+        "admission": True,
+    },
+}
+
+SUBMIT_MODES = (None, "report", "scored")
+
+_TRUE = ("1", "true", "on", "yes")
+_FALSE = ("0", "false", "off", "no", "none", "")
+
+
+def _parse_value(name, value):
+    text = value.strip().lower()
+    if name == "submit":
+        return None if text in _FALSE else text
+    if text in _TRUE:
+        return True
+    if text in _FALSE:
+        return False
+    raise ValueError(f"기능 플래그 값이 잘못되었습니다: {name}={value} (on / off)")
+
+
+def parse_feature_overrides(spec):
+    """ "async_jobs=off,submit=report" -> {"async_jobs": False, "submit": "report"} """
+    overrides = {}
+    for item in (spec or "").split(","):
+        if not item.strip():
+            continue
+        name, sep, value = item.partition("=")
+        if not sep:
+            raise ValueError(f"기능 플래그 형식이 잘못되었습니다: {item} (이름=값)")
+        overrides[name.strip()] = _parse_value(name.strip(), value)
+    return overrides
+
+
+def resolve_features(variant, overrides=None):
+    """변형 기본값 <- APP_FEATURES <- 코드에서 넘긴 overrides 순서로 덮어쓴 플래그를 돌려줍니다."""
+    if variant not in VARIANTS:
+        raise ValueError(f"알 수 없는 앱 변형입니다: {variant} ({' / '.join(VARIANTS)})")
+
+    features = dict(VARIANTS[variant])
+    for source in (parse_feature_overrides(os.getenv("APP_FEATURES")), overrides or {}):
+        for name, value in source.items():
+            if name not in features:
+                raise ValueError(f"알 수 없는 기능 플래그입니다: {name}")
+            features[name] = value
+
+    if features["submit"] not in SUBMIT_MODES:
+        raise ValueError(f"submit 은 report / scored / off 중 하나여야 합니다: {features['submit']}")
+    if (features["answer_api"] or features["async_jobs"]) and features["submit"] != "scored":
+        # 답변별 미리 평가 결과와 비동기 작업은 질문별 평가(scored) 제출과 같이 씁니다.
+        raise ValueError("answer_api / async_jobs 는 submit=scored 일 때만 켤 수 있습니다.")
+    if features["submit"] and not features["question_api"]:
+        # 제출은 질문 생성 때 만든 세션(interviewId)을 씁니다.
+        raise ValueError("submit 을 켜려면 question_api 도 켜야 합니다.")
+    return features
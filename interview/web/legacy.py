@@ -0,0 +1,184 @@
+# interview/web/legacy.py
+# 예전 env/app.py 화면과 API (legacy_api / index_page)
+# - GET  /                    templates/index.html
+# - POST /generate_questions  직무만 받아 질문 5개 생성
+# - POST /analyze_answer      질문 + 답변 하나를 5개 기준으로 채점
+from flask import jsonify, render_template, request
+
+from interview.admission import Rejected, rejected_response
+from interview.llm_json import Optional, StructuredOutputError, parse_llm_json
+
+# AI 응답 JSON 스키마 (interview/llm_json.py)
+QUESTIONS_SCHEMA = {"questions": [{"question": str}]}
+ANALYSIS_SCHEMA = {
+    "scores": Optional({
+        "job_fit": Optional(int, 0),
+        "logic": Optional(int, 0),
+        "attitude": Optional(int, 0),
+        "specificity": Optional(int, 0),
+        "keywords": Optional(int, 0)
+    }, {"job_fit": 0, "logic": 0, "attitude": 0, "specificity": 0, "keywords": 0}),
+    "strengths": Optional([str], []),
+    "weaknesses": Optional([str], [])
+}
+
+
+def register_index_page(app, services):
+    @app.get("/")
+    def home():
+        return render_template("index.html")
+
+
+def register_legacy_api(app, services):
+    router = services.router
+
+    @app.post("/generate_questions")
+    def generate_questions():
+        """
+        요청(JSON):
+        {
+            "job_position": "데이터 분석가"
+        }
+
+        응답(JSON):
+        {
+            "questions": [
+                {"question": "이 직무를 선택한 이유는 무엇인가요?"},
+                {"question": "데이터 분석 과정에서 가장 중요한 단계는 무엇이라고 생각하나요?"},
+                ...
+            ]
+        }
+        """
+        data = request.get_json(silent=True) or {}
+        job = (data.get("job_position") or "").strip()
+
+        if not job:
+            return jsonify({"error": "직무(job_position)는 필수 입력 항목입니다."}), 400
+
+        prompt = f"""
+당신은 면접관입니다. 사용자가 지원하는 직무에 맞추어 실제 면접에서 사용할 질문 5개를 생성하세요.
+각 질문은 명확하고 실무 중심이어야 하며, 불필요한 팁이나 설명은 포함하지 마세요.
+
+출력 형식은 아래 JSON 구조를 따르세요:
+{{
+  "questions": [
+    {{"question": "질문 1"}},
+    {{"question": "질문 2"}},
+    {{"question": "질문 3"}},
+    {{"question": "질문 4"}},
+    {{"question": "질문 5"}}
+  ]
+}}
+
+지원 직무: {job}
+"""
+
+        try:
+            resp = router.create(
+                "generate_questions",
+                model="gpt-5-mini",
+                messages=[
+                    {"role": "system", "content": "당신은 전문 면접관입니다. 사용자의 직무에 맞는 질문을 구성합니다."},
+                    {"role": "user", "content": prompt}
+                ]
+            )
+
+            raw = resp.choices[0].message.content
+
+            # 모델의 JSON 파싱 시도 (앞뒤 설명문, trailing comma, 잘린 응답은 고쳐서 사용)
+            try:
+                parsed = parse_llm_json(raw, QUESTIONS_SCHEMA, "generate_questions")
+                return jsonify(parsed), 200
+            except StructuredOutputError:
+                # JSON 파싱 실패 시 원문 반환
+                return jsonify({
+                    "warning": "모델 응답을 JSON으로 파싱하지 못했습니다. raw 필드를 확인하세요.",
+                    "raw": raw
+                }), 200
+
+        except Rejected as e:
+            return rejected_response(e)
+
+        except Exception as e:
+            app.logger.exception("질문 생성 실패")
+            return jsonify({"error": f"OpenAI 호출 실패: {e}"}), 500
+
+    @app.post("/analyze_answer")
+    def analyze_answer():
+        # numpy 를 쓰는 모듈이라 처음 분석할 때 import 합니다. (앱 시작 시간에 넣지 않음)
+        from interview.similarity import answer_cache
+
+        data = request.get_json(silent=True) or {}
+        question = data.get("question", "").strip()
+        answer = data.get("answer", "").strip()
+
+        if not question or not answer:
+            return jsonify({"error": "question과 answer는 필수입니다."}), 400
+
+        # 같은 질문에 거의 같은 답변을 이미 분석했으면 그 결과를 재사용 ("cache" 로 표시)
+        if answer_cache is not None:
+            cached = answer_cache.get("analyze_answer", question, answer)
+            if cached is not None:
+                return jsonify(cached), 200
+
+        prompt = f"""
+당신은 면접 평가 전문가입니다.
+다음 질문과 답변을 보고 아래 5개 기준에 대해 0~100 점수를 정수로 매기세요.
+
+반드시 아래 JSON 형식만 출력하세요:
+
+{{
+  "scores": {{
+    "job_fit": <0-100>,
+    "logic": <0-100>,
+    "attitude": <0-100>,
+    "specificity": <0-100>,
+    "keywords": <0-100>
+  }},
+  "strengths": ["문장1","문장2"],
+  "weaknesses": ["문장1","문장2"]
+}}
+
+질문: {question}
+답변: {answer}
+"""
+
+        try:
+            # gpt-5-nano → gpt-5-mini (JSON 안정성 크게 증가)
+            resp = router.create(
+                "analyze_answer",
+                model="gpt-5-mini",
+                messages=[
+                    {"role": "system", "content": "당신은 면접 평가 전문가입니다."},
+                    {"role": "user", "content": prompt}
+                ]
+                # temperature 절대 넣지 않음 (모델 제한 때문)
+            )
+
+            raw = resp.choices[0].message.content
+
+            # JSON 파싱 (앞뒤 설명문 / trailing comma / 잘림 / "85" 같은 문자열 점수는 고쳐서 사용)
+            try:
+                parsed = parse_llm_json(raw, ANALYSIS_SCHEMA, "analyze_answer")
+            except StructuredOutputError:
+                return jsonify({"warning": "JSON 파싱 실패", "raw": raw}), 200
+
+            # 기본값 처리 (없는 점수는 스키마에서 0 으로 채움)
+            s = parsed["scores"]
+            normalized = {key: s[key] for key in ("job_fit", "logic", "attitude", "specificity", "keywords")}
+
+            result = {
+                "scores": normalized,
+                "strengths": parsed.get("strengths", []),
+                "weaknesses": parsed.get("weaknesses", [])
+            }
+            if answer_cache is not None:
+                answer_cache.put("analyze_answer", question, answer, result)
+            return jsonify(result), 200
+
+        except Rejected as e:
+            return rejected_response(e)
+
+        except Exception as e:
+            app.logger.exception("답변 분석 실패")
+            return jsonify({"error": f"분석 실패: {e}"}), 500
@@ -0,0 +1,204 @@
+# interview/web/questions.py
+# 질문 생성 API (POST /api/interview/create)
+# - FormData 로 직무 / 경력 / 자기소개서 / 이력서 파일(txt, pdf, docx)을 받습니다.
+# - 질문 은행 -> 질문 캐시 -> LLM 순서로 질문 5개를 채우고, 서버가 만든 interviewId 로 세션을 엽니다.
+# - Accept: text/event-stream 이면 질문이 완성될 때마다 SSE 로 보냅니다.
+# - 같은 입력(질문 캐시 키)으로 LLM 생성이 진행 중이면 새로 부르지 않고 그 질문을 받아 씁니다. (single-flight)
+#   interviewId / 세션은 요청마다 따로 만듭니다. (다른 지원자와 세션을 같이 쓰지 않도록)
+from flask import jsonify, request
+
+from interview.admission import Rejected, rejected_response
+from interview.cache import question_cache_key
+from interview.llm_json import StructuredOutputError, parse_llm_json
+from interview.prompt_budget import fit_intro
+from interview.resume import UnsupportedFileType, extract_resume_text
+from interview.sessions import new_interview_id
+from interview.singleflight import FlightTimeout, SingleFlightError
+from interview.streaming import replay_questions, stream_questions
+from interview.telemetry import stage
+from interview.uploads import FileTooLarge, MislabeledFile
+from interview.web.responses import event_stream_response, prompt_headers, wants_event_stream
+
+QUESTION_COUNT = 5
+
+# 질문 생성 응답 JSON 스키마 (interview/llm_json.py)
+QUESTIONS_SCHEMA = {"questions": [str]}
+
+
+def register_question_api(app, services):
+    question_cache = services.question_cache
+    question_bank = services.question_bank
+    session_store = services.session_store
+    router = services.router
+    single_flight = services.single_flight
+
+    def store_questions(cache_key, questions):
+        if question_cache is not None and isinstance(questions, list) and questions:
+            question_cache.set(cache_key, {"questions": questions})
+
+    def open_session(interview_id, job, experience, questions):
+        # 서버가 만든 interviewId 로 질문 목록을 저장해 두고, 제출 때는 답변만 받습니다.
+        if isinstance(questions, list) and questions:
+            session_store.create(interview_id, job, experience, questions)
+
+    def questions_response(questions, interview_id, prompt_stats, headers):
+        # 캐시 / 질문 은행처럼 이미 가지고 있는 질문을 JSON 또는 SSE 로 바로 돌려줍니다.
+        headers = {**prompt_headers(prompt_stats), **headers}
+        if wants_event_stream():
+            return event_stream_response(replay_questions(questions, interview_id), headers)
+        resp = jsonify({"questions": questions, "interviewId": interview_id})
+        resp.headers.update(headers)
+        return resp
+
+    @app.post("/api/interview/create")
+    def generate_question():
+        job = request.form.get("job_title", "").strip()
+        experience = request.form.get("experience_level", "").strip()
+        intro = request.form.get("cover_letter", "").strip()
+
+        file = request.files.get("resume_file")
+
+        if file and file.filename != '':
+            try:
+                # 파일 내용(SHA-256) 기준 캐시를 먼저 보고, 없을 때만 파싱
+                intro += "\n" + extract_resume_text(file)
+
+            except UnsupportedFileType:
+                return jsonify({"error": "지원 형식: txt, pdf, docx"}), 400
+
+            except FileTooLarge as e:
+                return jsonify({"error": f"파일 크기 초과: {e}"}), 413
+
+            except MislabeledFile as e:
+                # 확장자만 바꾼 파일은 파싱하지 않고 돌려보냅니다.
+                return jsonify({"error": f"파일 형식 불일치: {e}"}), 400
+
+            except Exception as e:
+                return jsonify({"error": f"파일 읽기 오류: {str(e)}"}), 500
+
+        if not job:
+            return jsonify({"error": "직무를 입력해야 합니다."}), 400
+
+        # 프롬프트 예산: 중복/상투적인 줄 제거, 길면 직무 관련 문단만 남김
+        with stage("prompt_build"):
+            intro, prompt_stats = fit_intro(intro, job)
+        app.logger.info("prompt tokens saved=%d (%d -> %d)", prompt_stats["savedTokens"],
+                        prompt_stats["originalTokens"], prompt_stats["finalTokens"])
+
+        # interviewId 는 서버에서 만들고, 프롬프트와 스트리밍 응답에 같이 사용
+        interview_id = new_interview_id()
+
+        # 질문 은행: 자기소개서와 관련 높은 질문을 바로 고름 (question_source=llm 이면 은행과 캐시를 건너뜀)
+        use_bank = request.form.get("question_source", "auto") != "llm"
+        bank_questions = question_bank.select(job, experience, intro, QUESTION_COUNT) if use_bank else []
+        if len(bank_questions) >= QUESTION_COUNT:
+            open_session(interview_id, job, experience, bank_questions)
+            return questions_response(bank_questions, interview_id, prompt_stats, {"X-Question-Source": "bank"})
+
+        # 캐시 확인 (hit 이어도 interviewId 는 새로 만든 값 사용)
+        cache_key = question_cache_key(job, experience, intro)
+        cached = question_cache.get(cache_key) if question_cache is not None and use_bank else None
+        if cached is not None:
+            open_session(interview_id, job, experience, cached["questions"])
+            return questions_response(cached["questions"], interview_id, prompt_stats,
+                                      {"X-Cache": "HIT", "X-Question-Source": "cache"})
+
+        # 같은 입력으로 생성 중인 요청이 있으면 끝날 때까지 기다렸다가 그 질문을 씁니다.
+        try:
+            flight = single_flight.begin("create", f"{cache_key}:{'auto' if use_bank else 'llm'}")
+        except FlightTimeout:
+            resp = jsonify({"error": "같은 질문을 아직 생성 중입니다. 잠시 후 다시 시도하세요."})
+            resp.headers["Retry-After"] = "5"
+            return resp, 503
+        except SingleFlightError as e:
+            return jsonify({"error": str(e)}), 500
+        except Exception as e:
+            # 같은 프로세스에서 먼저 시작한 생성이 실패한 경우
+            return jsonify({"error": str(e)}), 500
+        if not flight.leader:
+            open_session(interview_id, job, experience, flight.result)
+            return questions_response(flight.result, interview_id, prompt_stats,
+                                      {"X-Cache": "MISS", "X-Question-Source": "coalesced"})
+
+        # 은행에서 못 채운 개수만큼만 LLM 으로 생성합니다.
+        missing = QUESTION_COUNT - len(bank_questions)
+        existing = ""
+        if bank_questions:
+            existing = "\n이미 준비된 질문 (이 질문들과 겹치지 않는 주제로 만드세요):\n" + \
+                "\n".join(f"- {q}" for q in bank_questions) + "\n"
+        example = ",\n    ".join(f'"질문{i}"' for i in range(1, missing + 1))
+
+        prompt = f"""
+당신은 전문 면접관입니다.
+아래 직무, 경력, 자기소개서를 읽고 **면접 질문 {missing}개**를 생성하세요.
+
+직무: {job}
+경력: {experience}
+자기소개서:
+\"\"\"{intro}\"\"\"
+{existing}
+JSON 형식으로만 응답하세요:
+{{
+  "questions": [
+    {example}
+  ]
+}}
+"""
+
+        # 스트리밍 모드: 질문이 완성될 때마다 SSE 이벤트로 전송
+        if wants_event_stream():
+            def events():
+                try:
+                    yield from stream_questions(
+                        router.client("create"), "gpt-5-nano", prompt, interview_id,
+                        on_complete=lambda questions: (
+                            store_questions(cache_key, questions),
+                            open_session(interview_id, job, experience, questions),
+                            flight.finish(questions)
+                        ),
+                        prefix=bank_questions,
+                        limit=missing
+                    )
+                finally:
+                    # 생성 실패 / 연결 끊김: 기다리던 요청 중 하나가 이어서 생성합니다. (끝났으면 아무 일 없음)
+                    flight.abandon()
+
+            return event_stream_response(events(), {
+                **prompt_headers(prompt_stats), "X-Question-Source": "mixed" if bank_questions else "llm"})
+
+        try:
+            resp = router.create(
+                "create",
+                model="gpt-5-nano",
+                messages=[{"role": "user", "content": prompt}],
+                response_format={"type": "json_object"}
+            )
+            raw = resp.choices[0].message.content
+
+            try:
+                result = parse_llm_json(raw, QUESTIONS_SCHEMA, "questions")
+            except StructuredOutputError as e_json:
+                flight.fail(e_json)
+                return jsonify({"error": "AI 응답 파싱 실패", "raw": raw, "details": str(e_json)}), 500
+
+            # interviewId 는 모델이 아니라 서버가 만든 값으로 돌려줍니다.
+            result["interviewId"] = interview_id
+            result["questions"] = bank_questions + result["questions"][:missing]
+            store_questions(cache_key, result.get("questions"))
+            open_session(interview_id, job, experience, result.get("questions"))
+            flight.finish(result["questions"])
+            resp = jsonify(result)
+            resp.headers["X-Cache"] = "MISS"
+            resp.headers["X-Question-Source"] = "mixed" if bank_questions else "llm"
+            resp.headers.update(prompt_headers(prompt_stats))
+            return resp
+
+        except Rejected as e:
+            # LLM 호출 자리를 못 얻음: 기다리던 같은 요청 중 하나가 이어서 시도합니다.
+            flight.abandon()
+            return rejected_response(e)
+
+        except Exception as e:
+            flight.fail(e)
+            app.logger.exception("질문 생성 실패")
+            return jsonify({"error": str(e)}), 500
@@ -0,0 +1,34 @@
+# interview/web/responses.py
+# 여러 라우트가 같이 쓰는 응답 도우미 (SSE / 프롬프트 / completion 토큰 헤더)
+from flask import Response, request, stream_with_context
+
+
+# -------------------------
+# SSE 요청 여부 확인
+# -------------------------
+def wants_event_stream():
+    return "text/event-stream" in request.headers.get("Accept", "")
+
+
+def event_stream_response(events, headers=None):
+    return Response(
+        stream_with_context(events),
+        mimetype="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no", **(headers or {})}
+    )
+
+
+def prompt_headers(prompt_stats):
+    # 요청마다 줄인 토큰 수를 응답 헤더로도 알려줍니다.
+    return {
+        "X-Prompt-Tokens": str(prompt_stats["finalTokens"]),
+        "X-Prompt-Tokens-Saved": str(prompt_stats["savedTokens"])
+    }
+
+
+def completion_headers(completion_stats):
+    # compact 평가 응답으로 줄인 completion 토큰 추정치 (interview/evaluation.py, 실제 사용량이 아님)
+    # compact 호출이 없었으면(EVAL_WIRE=full, 캐시 재사용) 보내지 않습니다.
+    if not completion_stats["finalTokens"]:
+        return {}
+    return {"X-Completion-Tokens-Saved-Estimate": str(completion_stats["savedTokens"])}
@@ -0,0 +1,46 @@
+# interview/web/stats.py
+# 캐시 / AI 응답 파싱 / 모델 라우팅 통계 API
+# - stats_api  : /api/cache/stats, /api/parser/stats, /api/router/stats, /api/admission/stats
+# - legacy_api : 예전 env/app.py 경로 /parser_stats, /router_stats (같은 뷰를 경로만 하나 더 붙임)
+from flask import jsonify
+
+from interview.llm_json import parse_stats
+from interview.resume import resume_cache
+
+
+def register_stats_api(app, services):
+    features = services.features
+    question_cache = services.question_cache
+    router = services.router
+    admission = services.admission
+
+    def cache_stats():
+        # 답변 유사도 캐시는 numpy 를 쓰므로 통계를 볼 때 import 합니다. (앱 시작 시간에 넣지 않음)
+        from interview.similarity import answer_cache
+
+        return jsonify({
+            "questions": question_cache.stats() if question_cache is not None else None,
+            "resumeText": resume_cache.stats() if resume_cache is not None else None,
+            "answers": answer_cache.stats() if answer_cache is not None else None
+        })
+
+    def parser_stats():
+        # AI 응답 JSON 을 엔드포인트별로 그대로 통과(ok) / 고침(repaired) / 실패(failed) 한 횟수
+        return jsonify(parse_stats())
+
+    def router_stats():
+        # 모델별 최근 지연 시간(p50/p95)과 엔드포인트별 라우팅 결정 횟수
+        return jsonify(router.stats())
+
+    def admission_stats():
+        # 레인별 처리 중 / 대기 중 요청 수와 남은 전체 토큰
+        return jsonify(admission.stats() if admission is not None else None)
+
+    if features["stats_api"]:
+        app.add_url_rule("/api/cache/stats", "cache_stats", cache_stats, methods=["GET"])
+        app.add_url_rule("/api/parser/stats", "parser_stats", parser_stats, methods=["GET"])
+        app.add_url_rule("/api/router/stats", "router_stats", router_stats, methods=["GET"])
+        app.add_url_rule("/api/admission/stats", "admission_stats", admission_stats, methods=["GET"])
+    if features["legacy_api"]:
+        app.add_url_rule("/parser_stats", "parser_stats", parser_stats, methods=["GET"])
+        app.add_url_rule("/router_stats", "router_stats", router_stats, methods=["GET"])
@@ -0,0 +1,339 @@
+# interview/web/submit.py
+# 답변 제출 / 평가 API
+# - POST /api/interview/submit         답변 제출 + 평가 (submit 플래그: report / scored)
+# - POST /api/interview/answer         면접 진행 중 답변별 미리 평가 (answer_api)
+# - GET  /api/interview/jobs/...       비동기 평가 작업 조회 (async_jobs)
+# - GET  /api/interview/<id>/result    저장된 성적표 (새로 고침 / 공유 / 다시 보기, ETag 로 304)
+# - submit=scored 에서 EVAL_WIRE=compact 면 평가 응답을 compact 형식으로 받고, 줄인 completion 토큰 추정치를
+#   X-Completion-Tokens-Saved-Estimate 헤더로 알려줍니다.
+import os
+
+from flask import Response, jsonify, request
+
+from interview.admission import Rejected, rejected_response
+from interview.evaluation import build_report, run_evaluation, track_completion_savings
+from interview.jobs import QueueFull
+from interview.llm_json import Optional, StructuredOutputError, parse_llm_json
+from interview.singleflight import FlightTimeout, SingleFlightError, payload_key
+from interview.streaming import sse_event
+from interview.telemetry import stage
+from interview.web.responses import completion_headers, event_stream_response
+
+# 평가 방식: "single" (프롬프트 하나로 전체 평가) / "per_question" (질문별 병렬 평가)
+# 요청 본문의 evalMode 로 요청마다 바꿀 수도 있습니다.
+EVAL_MODE = os.getenv("EVAL_MODE", "single")
+
+# 저장된 성적표 응답의 Cache-Control max-age(초). 지나면 ETag 로 다시 확인합니다. (다시 제출하면 바뀜)
+REPORT_MAX_AGE = int(os.getenv("REPORT_MAX_AGE", "60"))
+
+# submit=report 일 때 LLM 이 만드는 성적표 JSON 스키마 (interview/llm_json.py)
+REPORT_SCHEMA = {
+    "totalScore": int,
+    "grade": str,
+    "radarScores": Optional([float], []),
+    "analysisText": Optional(str, ""),
+    "questions": Optional([{"goodPoints": Optional([str], []), "improvementPoints": Optional([str], [])}], []),
+}
+
+
+class ReportParseError(StructuredOutputError):
+    """submit=report 에서 LLM 성적표 JSON 을 고쳐도 못 읽은 경우 (원문 포함)"""
+
+    def __init__(self, raw, error):
+        super().__init__(str(error))
+        self.raw = raw
+
+
+# -------------------------
+# 요청 본문 확인
+# -------------------------
+def _strings(value):
+    return isinstance(value, list) and all(isinstance(item, str) for item in value)
+
+
+def submission_error(data):
+    """제출 본문 형식이 잘못됐으면 오류 메시지, 괜찮으면 None (null / 숫자 답변 등은 400)"""
+    if not isinstance(data, dict):
+        return "요청 본문은 JSON 객체여야 합니다."
+    if data.get("interviewId") is not None and not isinstance(data["interviewId"], str):
+        return "interviewId는 문자열이어야 합니다."
+    if data.get("answers") is not None and not _strings(data["answers"]):
+        return "answers는 문자열 배열이어야 합니다."
+    qna_list = data.get("qnaList")
+    if qna_list is not None and not (isinstance(qna_list, list) and all(
+            isinstance(item, dict) and isinstance(item.get("question"), str) and isinstance(item.get("answer"), str)
+            for item in qna_list)):
+        return "qnaList는 question / answer 문자열을 가진 객체 배열이어야 합니다."
+    return None
+
+
+def wants_async_job(data):
+    prefer = request.headers.get("Prefer", "")
+    return "respond-async" in prefer or bool(data.get("async"))
+
+
+# -------------------------
+# 평가 방식별 처리
+# -------------------------
+def _llm_report(router, qna_list):
+    # LLM 이 점수 / 등급 / 총평까지 한 번에 만든 성적표를 그대로 씁니다. (submit=report)
+    with stage("prompt_build"):
+        full_text = ""
+        for i, item in enumerate(qna_list):
+            full_text += f"Q{i+1}: {item['question']}\nA: {item['answer']}\n\n"
+
+    prompt = f"""
+당신은 AI 면접관입니다. 지원자의 전체 면접 답변을 분석하여 성적표를 만드세요.
+
+[면접 데이터]
+{full_text}
+
+반드시 아래 JSON 형식으로만 응답하세요 (다른 말 금지):
+{{
+  "totalScore": (0~100점 사이 정수),
+  "grade": "(우수/양호/보통/미흡 중 하나)",
+  "radarScores": [(직무), (논리), (구체성), (키워드), (태도) 각 점수 5개 리스트],
+  "analysisText": "(전체적인 강점과 약점 총평 3문장)",
+  "questions": [
+    {{
+       "id": 1,
+       "title": "(질문 내용)",
+       "answer": "(지원자 답변)",
+       "goodPoints": ["잘한 점1", "잘한 점2"],
+       "improvementPoints": ["아쉬운 점1", "아쉬운 점2"]
+    }},
+    ... (나머지 질문들도 동일하게)
+  ]
+}}
+"""
+    resp = router.create(
+        "submit",
+        model="gpt-4o-mini",
+        messages=[{"role": "user", "content": prompt}],
+        response_format={"type": "json_object"}
+    )
+    raw = resp.choices[0].message.content
+    try:
+        # 형식이 조금 틀려도(trailing comma, 잘림 등) 다시 호출하지 않고 고쳐서 씁니다.
+        return parse_llm_json(raw, REPORT_SCHEMA, "submit")
+    except StructuredOutputError as e_json:
+        raise ReportParseError(raw, e_json)
+
+
+def register_submit_api(app, services):
+    features = services.features
+    session_store = services.session_store
+    job_queue = services.job_queue
+    answer_evaluator = services.answer_evaluator
+    router = services.router
+    single_flight = services.single_flight
+
+    # 평가 프롬프트와 점수 계산은 배치 평가 스크립트(interview/batch_eval.py)와
+    # 똑같이 쓰도록 interview/evaluation.py 에 있습니다. (submit=scored)
+    def evaluate_interview(qna_list, eval_mode, interview_id=None):
+        # 진행 중에 답변별로 미리 평가해 둔 면접이면, 저장된 결과를 모아서 점수 계산 + 총평만 합니다.
+        if interview_id and answer_evaluator is not None and answer_evaluator.has_results(interview_id):
+            return build_report(answer_evaluator.collect(interview_id, qna_list))
+
+        return run_evaluation(router.client("submit"), "gpt-4o-mini", qna_list, eval_mode)
+
+    def evaluate(qna_list, eval_mode, interview_id=None):
+        # 같은 면접의 같은 제출(내용 해시)이 평가 중이면 새로 부르지 않고 그 결과를 같이 받습니다.
+        # (더블 클릭 / 브라우저 재시도 / 202 작업이 두 번 만들어진 경우, 다른 워커 프로세스 포함)
+        if features["submit"] == "report":
+            key = f"{interview_id or '-'}:{payload_key(qna_list)}"
+            report, _ = single_flight.do("submit", key, lambda: _llm_report(router, qna_list))
+        else:
+            key = f"{interview_id or '-'}:{payload_key(qna_list, eval_mode)}"
+            report, _ = single_flight.do("submit", key, lambda: evaluate_interview(qna_list, eval_mode, interview_id))
+        return report
+
+    def store_report(interview_id, report):
+        # 결과 화면을 다시 열 때 쓰도록 interviewId 로 저장합니다. 저장에 실패해도 평가 결과는 그대로 돌려줍니다.
+        if not interview_id:
+            return None
+        try:
+            return session_store.save_report(interview_id, report)
+        except Exception:
+            app.logger.exception("성적표 저장 실패")
+            return None
+
+    def evaluate_and_store(qna_list, eval_mode, interview_id=None):
+        # 비동기 작업: 평가가 끝나면 작업 결과와 같은 성적표를 저장합니다.
+        report = evaluate(qna_list, eval_mode, interview_id)
+        store_report(interview_id, report)
+        return report
+
+    def report_response(report, interview_id):
+        resp = jsonify(report)
+        saved = store_report(interview_id, report)
+        if saved is not None:
+            resp.set_etag(saved[1])
+            resp.headers["Content-Location"] = f"/api/interview/{interview_id}/result"
+        return resp
+
+    @app.post("/api/interview/submit")
+    def submit_interview():
+        try:
+            data = request.get_json(silent=True)
+            error = submission_error(data)
+            if error:
+                return jsonify({"error": error}), 400
+            interview_id = data.get("interviewId")
+            qna_list = data.get("qnaList")
+
+            if not qna_list and interview_id:
+                # 질문은 서버 세션에 있으므로 클라이언트는 답변만 보내면 됩니다.
+                qna_list = session_store.qna_list(interview_id, data.get("answers"))
+                if qna_list is None:
+                    return jsonify({"error": "면접 세션을 찾을 수 없습니다."}), 404
+                session_store.save_answers(interview_id, qna_list)
+
+            if not qna_list:
+                return jsonify({"error": "qnaList 데이터 없음"}), 400
+
+            if features["submit"] == "report":
+                return report_response(evaluate(qna_list, None, interview_id), interview_id)
+
+            eval_mode = data.get("evalMode") or EVAL_MODE
+
+            # 비동기 모드: 작업 ID 만 바로 돌려주고 평가는 백그라운드 워커가 처리
+            if job_queue is not None and wants_async_job(data):
+                try:
+                    job_id = job_queue.submit(evaluate_and_store, qna_list, eval_mode, interview_id)
+                except QueueFull:
+                    resp = jsonify({"error": "평가 대기열이 가득 찼습니다. 잠시 후 다시 시도하세요."})
+                    resp.headers["Retry-After"] = "5"
+                    return resp, 503
+
+                resp = jsonify({"jobId": job_id, "status": "queued"})
+                resp.headers["Location"] = f"/api/interview/jobs/{job_id}"
+                return resp, 202
+
+            with track_completion_savings() as completion_stats:
+                report = evaluate(qna_list, eval_mode, interview_id)
+            app.logger.info("completion tokens saved (estimate)=%d (%d -> %d)", completion_stats["savedTokens"],
+                            completion_stats["originalTokens"], completion_stats["finalTokens"])
+            resp = report_response(report, interview_id)
+            resp.headers.update(completion_headers(completion_stats))
+            return resp
+
+        except ReportParseError as e_json:
+            return jsonify({"error": "AI 응답 파싱 실패", "raw": e_json.raw, "details": str(e_json)}), 500
+
+        except Rejected as e:
+            # LLM 호출 자리를 못 얻음 (입장 제어, interview/admission.py)
+            return rejected_response(e)
+
+        except FlightTimeout:
+            resp = jsonify({"error": "같은 제출을 아직 평가 중입니다. 잠시 후 결과를 확인하세요."})
+            resp.headers["Retry-After"] = "5"
+            return resp, 503
+
+        except SingleFlightError as e:
+            # 다른 워커 프로세스에서 먼저 시작한 같은 제출이 실패한 경우
+            return jsonify({"error": str(e)}), 500
+
+        except Exception as e:
+            app.logger.exception("면접 평가 실패")
+            return jsonify({"error": str(e)}), 500
+
+    @app.get("/api/interview/<interview_id>/result")
+    def interview_result(interview_id):
+        # 저장해 둔 JSON 을 그대로 보냅니다. (LLM 호출 / 재직렬화 없음)
+        stored = session_store.get_report(interview_id)
+        if stored is None:
+            return jsonify({"error": "저장된 평가 결과가 없습니다."}), 404
+
+        resp = Response(stored["body"], mimetype="application/json")
+        resp.set_etag(stored["etag"])
+        resp.last_modified = stored["createdAt"]
+        # 지원자 개인 결과라 공유 캐시(CDN / 프록시)에는 남기지 않습니다.
+        resp.cache_control.private = True
+        resp.cache_control.max_age = REPORT_MAX_AGE
+        # If-None-Match 가 같으면 본문 없이 304
+        return resp.make_conditional(request)
+
+
+# =====================================================================
+# 답변별 미리 평가 API (면접 진행 중)
+# =====================================================================
+def register_answer_api(app, services):
+    session_store = services.session_store
+    answer_evaluator = services.answer_evaluator
+
+    @app.post("/api/interview/answer")
+    def evaluate_answer():
+        """
+        요청(JSON):
+        {
+            "interviewId": "ses-...",
+            "index": 0,
+            "answer": "지원자 답변"
+        }
+        질문은 세션에 저장된 index 번째 질문을 씁니다. (세션이 없으면 404, index 가 범위 밖이면 400)
+
+        응답: 202 {"status": "queued"}  (같은 답변이 이미 평가 중/완료면 {"status": "unchanged"})
+        평가 결과는 /api/interview/submit 때 모아서 사용합니다.
+        """
+        data = request.get_json(silent=True) or {}
+        fields = [data.get(key) or "" for key in ("interviewId", "answer")] if isinstance(data, dict) else None
+        if not _strings(fields):
+            return jsonify({"error": "interviewId / answer는 문자열이어야 합니다."}), 400
+        interview_id = (data.get("interviewId") or "").strip()
+        answer = (data.get("answer") or "").strip()
+        index = data.get("index")
+
+        if not interview_id or not isinstance(index, int) or isinstance(index, bool):
+            return jsonify({"error": "interviewId와 index는 필수입니다."}), 400
+        if not answer:
+            return jsonify({"error": "answer는 필수입니다."}), 400
+
+        session = session_store.get(interview_id)
+        if session is None:
+            return jsonify({"error": "면접 세션을 찾을 수 없습니다."}), 404
+        if not 0 <= index < len(session["questions"]):
+            return jsonify({"error": "index가 질문 범위를 벗어났습니다."}), 400
+        question = session["questions"][index].strip()
+
+        scheduled = answer_evaluator.schedule(interview_id, index, question, answer)
+        return jsonify({"status": "queued" if scheduled else "unchanged"}), 202
+
+
+# =====================================================================
+# 비동기 평가 작업 조회 API
+# =====================================================================
+def register_job_api(app, services):
+    job_queue = services.job_queue
+
+    @app.get("/api/interview/jobs/stats")
+    def job_stats():
+        return jsonify(job_queue.stats())
+
+    @app.get("/api/interview/jobs/<job_id>")
+    def get_job(job_id):
+        job = job_queue.get(job_id)
+        if job is None:
+            return jsonify({"error": "작업을 찾을 수 없습니다."}), 404
+        return jsonify(job)
+
+    @app.get("/api/interview/jobs/<job_id>/events")
+    def job_events(job_id):
+        if job_queue.get(job_id) is None:
+            return jsonify({"error": "작업을 찾을 수 없습니다."}), 404
+
+        # 상태가 바뀔 때마다 status 이벤트, 끝나면 done / error 이벤트를 보냅니다.
+        def events():
+            job = job_queue.get(job_id)
+            yield sse_event("status", {"jobId": job_id, "status": job["status"]})
+            while job["status"] not in ("done", "error"):
+                job = job_queue.wait(job_id, timeout=15)
+                if job is None:
+                    return
+                yield sse_event("status", {"jobId": job_id, "status": job["status"]})
+            if job["status"] == "done":
+                yield sse_event("done", job["result"])
+            else:
+                yield sse_event("error", {"error": job["error"]})
+
+        return event_stream_response(events())
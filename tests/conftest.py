@@ -0,0 +1,53 @@
+# tests/conftest.py
+# 공용 픽스처
+# - 앱 / 모듈이 import 때 읽는 환경 변수를 먼저 정해 둡니다. (실제 OpenAI / 작업 폴더의 DB 를 쓰지 않도록)
+# - fake_client: client.chat.completions.create(...) 모양의 가짜 LLM 클라이언트
+import json
+import os
+import tempfile
+import types
+
+import pytest
+
+_TMP = tempfile.mkdtemp(prefix="interview-tests-")
+os.environ.setdefault("OPENAI_API_KEY", "test")
+os.environ["SESSION_DB"] = os.path.join(_TMP, "sessions.db")
+os.environ["SINGLEFLIGHT_DB"] = "off"
+os.environ["QUESTION_BANK_PATH"] = os.path.join(_TMP, "question_bank.json")
+os.environ["ANSWER_CACHE_SIZE"] = "0"
+for _lane in ("CREATE", "SUBMIT", "ANSWER"):
+    os.environ[f"ADMISSION_CLIENT_RPM_{_lane}"] = "0"
+
+
+def _chunk(text):
+    return types.SimpleNamespace(choices=[types.SimpleNamespace(delta=types.SimpleNamespace(content=text))])
+
+
+class FakeCompletions:
+    def __init__(self, content, chunk_size=3):
+        self.content = content
+        self.chunk_size = chunk_size
+        self.calls = []
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        text = self.content(kwargs) if callable(self.content) else self.content
+        if not isinstance(text, str):
+            text = json.dumps(text, ensure_ascii=False)
+        if kwargs.get("stream"):
+            return iter([_chunk(text[i:i + self.chunk_size]) for i in range(0, len(text), self.chunk_size)])
+        message = types.SimpleNamespace(content=text)
+        return types.SimpleNamespace(choices=[types.SimpleNamespace(message=message)],
+                                     usage=types.SimpleNamespace(prompt_tokens=10, completion_tokens=5))
+
+
+class FakeClient:
+    def __init__(self, content, chunk_size=3):
+        self.completions = FakeCompletions(content, chunk_size)
+        self.chat = types.SimpleNamespace(completions=self.completions)
+
+
+@pytest.fixture
+def fake_client():
+    """fake_client(content): content 는 문자열 / dict 또는 호출 인자(kwargs)를 받아 응답을 만드는 함수"""
+    return FakeClient
@@ -0,0 +1,236 @@
+# interview/admission.py: 토큰 버킷 / 레인별 입장 제어 / 클라이언트 구분
+import threading
+import time
+
+import pytest
+from flask import Flask
+
+from interview.admission import AdmissionController, Rejected, TokenBucket, client_id
+from interview.router import LatencyTracker, ModelRouter
+
+
+class Clock:
+    def __init__(self):
+        self.now = 0.0
+
+    def __call__(self):
+        return self.now
+
+
+def lanes(**overrides):
+    policy = {
+        "submit": {"priority": 0, "client_rpm": 60, "client_burst": 2, "queue": 10, "max_wait": 1},
+        "answer": {"priority": 1, "client_rpm": 60, "client_burst": 2, "queue": 10, "max_wait": 1},
+        "create": {"priority": 2, "client_rpm": 60, "client_burst": 2, "queue": 10, "max_wait": 1},
+    }
+    for lane, values in overrides.items():
+        policy[lane] = {**policy[lane], **values}
+    return policy
+
+
+# -------------------------
+# TokenBucket
+# -------------------------
+def test_bucket_spends_burst_then_reports_wait():
+    clock = Clock()
+    bucket = TokenBucket(rate=2, burst=3, clock=clock)
+    assert [bucket.take() for _ in range(3)] == [0, 0, 0]
+    assert bucket.take() == pytest.approx(0.5)
+    # 기다려야 할 때는 토큰을 쓰지 않음
+    assert bucket.tokens == pytest.approx(0)
+
+
+def test_bucket_refills_up_to_burst():
+    clock = Clock()
+    bucket = TokenBucket(rate=1, burst=2, clock=clock)
+    bucket.take()
+    bucket.take()
+    clock.now += 0.5
+    assert bucket.wait_time() == pytest.approx(0.5)
+    clock.now += 100
+    assert bucket.full()
+    assert bucket.tokens == 2
+
+
+def test_bucket_without_rate_is_unlimited():
+    bucket = TokenBucket(rate=0, burst=1, clock=Clock())
+    assert all(bucket.take() == 0 for _ in range(100))
+
+
+# -------------------------
+# AdmissionController
+# -------------------------
+def test_client_limit_is_per_client_and_lane():
+    clock = Clock()
+    controller = AdmissionController(lanes=lanes(), clock=clock)
+    controller.check_client("create", "a")
+    controller.check_client("create", "a")
+    with pytest.raises(Rejected) as rejected:
+        controller.check_client("create", "a")
+    assert rejected.value.reason == "client_limited"
+    assert rejected.value.retry_after == pytest.approx(1)
+    controller.check_client("create", "b")
+    controller.check_client("submit", "a")
+
+
+def test_global_bucket_limits_calls():
+    controller = AdmissionController(max_concurrent=10, reserved=0, global_rpm=60, global_burst=2,
+                                     lanes=lanes(create={"max_wait": 0.05}))
+    controller.acquire("create")
+    controller.acquire("create")
+    with pytest.raises(Rejected) as rejected:
+        controller.acquire("create")
+    assert rejected.value.reason == "timeout"
+    assert rejected.value.retry_after >= 1
+
+
+def test_reserved_slots_are_kept_for_higher_lanes():
+    controller = AdmissionController(max_concurrent=2, reserved=1, global_rpm=0,
+                                     lanes=lanes(create={"max_wait": 0.05}))
+    controller.acquire("create")
+    with pytest.raises(Rejected):
+        controller.acquire("create")
+    controller.acquire("submit")
+    assert controller.stats()["running"] == {"submit": 1, "answer": 0, "create": 1}
+
+
+def test_full_queue_rejects_immediately():
+    controller = AdmissionController(max_concurrent=1, reserved=0, global_rpm=0, lanes=lanes(create={"queue": 0}))
+    started = time.monotonic()
+    with pytest.raises(Rejected) as rejected:
+        controller.acquire("create")
+    assert rejected.value.reason == "queue_full"
+    assert time.monotonic() - started < 0.5
+
+
+def test_released_slot_goes_to_higher_priority_lane_first():
+    controller = AdmissionController(max_concurrent=1, reserved=0, global_rpm=0,
+                                     lanes=lanes(create={"max_wait": 5}, submit={"max_wait": 5}))
+    controller.acquire("create")
+    order = []
+
+    def enter(lane):
+        controller.acquire(lane)
+        order.append(lane)
+        controller.release(lane)
+
+    waiting_create = threading.Thread(target=enter, args=("create",))
+    waiting_create.start()
+    while controller.stats()["waiting"]["create"] == 0:
+        time.sleep(0.001)
+    waiting_submit = threading.Thread(target=enter, args=("submit",))
+    waiting_submit.start()
+    while controller.stats()["waiting"]["submit"] == 0:
+        time.sleep(0.001)
+
+    controller.release("create")
+    waiting_create.join(5)
+    waiting_submit.join(5)
+    # create 가 먼저 기다렸어도 submit 이 먼저 들어감
+    assert order == ["submit", "create"]
+
+
+def test_lane_for_maps_router_endpoints():
+    controller = AdmissionController(lanes=lanes())
+    assert controller.lane_for("generate_questions") == "create"
+    assert controller.lane_for("analyze_answer") == "answer"
+    assert controller.lane_for("submit") == "submit"
+    assert controller.lane_for("unknown") is None
+
+
+# -------------------------
+# 라우터가 자리를 늘 돌려주는지
+# -------------------------
+class RawClient:
+    def __init__(self, outcome):
+        self.outcome = outcome
+        self.chat = self
+        self.completions = self
+
+    def create(self, **kwargs):
+        if isinstance(self.outcome, BaseException):
+            raise self.outcome
+        return self.outcome
+
+
+def routed(outcome):
+    router = ModelRouter(RawClient(outcome), tiers=["m"], tracker=LatencyTracker(300))
+    router.admission = AdmissionController(max_concurrent=1, reserved=0, global_rpm=0, lanes=lanes())
+    return router
+
+
+def running(router):
+    return sum(router.admission.stats()["running"].values())
+
+
+def call(router, **kwargs):
+    return router.client("submit").chat.completions.create(model="m", messages=[], **kwargs)
+
+
+@pytest.mark.parametrize("error", [ValueError("boom"), KeyboardInterrupt(), SystemExit()])
+def test_router_releases_slot_on_any_exception(error):
+    router = routed(error)
+    with pytest.raises(type(error)):
+        call(router)
+    assert running(router) == 0
+
+
+def test_router_releases_slot_after_response():
+    router = routed("ok")
+    assert call(router) == "ok"
+    assert call(router) == "ok"
+    assert running(router) == 0
+
+
+def test_stream_holds_slot_until_consumed():
+    router = routed(iter(["a", "b"]))
+    stream = call(router, stream=True)
+    assert running(router) == 1
+    assert list(stream) == ["a", "b"]
+    assert running(router) == 0
+    del stream
+    assert running(router) == 0
+
+
+def test_stream_closed_early_releases_slot():
+    router = routed(iter(["a", "b"]))
+    stream = call(router, stream=True)
+    next(stream)
+    stream.close()
+    assert running(router) == 0
+
+
+def test_stream_dropped_without_reading_releases_slot():
+    router = routed(iter(["a"]))
+    stream = call(router, stream=True)
+    assert running(router) == 1
+    del stream
+    assert running(router) == 0
+
+
+# -------------------------
+# client_id
+# -------------------------
+app = Flask(__name__)
+
+
+def identify(headers=None, remote_addr="10.0.0.1", **kwargs):
+    with app.test_request_context(headers=headers or {}, environ_base={"REMOTE_ADDR": remote_addr}):
+        return client_id(**kwargs)
+
+
+def test_client_headers_are_ignored_by_default():
+    assert identify({"X-Client-ID": "spoofed", "X-Forwarded-For": "1.2.3.4"}) == "10.0.0.1"
+
+
+def test_trusted_proxy_reads_the_address_it_appended():
+    headers = {"X-Forwarded-For": "spoofed, 203.0.113.7"}
+    assert identify(headers, trusted_proxies=1) == "203.0.113.7"
+    assert identify({"X-Forwarded-For": "203.0.113.7, 10.0.0.2"}, trusted_proxies=2) == "203.0.113.7"
+    # 프록시 수보다 값이 적으면 접속 IP
+    assert identify({"X-Forwarded-For": "203.0.113.7"}, trusted_proxies=2) == "10.0.0.1"
+
+
+def test_configured_gateway_header_wins():
+    assert identify({"X-User": "user-42"}, header="X-User") == "user-42"
+    assert identify({}, header="X-User") == "10.0.0.1"
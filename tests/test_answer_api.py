@@ -0,0 +1,149 @@
+# POST /api/interview/answer: 면접 진행 중 답변별 미리 평가 (interview/web/submit.py, interview/incremental.py)
+import sqlite3
+
+import pytest
+
+from interview.incremental import IncrementalEvaluator
+from interview.scoring import CRITERIA
+from interview.sessions import SessionStore
+from interview.web import create_app
+
+QUESTIONS = ["q1", "q2", "q3", "q4", "q5"]
+
+
+def llm(kwargs):
+    prompt = kwargs["messages"][-1]["content"]
+    if '"weights"' in prompt:
+        return {"weights": {c: "high" for c in CRITERIA}, "scores": {c: 80 for c in CRITERIA}}
+    if "analysisText" in prompt:
+        return {"analysisText": "총평"}
+    return {"questions": QUESTIONS}
+
+
+@pytest.fixture
+def client(fake_client):
+    app = create_app("basic2")
+    fake = fake_client(llm)
+    app.extensions["interview"].router.raw = fake
+    client = app.test_client()
+    client.llm_calls = fake.completions.calls
+    client.evaluator = app.extensions["interview"].answer_evaluator
+    return client
+
+
+def new_interview(client):
+    resp = client.post("/api/interview/create", data={"job_title": "백엔드", "question_source": "llm"})
+    assert resp.status_code == 200
+    return resp.get_json()["interviewId"]
+
+
+def answer(client, **body):
+    return client.post("/api/interview/answer", json=body)
+
+
+def evaluated_prompts(client):
+    return [call["messages"][-1]["content"] for call in client.llm_calls
+            if '"weights"' in call["messages"][-1]["content"]]
+
+
+def test_answer_is_evaluated_against_the_session_question(client):
+    interview_id = new_interview(client)
+    resp = answer(client, interviewId=interview_id, index=1, answer="답변", question="다른 질문")
+    assert resp.status_code == 202
+    assert resp.get_json() == {"status": "queued"}
+    # 클라이언트가 보낸 question 은 쓰지 않음
+    entry = client.evaluator._sessions[interview_id]["answers"][1]
+    assert entry["question"] == "q2"
+    entry["future"].result(5)
+    assert all("다른 질문" not in prompt for prompt in evaluated_prompts(client))
+
+    again = answer(client, interviewId=interview_id, index=1, answer="답변")
+    assert again.get_json() == {"status": "unchanged"}
+
+
+def test_unknown_session_is_404_without_llm_calls(client):
+    resp = answer(client, interviewId="ses-unknown", index=0, answer="답변")
+    assert resp.status_code == 404
+    assert client.llm_calls == []
+
+
+@pytest.mark.parametrize("index", [-1, 5, 100, True, "0", None])
+def test_index_outside_the_questions_is_400(client, index):
+    interview_id = new_interview(client)
+    calls = len(client.llm_calls)
+    resp = answer(client, interviewId=interview_id, index=index, answer="답변")
+    assert resp.status_code == 400
+    assert len(client.llm_calls) == calls
+    assert interview_id not in client.evaluator._sessions
+
+
+@pytest.mark.parametrize("body", [{"answer": ""}, {"answer": 3}, {"interviewId": 1}])
+def test_invalid_fields_are_400(client, body):
+    interview_id = new_interview(client)
+    resp = answer(client, **{"interviewId": interview_id, "index": 0, "answer": "답변", **body})
+    assert resp.status_code == 400
+
+
+def test_submit_reuses_answers_evaluated_in_advance(client):
+    interview_id = new_interview(client)
+    answers = [f"답변 {i}" for i in range(5)]
+    for index, text in enumerate(answers):
+        assert answer(client, interviewId=interview_id, index=index, answer=text).status_code == 202
+    for entry in client.evaluator._sessions[interview_id]["answers"].values():
+        entry["future"].result(5)
+    before = len(evaluated_prompts(client))
+
+    resp = client.post("/api/interview/submit", json={"interviewId": interview_id, "answers": answers})
+    assert resp.status_code == 200
+    assert resp.get_json()["radarScores"] == {c: 80 for c in CRITERIA}
+    # 미리 평가한 답변은 다시 평가하지 않음
+    assert len(evaluated_prompts(client)) == before
+
+
+# -------------------------
+# 다른 프로세스가 저장한 결과 (sessions.answers 테이블)
+# -------------------------
+def stored_result(score):
+    return {"weights": {c: "high" for c in CRITERIA}, "scores": {c: score for c in CRITERIA}}
+
+
+@pytest.fixture
+def store(tmp_path):
+    store = SessionStore(str(tmp_path / "sessions.db"))
+    store.create("ses-1", "백엔드", "신입", ["q1"])
+    return store
+
+
+def test_stored_result_is_used_only_for_the_same_question(store, fake_client):
+    store.save_answer("ses-1", 0, "q1", "답변")
+    store.save_result("ses-1", 0, "q1", "답변", stored_result(95))
+    # 평가하는 동안 질문이 바뀐 결과는 저장하지 않음
+    store.save_result("ses-1", 0, "다른 질문", "답변", stored_result(10))
+    assert store.answers("ses-1")[0]["result"] == stored_result(95)
+
+    fake = fake_client(llm)
+    evaluator = IncrementalEvaluator(fake, "m", store=store)
+    same = evaluator.collect("ses-1", [{"question": "q1", "answer": "답변"}])
+    assert same["answerScores"]["1"] == {c: 95 for c in CRITERIA}
+
+    changed = evaluator.collect("ses-1", [{"question": "q1 바뀜", "answer": "답변"}])
+    assert changed["answerScores"]["1"] == {c: 80 for c in CRITERIA}
+
+
+def test_changing_the_question_clears_the_stored_result(store):
+    store.save_answer("ses-1", 0, "q1", "답변")
+    store.save_result("ses-1", 0, "q1", "답변", stored_result(95))
+    store.save_answer("ses-1", 0, "q1", "답변")
+    assert store.answers("ses-1")[0]["result"] is not None
+    store.save_answer("ses-1", 0, "q2", "답변")
+    assert store.answers("ses-1")[0] == {"question": "q2", "answer": "답변", "result": None}
+
+
+def test_old_answers_table_gets_a_question_column(tmp_path):
+    path = str(tmp_path / "old.db")
+    with sqlite3.connect(path) as conn:
+        conn.execute("CREATE TABLE answers (session_id TEXT NOT NULL, idx INTEGER NOT NULL, answer TEXT NOT NULL,"
+                     " result TEXT, updated_at REAL NOT NULL, PRIMARY KEY (session_id, idx))")
+        conn.execute("INSERT INTO answers VALUES ('ses-1', 0, '답변', '{}', 0)")
+    store = SessionStore(path)
+    assert store.answers("ses-1")[0]["question"] == ""
@@ -0,0 +1,56 @@
+# interview/cache.py: 메모리 LRU + TTL / SQLite 디스크 계층
+import pytest
+
+from interview import cache as cache_module
+from interview.cache import MemoryCache, ResponseCache, SQLiteCache, question_cache_key
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(cache_module.time, "time", clock.time)
+    return clock
+
+
+def test_memory_cache_expires_and_evicts_lru(clock):
+    memory = MemoryCache(max_entries=2, ttl=10)
+    memory.set("a", 1, 1)
+    memory.set("b", 2, 1)
+    assert memory.get("a") == 1
+    memory.set("c", 3, 1)
+    assert memory.get("b") is None        # 가장 오래 안 쓴 항목
+    clock.now += 11
+    assert memory.get("a") is None
+
+
+def test_oversized_values_are_skipped():
+    responses = ResponseCache(MemoryCache(max_entry_bytes=10))
+    assert responses.set("k", {"questions": ["아주 긴 질문입니다"]}) is False
+    assert responses.stats()["skipped"] == 1
+
+
+def test_disk_hit_keeps_the_remaining_disk_ttl(clock, tmp_path):
+    disk = SQLiteCache(str(tmp_path / "cache.db"), ttl=100)
+    ResponseCache(MemoryCache(ttl=600), disk).set("k", {"v": 1})
+
+    clock.now += 90                     # 디스크에 10초 남음
+    responses = ResponseCache(MemoryCache(ttl=600), disk)
+    assert responses.get("k") == {"v": 1}
+    assert responses.stats()["diskHits"] == 1
+
+    clock.now += 11
+    # 메모리로 올린 값도 디스크 만료 시각에 같이 만료 (메모리 TTL 600초를 새로 주지 않음)
+    assert responses.get("k") is None
+
+
+def test_question_cache_key_ignores_spacing_and_case():
+    assert question_cache_key("Backend  개발", "신입", "Hello\nWorld") == \
+        question_cache_key("backend 개발", "신입", "hello world")
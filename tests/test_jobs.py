@@ -0,0 +1,97 @@
+# interview/jobs.py: 비동기 평가 작업 큐 (상태 전이 / 대기열 초과 / 다른 프로세스의 작업 조회)
+import threading
+
+import pytest
+
+from interview import jobs
+from interview.jobs import JobQueue, QueueFull
+from interview.sessions import SessionStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    return SessionStore(str(tmp_path / "jobs.db"))
+
+
+def finish(job_queue, job_id):
+    job = job_queue.get(job_id)
+    while job["status"] not in ("done", "error"):
+        job = job_queue.wait(job_id, timeout=5)
+    return job
+
+
+def test_job_goes_from_queued_to_running_to_done():
+    job_queue = JobQueue(workers=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def work(value):
+        started.set()
+        release.wait(5)
+        return value * 2
+
+    job_id = job_queue.submit(work, 21)
+    assert job_queue.get(job_id)["status"] in ("queued", "running")
+    started.wait(5)
+    assert job_queue.get(job_id)["status"] == "running"
+    release.set()
+
+    job = finish(job_queue, job_id)
+    assert job["status"] == "done"
+    assert job["result"] == 42
+    assert job["finishedAt"] >= job["startedAt"] >= job["createdAt"]
+    assert job_queue.stats()["completed"] == 1
+
+
+def test_failed_job_keeps_the_error():
+    job_queue = JobQueue(workers=1)
+
+    def work():
+        raise ValueError("평가 실패")
+
+    job = finish(job_queue, job_queue.submit(work))
+    assert job["status"] == "error"
+    assert job["error"] == "평가 실패"
+    assert "result" not in job
+    assert job_queue.stats()["failed"] == 1
+
+
+def test_full_queue_rejects_new_jobs():
+    job_queue = JobQueue(workers=1, max_queue=1)
+    release = threading.Event()
+    started = threading.Event()
+
+    def block():
+        started.set()
+        release.wait(5)
+
+    job_queue.submit(block)
+    started.wait(5)
+    job_queue.submit(block)         # 대기열 한 자리
+    with pytest.raises(QueueFull):
+        job_queue.submit(block)
+    release.set()
+    assert job_queue.stats()["rejected"] == 1
+
+
+def test_unknown_job_is_none(store):
+    assert JobQueue(workers=1).get("missing") is None
+    assert JobQueue(workers=1, store=store).get("missing") is None
+    assert JobQueue(workers=1, store=store).wait("missing", timeout=0.1) is None
+
+
+def test_other_process_sees_the_job_through_the_store(store, monkeypatch):
+    monkeypatch.setattr(jobs, "STORE_POLL_INTERVAL", 0.01)
+    worker = JobQueue(workers=1, store=store)
+    other = JobQueue(workers=1, store=store)
+    release = threading.Event()
+
+    job_id = worker.submit(lambda: release.wait(5) and {"score": 90})
+    assert other.get(job_id)["status"] in ("queued", "running")
+    release.set()
+
+    job = other.get(job_id)
+    while job["status"] != "done":
+        job = other.wait(job_id, timeout=5)
+    assert job["result"] == {"score": 90}
+    assert job == worker.get(job_id)
@@ -0,0 +1,178 @@
+# interview/llm_client.py: 서킷 브레이커 상태 전이 / ResilientClient 재시도
+import types
+
+import httpx
+import openai
+import pytest
+
+from interview import llm_client
+from interview.llm_client import CircuitBreaker, CircuitOpenError, ResilientClient
+
+REQUEST = httpx.Request("POST", "https://llm.test/v1/chat/completions")
+
+
+def status_error(code):
+    # openai 클라이언트처럼 429 는 RateLimitError 로 만듭니다.
+    error_class = openai.RateLimitError if code == 429 else openai.APIStatusError
+    return error_class("error", response=httpx.Response(code, request=REQUEST), body=None)
+
+
+def timeout_error():
+    return openai.APITimeoutError(request=REQUEST)
+
+
+class Clock:
+    def __init__(self):
+        self.now = 1000.0
+
+    def time(self):
+        return self.now
+
+
+@pytest.fixture
+def clock(monkeypatch):
+    clock = Clock()
+    monkeypatch.setattr(llm_client.time, "time", clock.time)
+    return clock
+
+
+class ScriptedRaw:
+    """outcomes 를 앞에서부터 하나씩 돌려줍니다. (예외면 raise)"""
+
+    def __init__(self, *outcomes):
+        self.outcomes = list(outcomes)
+        self.calls = []
+        self.chat = types.SimpleNamespace(completions=self)
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        outcome = self.outcomes.pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def resilient(raw, breaker=None, max_retries=3):
+    return ResilientClient(raw, breaker=breaker or CircuitBreaker(2, 30), max_retries=max_retries,
+                           timeout=5, sleep=lambda seconds: None)
+
+
+# -------------------------
+# CircuitBreaker
+# -------------------------
+def test_breaker_opens_after_threshold_and_fails_fast(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_success_resets_failure_count(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    breaker.record_failure()
+    breaker.record_success()
+    breaker.record_failure()
+    assert breaker.state == "closed"
+
+
+def test_half_open_allows_a_single_trial(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock.now += 30
+    breaker.before_call()
+    assert breaker.state == "half-open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()       # 시험 호출이 끝나기 전의 다른 호출
+
+
+def test_half_open_trial_success_closes(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock.now += 30
+    breaker.before_call()
+    breaker.record_success()
+    assert breaker.state == "closed"
+    breaker.before_call()
+
+
+def test_half_open_trial_failure_reopens(clock):
+    breaker = CircuitBreaker(failure_threshold=5, reset_timeout=30)
+    for _ in range(5):
+        breaker.record_failure()
+    clock.now += 30
+    breaker.before_call()
+    breaker.record_failure()
+    assert breaker.state == "open"
+    with pytest.raises(CircuitOpenError):
+        breaker.before_call()
+
+
+def test_neutral_frees_trial_without_closing(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock.now += 30
+    breaker.before_call()
+    breaker.record_neutral()
+    assert breaker.state == "half-open"
+    assert breaker.failures == 1
+    breaker.before_call()           # 다음 호출이 다시 시험 호출이 됨
+
+
+# -------------------------
+# ResilientClient
+# -------------------------
+def test_retries_transient_errors_then_succeeds(clock):
+    raw = ScriptedRaw(status_error(503), status_error(429), "ok")
+    client = resilient(raw)
+    assert client.chat.completions.create(model="m") == "ok"
+    assert len(raw.calls) == 3
+    assert raw.calls[0]["timeout"] == 5
+    assert client.breaker.failures == 0
+
+
+def test_breaker_counts_one_failure_per_logical_call(clock):
+    raw = ScriptedRaw(*[status_error(500)] * 4)
+    client = resilient(raw, CircuitBreaker(failure_threshold=2, reset_timeout=30))
+    with pytest.raises(openai.APIStatusError):
+        client.chat.completions.create(model="m")
+    assert len(raw.calls) == 4
+    assert client.breaker.failures == 1
+    assert client.breaker.state == "closed"
+
+
+def test_client_error_is_neutral(clock):
+    breaker = CircuitBreaker(failure_threshold=2, reset_timeout=30)
+    breaker.record_failure()
+    client = resilient(ScriptedRaw(status_error(400)), breaker)
+    with pytest.raises(openai.APIStatusError):
+        client.chat.completions.create(model="m")
+    # 재시도하지 않고, 연속 실패 수도 지우지 않음
+    assert len(client.raw.calls) == 1
+    assert breaker.failures == 1
+
+
+def test_client_error_does_not_close_half_open_breaker(clock):
+    breaker = CircuitBreaker(failure_threshold=1, reset_timeout=30)
+    breaker.record_failure()
+    clock.now += 30
+    client = resilient(ScriptedRaw(status_error(422), "ok"), breaker)
+    with pytest.raises(openai.APIStatusError):
+        client.chat.completions.create(model="m")
+    assert breaker.state == "half-open"
+    assert client.chat.completions.create(model="m") == "ok"
+    assert breaker.state == "closed"
+
+
+
+def test_timeouts_not_retried_when_caller_handles_them(clock):
+    raw = ScriptedRaw(timeout_error(), "ok")
+    client = resilient(raw)
+    with pytest.raises(openai.APITimeoutError):
+        client.chat.completions.create(model="m", retry_timeouts=False)
+    assert len(raw.calls) == 1
+    assert "retry_timeouts" not in raw.calls[0]
+    assert client.chat.completions.create(model="m") == "ok"
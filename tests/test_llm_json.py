@@ -0,0 +1,76 @@
+# interview/llm_json.py: LLM 응답 JSON 복구 / 스키마 검사
+import pytest
+
+from interview.llm_json import Optional, StructuredOutputError, parse_llm_json, parse_stats
+
+SCHEMA = {
+    "score": int,
+    "level": ("high", "low"),
+    "points": Optional([str], []),
+}
+
+
+def repairs(name):
+    return parse_stats()[name]["repairs"]
+
+
+def test_valid_json_passes_without_repairs():
+    assert parse_llm_json('{"score": 85, "level": "high", "points": ["a"]}', SCHEMA, "t.ok") == \
+        {"score": 85, "level": "high", "points": ["a"]}
+    assert parse_stats()["t.ok"] == {"ok": 1, "repaired": 0, "failed": 0, "repairs": {}}
+
+
+def test_prose_and_code_fence_around_object():
+    raw = '평가 결과입니다.\n```json\n{"score": 70, "level": "low"}\n```\n참고하세요 {괄호}'
+    assert parse_llm_json(raw, SCHEMA, "t.extract") == {"score": 70, "level": "low", "points": []}
+    assert "extracted" in repairs("t.extract")
+
+
+def test_trailing_commas():
+    raw = '{"score": 70, "level": "low", "points": ["a", "b",],}'
+    assert parse_llm_json(raw, SCHEMA, "t.comma")["points"] == ["a", "b"]
+    assert "trailing_comma" in repairs("t.comma")
+
+
+def test_comma_inside_string_is_kept():
+    raw = '{"score": 70, "level": "low", "points": ["a,]", "b",]}'
+    assert parse_llm_json(raw, SCHEMA, "t.comma_str")["points"] == ["a,]", "b"]
+
+
+def test_truncated_response_keeps_complete_values():
+    raw = '{"score": 90, "level": "high", "points": ["완성된 항목", "잘린 항'
+    result = parse_llm_json(raw, SCHEMA, "t.truncated")
+    assert result["score"] == 90
+    assert result["points"] == ["완성된 항목"]
+    assert "truncated" in repairs("t.truncated")
+
+
+def test_string_numbers_and_enum_case():
+    result = parse_llm_json('{"score": "85점", "level": " HIGH "}', SCHEMA, "t.coerce")
+    assert result == {"score": 85, "level": "high", "points": []}
+    assert {"string_number", "enum_case"} <= set(repairs("t.coerce"))
+
+
+def test_number_fields_only_accept_numbers():
+    with pytest.raises(StructuredOutputError):
+        parse_llm_json('{"score": "높음", "level": "high"}', SCHEMA, "t.bad_number")
+    with pytest.raises(StructuredOutputError):
+        parse_llm_json('{"score": true, "level": "high"}', SCHEMA, "t.bool")
+
+
+def test_missing_required_field_fails_and_is_counted():
+    with pytest.raises(StructuredOutputError):
+        parse_llm_json('{"level": "high"}', SCHEMA, "t.missing")
+    assert parse_stats()["t.missing"]["failed"] == 1
+
+
+@pytest.mark.parametrize("raw", [None, "", "JSON 이 아닙니다", "[1, 2]"])
+def test_non_object_input_fails(raw):
+    with pytest.raises(StructuredOutputError):
+        parse_llm_json(raw, SCHEMA, "t.invalid")
+
+
+def test_wildcard_dict_schema():
+    schema = {"answerScores": {"*": {"logic": float}}}
+    result = parse_llm_json('{"answerScores": {"1": {"logic": "80"}, "2": {"logic": 75.5}}}', schema, "t.star")
+    assert result == {"answerScores": {"1": {"logic": 80}, "2": {"logic": 75.5}}}
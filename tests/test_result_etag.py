@@ -0,0 +1,78 @@
+# GET /api/interview/<id>/result: 저장된 성적표 ETag / 304 (interview/web/submit.py, interview/sessions.py)
+import json
+
+import pytest
+
+from interview.scoring import CRITERIA
+from interview.web import create_app
+
+
+def llm(kwargs):
+    prompt = kwargs["messages"][-1]["content"]
+    if '"weights"' in prompt:
+        answer = prompt.rsplit("답변", 1)[-1]
+        score = 90 if "좋은" in answer else 60
+        return {"weights": {c: "high" for c in CRITERIA}, "scores": {c: score for c in CRITERIA}}
+    if "analysisText" in prompt:
+        return {"analysisText": "총평"}
+    return {"questions": ["q1", "q2", "q3", "q4", "q5"]}
+
+
+@pytest.fixture
+def client(fake_client):
+    app = create_app("basic2")
+    fake = fake_client(llm)
+    app.extensions["interview"].router.raw = fake
+    client = app.test_client()
+    client.llm_calls = fake.completions.calls
+    return client
+
+
+def new_interview(client):
+    resp = client.post("/api/interview/create", data={"job_title": "백엔드", "question_source": "llm"})
+    assert resp.status_code == 200
+    return resp.get_json()["interviewId"]
+
+
+def submit(client, interview_id, answers):
+    return client.post("/api/interview/submit",
+                       json={"interviewId": interview_id, "answers": answers, "evalMode": "per_question"})
+
+
+def test_result_is_stored_with_etag_and_revalidated_with_304(client):
+    interview_id = new_interview(client)
+    assert client.get(f"/api/interview/{interview_id}/result").status_code == 404
+
+    submitted = submit(client, interview_id, ["답변"] * 5)
+    assert submitted.status_code == 200
+    assert submitted.headers["Content-Location"] == f"/api/interview/{interview_id}/result"
+    etag = submitted.headers["ETag"]
+
+    calls = len(client.llm_calls)
+    stored = client.get(f"/api/interview/{interview_id}/result")
+    assert stored.status_code == 200
+    assert stored.headers["ETag"] == etag
+    assert stored.get_json() == submitted.get_json()
+    assert "private" in stored.headers["Cache-Control"]
+
+    not_modified = client.get(f"/api/interview/{interview_id}/result", headers={"If-None-Match": etag})
+    assert not_modified.status_code == 304
+    assert not_modified.data == b""
+    # 다시 보기는 LLM 을 부르지 않음
+    assert len(client.llm_calls) == calls
+
+
+def test_resubmission_changes_the_etag(client):
+    interview_id = new_interview(client)
+    first = submit(client, interview_id, ["답변"] * 5).headers["ETag"]
+    second = submit(client, interview_id, ["좋은 답변"] * 5)
+    assert second.headers["ETag"] != first
+
+    stale = client.get(f"/api/interview/{interview_id}/result", headers={"If-None-Match": first})
+    assert stale.status_code == 200
+    assert stale.headers["ETag"] == second.headers["ETag"]
+    assert json.loads(stale.data) == second.get_json()
+
+
+def test_unknown_interview_has_no_result(client):
+    assert client.get("/api/interview/ses-unknown/result").status_code == 404
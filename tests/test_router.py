@@ -0,0 +1,95 @@
+# interview/router.py: 모델 선택 / timeout 때 더 빠른 모델로 다시 시도
+import types
+
+import httpx
+import openai
+import pytest
+
+from interview.llm_client import CircuitBreaker, ResilientClient
+from interview.router import LatencyTracker, ModelRouter
+
+REQUEST = httpx.Request("POST", "https://llm.test/v1/chat/completions")
+TIERS = ["fast", "mid", "slow"]
+
+
+class ScriptedRaw:
+    """모델별 결과를 돌려줍니다. (예외면 raise)"""
+
+    def __init__(self, **outcomes):
+        self.outcomes = {model: list(results) for model, results in outcomes.items()}
+        self.calls = []
+        self.chat = types.SimpleNamespace(completions=self)
+
+    def create(self, **kwargs):
+        self.calls.append(kwargs)
+        outcome = self.outcomes[kwargs["model"]].pop(0)
+        if isinstance(outcome, Exception):
+            raise outcome
+        return outcome
+
+
+def timeout_error():
+    return openai.APITimeoutError(request=REQUEST)
+
+
+def router_for(raw):
+    client = ResilientClient(raw, breaker=CircuitBreaker(10, 30), max_retries=2, timeout=60,
+                             sleep=lambda seconds: None)
+    return ModelRouter(client, tiers=TIERS, tracker=LatencyTracker(300), min_samples=1)
+
+
+def create(router, model="slow", **kwargs):
+    return router.client("submit").chat.completions.create(
+        model=model, messages=[{"role": "user", "content": "hi"}], **kwargs)
+
+
+def test_timeout_falls_back_to_faster_model_once():
+    raw = ScriptedRaw(slow=[timeout_error()], mid=["ok"])
+    router = router_for(raw)
+    assert create(router) == "ok"
+    assert [call["model"] for call in raw.calls] == ["slow", "mid"]
+    # 내려갈 곳이 있는 첫 호출은 SLO 를 timeout 으로 씀
+    assert raw.calls[0]["timeout"] == 30
+    # 이미 내려온 호출은 클라이언트의 LLM_TIMEOUT 을 그대로 씀
+    assert raw.calls[1]["timeout"] == 60
+    assert {d["reason"] for d in router.stats()["decisions"]} == {"preferred", "timeout"}
+
+
+def test_fastest_model_keeps_client_timeout_and_retries():
+    raw = ScriptedRaw(fast=[timeout_error(), "ok"])
+    router = router_for(raw)
+    assert create(router, model="fast") == "ok"
+    assert [call["timeout"] for call in raw.calls] == [60, 60]
+
+
+def test_fallback_timeout_is_raised():
+    raw = ScriptedRaw(slow=[timeout_error()], mid=[timeout_error()] * 3)
+    router = router_for(raw)
+    with pytest.raises(openai.APITimeoutError):
+        create(router)
+    # mid 는 클라이언트가 재시도까지 한 뒤에 올림 (fast 까지 내려가지 않음)
+    assert [call["model"] for call in raw.calls] == ["slow", "mid", "mid", "mid"]
+
+
+def test_caller_timeout_is_respected():
+    raw = ScriptedRaw(slow=[timeout_error()], mid=["ok"])
+    router = router_for(raw)
+    assert create(router, timeout=3) == "ok"
+    assert [call["timeout"] for call in raw.calls] == [3, 3]
+
+
+def test_other_errors_are_not_rerouted():
+    error = openai.APIStatusError("bad", response=httpx.Response(400, request=REQUEST), body=None)
+    raw = ScriptedRaw(slow=[error])
+    with pytest.raises(openai.APIStatusError):
+        create(router_for(raw))
+    assert len(raw.calls) == 1
+
+
+def test_slow_p95_routes_to_faster_model():
+    raw = ScriptedRaw(mid=["ok"])
+    router = router_for(raw)
+    router.tracker.observe("slow", 45)
+    assert create(router) == "ok"
+    assert raw.calls[0]["model"] == "mid"
+    assert router.choose("submit", "slow", 10) == ("mid", "slo")
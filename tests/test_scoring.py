@@ -0,0 +1,83 @@
+# interview/scoring.py: 배치 엔진(score_batch)과 calculate_final_scores 가 같은 결과를 내는지
+import random
+
+import pytest
+
+from interview.scoring import CRITERIA, WEIGHT_MAP, ScoreMatrix, calculate_final_scores, score_batch
+
+
+def random_interview(rng, questions):
+    question_weights = {str(i + 1): {c: rng.choice(list(WEIGHT_MAP)) for c in CRITERIA} for i in range(questions)}
+    answer_scores = {
+        str(i + 1): {c: rng.choice([rng.randint(0, 100), round(rng.uniform(0, 100), 1)]) for c in CRITERIA}
+        for i in range(questions)
+    }
+    return question_weights, answer_scores
+
+
+@pytest.fixture
+def interviews():
+    rng = random.Random(7)
+    return [random_interview(rng, rng.randint(1, 12)) for _ in range(300)]
+
+
+def test_score_batch_matches_single_interview_scoring(interviews):
+    assert score_batch(interviews) == [calculate_final_scores(qw, scores) for qw, scores in interviews]
+
+
+def test_score_batch_matches_with_custom_weights(interviews):
+    weights = {"high": 0.9, "med-high": 0.7, "med": 0.55, "low": 0.1}
+    assert score_batch(interviews, weights) == [
+        calculate_final_scores(qw, scores, weights) for qw, scores in interviews
+    ]
+
+
+def test_matrix_can_be_rescored_with_new_weights(interviews):
+    matrix = ScoreMatrix(interviews)
+    weights = dict(WEIGHT_MAP, low=0.2)
+    assert matrix.score() == score_batch(interviews)
+    assert matrix.score(weights) == [calculate_final_scores(qw, scores, weights) for qw, scores in interviews]
+
+
+def test_question_order_follows_the_dict_order():
+    question_weights = {"2": {c: "low" for c in CRITERIA}, "1": {c: "high" for c in CRITERIA}}
+    answer_scores = {"1": {c: 33.3 for c in CRITERIA}, "2": {c: 66.7 for c in CRITERIA}}
+    assert score_batch([(question_weights, answer_scores)]) == [calculate_final_scores(question_weights, answer_scores)]
+
+
+def test_empty_inputs():
+    assert score_batch([]) == []
+    with pytest.raises(ZeroDivisionError):
+        calculate_final_scores({}, {})
+    with pytest.raises(ZeroDivisionError):
+        score_batch([({}, {})])
+
+
+def test_string_scores_are_rejected_like_the_original():
+    question_weights = {"1": {c: "high" for c in CRITERIA}}
+    answer_scores = {"1": {c: "85" for c in CRITERIA}}
+    with pytest.raises(TypeError):
+        calculate_final_scores(question_weights, answer_scores)
+    with pytest.raises(TypeError):
+        score_batch([(question_weights, answer_scores)])
+
+
+def test_missing_scores_are_rejected_like_the_original():
+    question_weights = {"1": {c: "high" for c in CRITERIA}}
+    answer_scores = {"1": dict({c: 80 for c in CRITERIA}, 태도=None)}
+    with pytest.raises(TypeError):
+        calculate_final_scores(question_weights, answer_scores)
+    with pytest.raises(TypeError):
+        score_batch([(question_weights, answer_scores)])
+
+
+def test_zero_weight_total_raises_like_the_original(interviews):
+    weights = dict(WEIGHT_MAP, low=0.0)
+    question_weights = {"1": {c: "low" for c in CRITERIA}, "2": {c: "low" for c in CRITERIA}}
+    answer_scores = {"1": {c: 80 for c in CRITERIA}, "2": {c: 90 for c in CRITERIA}}
+    with pytest.raises(ZeroDivisionError):
+        calculate_final_scores(question_weights, answer_scores, weights)
+    with pytest.raises(ZeroDivisionError):
+        score_batch([(question_weights, answer_scores)], weights)
+    with pytest.raises(ZeroDivisionError):
+        ScoreMatrix(interviews).score(weights)
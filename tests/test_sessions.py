@@ -0,0 +1,77 @@
+# 서버 쪽 면접 세션 (interview/sessions.py) / POST /api/interview/submit 본문 검사 (interview/web/submit.py)
+import re
+
+import pytest
+
+from interview.scoring import CRITERIA
+from interview.sessions import SessionStore, new_interview_id
+from interview.web import create_app
+
+
+def llm(kwargs):
+    prompt = kwargs["messages"][-1]["content"]
+    if '"weights"' in prompt:
+        return {"weights": {c: "high" for c in CRITERIA}, "scores": {c: 70 for c in CRITERIA}}
+    if "analysisText" in prompt:
+        return {"analysisText": "총평"}
+    return {"questions": ["q1", "q2", "q3", "q4", "q5"]}
+
+
+@pytest.fixture
+def client(fake_client):
+    app = create_app("basic2")
+    app.extensions["interview"].router.raw = fake_client(llm)
+    return app.test_client()
+
+
+def test_interview_ids_are_opaque():
+    ids = {new_interview_id() for _ in range(100)}
+    assert len(ids) == 100
+    assert all(re.fullmatch(r"ses-[0-9a-f]{32}", interview_id) for interview_id in ids)
+
+
+def test_created_id_does_not_contain_the_job_title(client):
+    resp = client.post("/api/interview/create", data={"job_title": "백엔드 개발/../x", "question_source": "llm"})
+    interview_id = resp.get_json()["interviewId"]
+    assert re.fullmatch(r"ses-[0-9a-f]{32}", interview_id)
+
+
+def test_session_keeps_questions_and_answers(tmp_path):
+    store = SessionStore(str(tmp_path / "sessions.db"))
+    store.create("ses-1", "백엔드", "신입", ["q1", "q2"])
+    assert store.get("ses-1")["questions"] == ["q1", "q2"]
+    assert store.qna_list("ses-1", ["a1"]) == [{"question": "q1", "answer": "a1"}, {"question": "q2", "answer": ""}]
+    assert store.qna_list("ses-unknown") is None
+
+
+def test_submit_with_answers_only_uses_the_server_questions(client):
+    created = client.post("/api/interview/create", data={"job_title": "백엔드", "question_source": "llm"})
+    interview_id = created.get_json()["interviewId"]
+    resp = client.post("/api/interview/submit",
+                       json={"interviewId": interview_id, "answers": ["답변"] * 5, "evalMode": "per_question"})
+    assert resp.status_code == 200
+    assert resp.get_json()["radarScores"] == {c: 70 for c in CRITERIA}
+
+
+def test_submit_for_unknown_session_is_404(client):
+    resp = client.post("/api/interview/submit", json={"interviewId": "ses-unknown", "answers": ["답변"]})
+    assert resp.status_code == 404
+
+
+@pytest.mark.parametrize("body", [
+    None,
+    [],
+    "text",
+    {"interviewId": 3, "answers": ["답변"]},
+    {"interviewId": "ses-1", "answers": [None]},
+    {"interviewId": "ses-1", "answers": [1, 2]},
+    {"interviewId": "ses-1", "answers": "답변"},
+    {"qnaList": [{"question": "q", "answer": None}]},
+    {"qnaList": [{"question": 1, "answer": "a"}]},
+    {"qnaList": ["q"]},
+    {"qnaList": {"question": "q", "answer": "a"}},
+])
+def test_malformed_submit_is_400(client, body):
+    resp = client.post("/api/interview/submit", json=body)
+    assert resp.status_code == 400
+    assert "error" in resp.get_json()
@@ -0,0 +1,121 @@
+# interview/similarity.py: 비슷한 답변 재사용 캐시 / run_evaluation 의 캐시 사용 (interview/evaluation.py)
+import pytest
+
+from interview import evaluation, similarity
+from interview.scoring import CRITERIA
+from interview.similarity import AnswerSimilarityCache, shingles
+
+ANSWER = "저는 지난 프로젝트에서 결제 서버의 응답 시간을 절반으로 줄였습니다. 캐시와 쿼리 튜닝을 적용했습니다."
+
+
+def result(score):
+    return {"weights": {c: "high" for c in CRITERIA}, "scores": {c: score for c in CRITERIA},
+            "goodPoints": ["좋음"], "improvementPoints": []}
+
+
+def test_shingles_ignore_case_spaces_and_punctuation():
+    assert shingles("A b, C!") == shingles("abc") == {"abc"}
+    assert shingles("  ") == set()
+
+
+def test_near_duplicate_answer_is_reused():
+    cache = AnswerSimilarityCache(threshold=0.8)
+    cache.put("evaluation", "질문", ANSWER, {**result(80), "cache": {"hit": True}})
+    hit = cache.get("evaluation", " 질문 ", ANSWER.replace(".", "!"))
+    assert hit["scores"] == result(80)["scores"]
+    assert hit["cache"]["hit"] is True
+    assert hit["cache"]["similarity"] >= 0.8
+    assert cache.stats()["hits"] == 1
+
+
+def test_different_answer_question_or_namespace_misses():
+    cache = AnswerSimilarityCache(threshold=0.8)
+    cache.put("evaluation", "질문", ANSWER, result(80))
+    assert cache.get("evaluation", "질문", "전혀 다른 내용의 답변으로 데이터 분석 경험을 이야기합니다.") is None
+    assert cache.get("evaluation", "다른 질문", ANSWER) is None
+    assert cache.get("analysis", "질문", ANSWER) is None
+    assert cache.get("evaluation", "질문", "") is None
+
+
+def test_oldest_entries_are_evicted():
+    cache = AnswerSimilarityCache(max_entries=2, threshold=0.8)
+    for i in range(3):
+        cache.put("evaluation", f"질문{i}", ANSWER, result(i))
+    assert cache.get("evaluation", "질문0", ANSWER) is None
+    assert cache.get("evaluation", "질문2", ANSWER)["scores"]["직무"] == 2
+    assert cache.stats()["entries"] == 2
+
+
+def test_bands_must_divide_permutations():
+    with pytest.raises(ValueError):
+        AnswerSimilarityCache(permutations=64, bands=10)
+
+
+# -------------------------
+# run_evaluation (single 모드)
+# -------------------------
+QNA = [{"question": f"질문 {i}", "answer": f"{ANSWER} 답변 {i}번"} for i in range(4)]
+
+
+def llm(kwargs):
+    prompt = kwargs["messages"][-1]["content"]
+    if "analysisText" in prompt and "questionWeights" not in prompt:
+        return {"analysisText": "전체 총평"}
+    if '"weights"' in prompt:
+        return result(60)
+    count = prompt.count("\nA: ")
+    return {
+        "questionWeights": {str(i + 1): {c: "high" for c in CRITERIA} for i in range(count)},
+        "answerScores": {str(i + 1): {c: 70 for c in CRITERIA} for i in range(count)},
+        "analysisText": "일부 총평",
+        "questions": [{"id": i + 1, "goodPoints": [], "improvementPoints": []} for i in range(count)],
+    }
+
+
+@pytest.fixture
+def cache(monkeypatch):
+    cache = AnswerSimilarityCache(threshold=0.8)
+    monkeypatch.setattr(similarity, "answer_cache", cache)
+    return cache
+
+
+def kinds(client):
+    kinds = []
+    for call in client.completions.calls:
+        prompt = call["messages"][-1]["content"]
+        kinds.append("all" if "questionWeights" in prompt else "question" if '"weights"' in prompt else "summary")
+    return sorted(kinds)
+
+
+def test_single_mode_without_hits_evaluates_all_at_once(cache, fake_client):
+    client = fake_client(llm)
+    report = evaluation.run_evaluation(client, "m", QNA, "single", wire="full")
+    assert kinds(client) == ["all"]
+    assert report["radarScores"] == {c: 70 for c in CRITERIA}
+    # 다음 제출에 쓰도록 질문별 결과를 기억
+    assert cache.stats()["entries"] == 4
+
+
+def test_single_mode_with_one_miss_evaluates_it_alone(cache, fake_client):
+    for item in QNA[:3]:
+        cache.put("evaluation", item["question"], item["answer"], result(90))
+    client = fake_client(llm)
+    report = evaluation.run_evaluation(client, "m", QNA, "single", wire="full")
+    assert kinds(client) == ["question", "summary"]
+    assert [q.get("cache", {}).get("hit") for q in report["questions"]] == [True, True, True, None]
+
+
+def test_single_mode_with_several_misses_evaluates_them_at_once(cache, fake_client):
+    cache.put("evaluation", QNA[1]["question"], QNA[1]["answer"], result(90))
+    client = fake_client(llm)
+    report = evaluation.run_evaluation(client, "m", QNA, "single", wire="full")
+    # 남은 질문 3개를 질문마다 부르지 않고 한 번에 평가 + 전체 총평
+    assert kinds(client) == ["all", "summary"]
+    all_prompt = next(call["messages"][-1]["content"] for call in client.completions.calls
+                      if "questionWeights" in call["messages"][-1]["content"])
+    assert QNA[1]["question"] not in all_prompt
+    assert report["analysisText"] == "전체 총평"
+    assert [q["title"] for q in report["questions"]] == [item["question"] for item in QNA]
+    assert [q.get("cache", {}).get("hit") for q in report["questions"]] == [None, True, None, None]
+    # 질문 2 만 90점, 나머지는 70점
+    assert report["radarScores"]["직무"] == 75.0
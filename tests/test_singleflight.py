@@ -0,0 +1,144 @@
+# interview/singleflight.py: 같은 요청 합치기 (프로세스 안 / SQLite 로 프로세스 사이)
+import threading
+import time
+
+import pytest
+
+from interview.singleflight import SingleFlight, SingleFlightError, payload_key
+
+
+def run_together(count, target):
+    results = [None] * count
+    errors = [None] * count
+
+    def worker(i):
+        try:
+            results[i] = target()
+        except Exception as e:
+            errors[i] = e
+
+    threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join(10)
+    return results, errors
+
+
+def test_payload_key_ignores_dict_order():
+    assert payload_key({"a": 1, "b": [1, 2]}) == payload_key({"b": [1, 2], "a": 1})
+    assert payload_key({"a": 1}) != payload_key({"a": 2})
+
+
+def test_concurrent_calls_share_one_execution():
+    group = SingleFlight()
+    calls = []
+
+    def evaluate():
+        calls.append(1)
+        time.sleep(0.2)
+        return {"score": 80}
+
+    results, errors = run_together(5, lambda: group.do("submit", "k", evaluate))
+    assert errors == [None] * 5
+    assert len(calls) == 1
+    assert [result for result, _ in results] == [{"score": 80}] * 5
+    assert sorted(shared for _, shared in results) == [False, True, True, True, True]
+
+
+def test_different_keys_do_not_wait_for_each_other():
+    group = SingleFlight()
+    calls = []
+    results, _ = run_together(3, lambda: group.do("submit", f"k{len(calls)}-{threading.get_ident()}",
+                                                  lambda: calls.append(1) or len(calls)))
+    assert len(calls) == 3
+
+
+def test_leader_error_is_shared_with_local_followers():
+    group = SingleFlight()
+
+    def fail():
+        time.sleep(0.2)
+        raise ValueError("평가 실패")
+
+    _, errors = run_together(3, lambda: group.do("submit", "k", fail))
+    assert all(isinstance(e, ValueError) for e in errors)
+    # 끝난 뒤의 요청은 새로 시도
+    assert group.do("submit", "k", lambda: "ok") == ("ok", False)
+
+
+def test_abandoned_flight_is_taken_over_by_a_waiter():
+    group = SingleFlight()
+    leader = group.begin("create", "k")
+    assert leader.leader
+    taken_over = []
+
+    def follower():
+        flight = group.begin("create", "k")
+        taken_over.append(flight.leader)
+        flight.finish(["q"])
+
+    thread = threading.Thread(target=follower)
+    thread.start()
+    time.sleep(0.05)
+    leader.abandon()
+    thread.join(5)
+    assert taken_over == [True]
+
+
+def test_sqlite_coalesces_across_instances(tmp_path):
+    path = str(tmp_path / "flights.db")
+    first, second = SingleFlight(path, result_ttl=10), SingleFlight(path, result_ttl=10)
+    flight = first.begin("submit", "k")
+    assert flight.leader
+
+    seen = []
+    thread = threading.Thread(target=lambda: seen.append(second.begin("submit", "k")))
+    thread.start()
+    time.sleep(0.1)
+    flight.finish({"score": 1})
+    thread.join(5)
+    assert not seen[0].leader
+    assert seen[0].result == {"score": 1}
+
+    # 끝난 결과는 result_ttl 동안 같은 요청에 그대로 돌려줌
+    again = second.begin("submit", "k")
+    assert (again.leader, again.result) == (False, {"score": 1})
+
+
+def test_sqlite_remote_failure_is_reported(tmp_path):
+    path = str(tmp_path / "flights.db")
+    first, second = SingleFlight(path), SingleFlight(path)
+    flight = first.begin("submit", "k")
+    errors = []
+
+    def follower():
+        try:
+            second.begin("submit", "k")
+        except SingleFlightError as e:
+            errors.append(str(e))
+
+    thread = threading.Thread(target=follower)
+    thread.start()
+    time.sleep(0.1)
+    flight.fail(ValueError("평가 실패"))
+    thread.join(5)
+    assert errors == ["평가 실패"]
+
+
+def test_expired_lease_is_taken_over(tmp_path):
+    path = str(tmp_path / "flights.db")
+    first, second = SingleFlight(path, lease=0.1), SingleFlight(path, lease=0.1)
+    assert first.begin("submit", "k").leader      # 끝내지 않고 멈춘 leader
+    time.sleep(0.2)
+    assert second.begin("submit", "k").leader
+
+
+@pytest.mark.parametrize("path", [None, "file"])
+def test_timeout_while_leader_runs(tmp_path, path):
+    path = str(tmp_path / "flights.db") if path else None
+    group = SingleFlight(path)
+    group.begin("submit", "k")
+    other = SingleFlight(path) if path else group
+    with pytest.raises(SingleFlightError):
+        other.begin("submit", "k", timeout=0.1)
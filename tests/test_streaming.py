@@ -0,0 +1,89 @@
+# interview/streaming.py: 질문 배열 증분 디코더 / SSE 질문 스트림
+import json
+
+from interview.streaming import QuestionStreamDecoder, stream_questions
+
+
+def feed_all(decoder, text, size):
+    found = []
+    for i in range(0, len(text), size):
+        found.append(decoder.feed(text[i:i + size]))
+    return found
+
+
+def test_decoder_emits_each_question_as_soon_as_it_closes():
+    decoder = QuestionStreamDecoder()
+    assert decoder.feed('{"questions": ["자기') == []
+    assert decoder.feed('소개 해주세요", "지원') == ["자기소개 해주세요"]
+    assert decoder.feed(' 동기는?"') == ["지원 동기는?"]
+    assert not decoder.done
+    assert decoder.feed("]}") == []
+    assert decoder.done
+    assert decoder.questions == ["자기소개 해주세요", "지원 동기는?"]
+
+
+def test_decoder_handles_any_chunk_boundary():
+    questions = ['따옴표 "인용" 질문', "역슬래시 \\ 와 줄바꿈\n질문", "  공백  ", "유니코드 ✓"]
+    text = "설명문 " + json.dumps({"note": "x", "questions": questions}, ensure_ascii=False) + " 끝"
+    for size in (1, 2, 3, 7, len(text)):
+        decoder = QuestionStreamDecoder()
+        found = [q for part in feed_all(decoder, text, size) for q in part]
+        # 앞뒤 공백은 지우고 빈 질문은 건너뜀, 원래 순서 그대로
+        assert found == ['따옴표 "인용" 질문', "역슬래시 \\ 와 줄바꿈\n질문", "공백", "유니코드 ✓"]
+        assert decoder.done
+
+
+def test_decoder_ignores_everything_after_the_array():
+    decoder = QuestionStreamDecoder()
+    decoder.feed('{"questions": ["a"], "questions": ["b"]}')
+    assert decoder.questions == ["a"]
+    assert decoder.feed('"c"') == []
+
+
+def test_decoder_finds_key_split_across_chunks():
+    decoder = QuestionStreamDecoder()
+    assert decoder.feed('{"ques') == []
+    assert decoder.feed('tions" :  [ "q1"') == ["q1"]
+
+
+def events(lines):
+    parsed = []
+    for block in "".join(lines).strip().split("\n\n"):
+        event, data = block.split("\n")
+        parsed.append((event[len("event: "):], json.loads(data[len("data: "):])))
+    return parsed
+
+
+def test_stream_questions_sends_each_question_then_done(fake_client):
+    client = fake_client({"questions": ["Q1", "Q2"]})
+    completed = []
+    out = events(stream_questions(client, "m", "prompt", "ses-1", on_complete=completed.append))
+    assert out == [
+        ("question", {"index": 0, "question": "Q1"}),
+        ("question", {"index": 1, "question": "Q2"}),
+        ("done", {"questions": ["Q1", "Q2"], "interviewId": "ses-1"}),
+    ]
+    assert completed == [["Q1", "Q2"]]
+    assert client.completions.calls[0]["stream"] is True
+
+
+def test_stream_questions_reports_unparseable_output(fake_client):
+    out = events(stream_questions(fake_client("질문을 만들 수 없습니다."), "m", "prompt", "ses-1"))
+    assert out[-1][0] == "error"
+
+
+def test_stream_questions_numbers_after_prefix_and_trims_to_limit(fake_client):
+    client = fake_client({"questions": ["L1", "L2", "L3", "L4"]})
+    completed = []
+    out = events(stream_questions(client, "m", "prompt", "ses-1", on_complete=completed.append,
+                                  prefix=["B1"], limit=2))
+    assert out == [
+        ("question", {"index": 0, "question": "B1"}),
+        ("question", {"index": 1, "question": "L1"}),
+        ("question", {"index": 2, "question": "L2"}),
+        ("done", {"questions": ["B1", "L1", "L2"], "interviewId": "ses-1"}),
+    ]
+    assert completed == [["B1", "L1", "L2"]]
+    assert client.completions.calls[0]["stream"] is True
+
+
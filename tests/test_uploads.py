@@ -0,0 +1,98 @@
+# interview/uploads.py: 업로드 형식 판별(magic bytes) / 크기 제한, POST /api/interview/create 의 오류 응답
+import io
+import os
+
+import pytest
+
+from bench.resumes import make_resume, resume_text
+from interview import uploads
+from interview.uploads import FileTooLarge, MislabeledFile, check_upload, sniff_type
+from interview.web import create_app
+
+PDF = make_resume("pdf", "small", 1)[1]
+DOCX = make_resume("docx", "small", 2)[1]
+TXT = resume_text("small", 3).encode("utf-8")
+
+
+@pytest.mark.parametrize("data, kind", [
+    (PDF, "pdf"),
+    (DOCX, "docx"),
+    (TXT, "txt"),
+    (b"PK\x03\x04" + b"garbage" * 10, None),     # zip 처럼 시작하지만 docx 가 아님
+    (b"\x00\x01\x02binary", None),
+    ("가".encode("utf-8") * 2000, "txt"),          # 앞부분을 자른 곳에서 글자가 끊겨도 txt
+], ids=["pdf", "docx", "txt", "zip", "binary", "cut-utf8"])
+def test_sniff_type_reads_magic_bytes(data, kind):
+    stream = io.BytesIO(data)
+    stream.seek(5)
+    assert sniff_type(stream) == kind
+    assert stream.tell() == 0
+
+
+@pytest.mark.parametrize("data, extension, detected", [
+    (DOCX, "pdf", "docx"),
+    (PDF, "txt", "pdf"),
+    (TXT, "pdf", "txt"),
+    (b"PK\x03\x04" + b"garbage" * 10, "docx", None),
+    (os.urandom(64) + b"\x00", "txt", None),
+], ids=["docx-as-pdf", "pdf-as-txt", "txt-as-pdf", "zip-as-docx", "binary-as-txt"])
+def test_mislabeled_files_are_rejected(data, extension, detected):
+    with pytest.raises(MislabeledFile) as rejected:
+        check_upload(io.BytesIO(data), extension)
+    assert rejected.value.detected == detected
+
+
+def test_file_over_the_limit_is_rejected(monkeypatch):
+    monkeypatch.setattr(uploads, "UPLOAD_MAX_BYTES", 100)
+    with pytest.raises(FileTooLarge):
+        check_upload(io.BytesIO(b"a" * 101), "txt")
+    assert check_upload(io.BytesIO(b"a" * 100), "txt") == "txt"
+
+
+# -------------------------
+# POST /api/interview/create
+# -------------------------
+@pytest.fixture
+def client(fake_client):
+    app = create_app("basic2")
+    fake = fake_client({"questions": ["q1", "q2", "q3", "q4", "q5"]})
+    app.extensions["interview"].router.raw = fake
+    client = app.test_client()
+    client.llm_calls = fake.completions.calls
+    return client
+
+
+def upload(client, name, data):
+    return client.post("/api/interview/create", content_type="multipart/form-data", data={
+        "job_title": "백엔드", "question_source": "llm", "resume_file": (io.BytesIO(data), name)})
+
+
+@pytest.mark.parametrize("name, data", [("resume.pdf", PDF), ("resume.docx", DOCX), ("resume.txt", TXT)],
+                         ids=["pdf", "docx", "txt"])
+def test_matching_uploads_are_parsed(client, name, data):
+    resp = upload(client, name, data)
+    assert resp.status_code == 200
+    assert resp.get_json()["questions"] == ["q1", "q2", "q3", "q4", "q5"]
+
+
+@pytest.mark.parametrize("name, data", [
+    ("resume.pdf", DOCX),
+    ("resume.docx", b"PK\x03\x04" + b"garbage" * 10),
+    ("resume.txt", b"\x00\xff" * 100),
+], ids=["docx-as-pdf", "zip-as-docx", "binary-as-txt"])
+def test_mislabeled_upload_is_400_without_llm_calls(client, name, data):
+    resp = upload(client, name, data)
+    assert resp.status_code == 400
+    assert "파일 형식 불일치" in resp.get_json()["error"]
+    assert client.llm_calls == []
+
+
+def test_unsupported_extension_is_400(client):
+    assert upload(client, "resume.hwp", TXT).status_code == 400
+
+
+def test_large_upload_is_413(client, monkeypatch):
+    monkeypatch.setattr(uploads, "UPLOAD_MAX_BYTES", 1000)
+    resp = upload(client, "resume.txt", b"a" * 2000)
+    assert resp.status_code == 413
+    assert client.llm_calls == []